@@ -1,13 +1,28 @@
 from django.conf import settings
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from rest_framework.routers import SimpleRouter
 
+from dejavue.events.api.views import AutocompleteView
+from dejavue.events.api.views import HistoricalEntityViewSet
+from dejavue.events.api.views import HistoricalEventViewSet
+from dejavue.events.api.views import ImpactLookupView
+from dejavue.events.api.views import TimelineViewSet
+from dejavue.timeline.api.views import WhatIfScenarioViewSet
 from dejavue.users.api.views import UserViewSet
 
 router = DefaultRouter() if settings.DEBUG else SimpleRouter()
 
 router.register("users", UserViewSet)
+router.register("events", HistoricalEventViewSet)
+router.register("timelines", TimelineViewSet)
+router.register("entities", HistoricalEntityViewSet)
+router.register("scenarios", WhatIfScenarioViewSet)
 
 
 app_name = "api"
-urlpatterns = router.urls
+urlpatterns = [
+    *router.urls,
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
+    path("impacts/at/", ImpactLookupView.as_view(), name="impact-lookup"),
+]
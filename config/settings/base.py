@@ -75,6 +75,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -305,6 +306,33 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-schedule
+CELERY_BEAT_SCHEDULE = {
+    "refresh-connection-graph": {
+        "task": "dejavue.events.tasks.refresh_connection_graph",
+        "schedule": 5 * 60,
+    },
+    "score-historical-entities": {
+        "task": "dejavue.events.tasks.score_historical_entities",
+        "schedule": 60 * 60,
+    },
+    "precompute-cluster-tiles": {
+        "task": "dejavue.events.tasks.precompute_cluster_tiles",
+        "schedule": 10 * 60,
+    },
+    "simplify-impact-geometries": {
+        "task": "dejavue.events.tasks.simplify_impact_geometries",
+        "schedule": 24 * 60 * 60,
+    },
+    "recompute-impact-footprints": {
+        "task": "dejavue.events.tasks.recompute_impact_footprints",
+        "schedule": 5 * 60,
+    },
+    "rebalance-timelines": {
+        "task": "dejavue.events.tasks.rebalance_timelines",
+        "schedule": 60 * 60,
+    },
+}
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
 CELERY_WORKER_SEND_TASK_EVENTS = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
@@ -357,3 +385,6 @@ SPECTACULAR_SETTINGS = {
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Memory-mapped HistoricalConnection graph snapshots, shared by the workers on
+# a host; see dejavue.events.graph.
+GRAPH_SNAPSHOT_DIR = env("DJANGO_GRAPH_SNAPSHOT_DIR", default=str(BASE_DIR / ".graph"))
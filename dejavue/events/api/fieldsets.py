@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
+
+
+def _split(value):
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+@dataclass(frozen=True)
+class Fieldset:
+    """
+    Fields and expanded relations requested through ``?fields=`` / ``?expand=``.
+
+    Without either parameter every field is returned with every relation
+    expanded. Otherwise only the listed fields are returned, and relations
+    not named in ``expand`` are rendered as primary keys.
+    """
+
+    fields: frozenset[str]
+    expand: frozenset[str]
+    collapse: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_request(cls, request, serializer_class):
+        declared = set(serializer_class.Meta.fields)
+        expandable = set(serializer_class.expandable_fields)
+        fields = _split(request.query_params.get("fields"))
+        expand = _split(request.query_params.get("expand"))
+
+        errors = {}
+        if fields and fields - declared:
+            errors["fields"] = [f"Unknown field: {name}" for name in fields - declared]
+        if expand and expand - expandable:
+            errors["expand"] = [
+                f"Cannot expand: {name}" for name in expand - expandable
+            ]
+        if errors:
+            raise ValidationError(errors)
+
+        if fields is None and expand is None:
+            return cls(frozenset(declared), frozenset(expandable))
+        expand = expand or set()
+        fields = declared if fields is None else fields | expand
+        collapse = (fields & expandable) - expand
+        return cls(frozenset(fields), frozenset(expand), frozenset(collapse))
+
+    def apply(self, queryset, *, required=("id",)):
+        """
+        Project ``queryset`` onto the requested fields.
+
+        Only the columns behind requested fields (plus ``required``) are
+        loaded. Expanded foreign keys are joined, collapsed ones read from
+        their ``*_id`` column. Many-to-many relations that were not requested
+        are not prefetched at all; collapsed ones only fetch primary keys.
+        """
+        opts = queryset.model._meta  # noqa: SLF001
+        columns = set(required)
+        joins = []
+        prefetches: list[str | Prefetch] = []
+        for name in sorted(self.fields):
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue  # computed, e.g. ``url``
+            if field.many_to_many:
+                if name in self.collapse:
+                    model = field.related_model
+                    assert model is not None  # type guard
+                    assert not isinstance(model, str)  # type guard
+                    related = model._default_manager.only("pk")  # noqa: SLF001
+                    prefetches.append(Prefetch(name, queryset=related))
+                else:
+                    prefetches.append(name)
+            elif field.concrete:
+                columns.add(name)
+                if field.many_to_one and name not in self.collapse:
+                    joins.append(name)
+        return (
+            queryset.only(*columns).select_related(*joins).prefetch_related(*prefetches)
+        )
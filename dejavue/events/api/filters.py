@@ -0,0 +1,174 @@
+from django.contrib.contenttypes.models import ContentType
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from taggit.models import TaggedItem
+
+from dejavue.events.geo import MAX_RADIUS
+from dejavue.events.geo import parse_bbox
+from dejavue.events.geo import parse_point
+from dejavue.events.models import HistoricalEvent
+
+LIST_PARAMS = ("era", "category", "categories", "tags", "impact_level")
+SPATIAL_PARAMS = ("bbox", "near", "radius")
+FILTER_PARAMS = ("from", "to", *LIST_PARAMS)
+DEFAULT_RADIUS = 50_000
+
+
+def _date_param(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        date = parse_date(value)
+    except ValueError:
+        date = None
+    if date is None:
+        raise ValidationError({name: "Enter a date as YYYY-MM-DD."})
+    return date
+
+
+def _list_param(request, name):
+    return sorted(
+        {
+            value.strip()
+            for raw in request.query_params.getlist(name)
+            for value in raw.split(",")
+            if value.strip()
+        },
+    )
+
+
+def _int_list_param(request, name):
+    try:
+        return [int(value) for value in _list_param(request, name)]
+    except ValueError as exc:
+        raise ValidationError({name: "Enter a comma-separated list of ids."}) from exc
+
+
+def _geo_param(request, name, parse, message):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        return parse(value)
+    except ValueError as exc:
+        raise ValidationError({name: message}) from exc
+
+
+def point_param(request, name):
+    return _geo_param(request, name, parse_point, "Enter a point as lon,lat.")
+
+
+def bbox_param(request):
+    return _geo_param(
+        request,
+        "bbox",
+        parse_bbox,
+        "Enter a bounding box as west,south,east,north.",
+    )
+
+
+def radius_param(request):
+    radius = _geo_param(
+        request,
+        "radius",
+        float,
+        "Enter a radius in meters.",
+    )
+    return min(max(radius or DEFAULT_RADIUS, 0), MAX_RADIUS)
+
+
+def filter_key(request, *, spatial=True):
+    """
+    The filter parameters of ``request`` in a canonical form, so requests
+    that select the same events share cache entries. ``spatial=False``
+    leaves out the area parameters, for views that apply them themselves.
+    """
+    key = {
+        name: _list_param(request, name)
+        for name in FILTER_PARAMS
+        if _list_param(request, name)
+    }
+    # Coordinates are positional, so they are kept as given.
+    key.update(
+        {
+            name: request.query_params[name]
+            for name in SPATIAL_PARAMS
+            if spatial and request.query_params.get(name)
+        },
+    )
+    return key
+
+
+class HistoricalEventFilter(BaseFilterBackend):
+    """
+    ``?from=`` / ``?to=`` keep events active at some point in that window;
+    either bound may be left open. ``?era=``, ``?category=``,
+    ``?categories=`` and ``?impact_level=`` take comma-separated ids or
+    values, ``?tags=`` tag names; an event matches when it has any of them.
+    ``?bbox=west,south,east,north`` and ``?near=lon,lat`` (with ``?radius=``
+    in meters) keep events whose location is in that area, unless the
+    view sets ``spatial_filter`` to False.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        start = _date_param(request, "from")
+        end = _date_param(request, "to")
+        if start or end:
+            queryset = queryset.overlapping(start, end)
+
+        if era := _int_list_param(request, "era"):
+            queryset = queryset.filter(era__in=era)
+        if category := _int_list_param(request, "category"):
+            queryset = queryset.filter(category__in=category)
+        if impact_level := _int_list_param(request, "impact_level"):
+            queryset = queryset.filter(impact_level__in=impact_level)
+        # Many-to-many filters go through subqueries so rows are not repeated.
+        if categories := _int_list_param(request, "categories"):
+            through = HistoricalEvent.categories.through
+            queryset = queryset.filter(
+                pk__in=through.objects.filter(category__in=categories).values(
+                    "historicalevent_id",
+                ),
+            )
+        if tags := _list_param(request, "tags"):
+            queryset = queryset.filter(
+                pk__in=TaggedItem.objects.filter(
+                    content_type=ContentType.objects.get_for_model(HistoricalEvent),
+                    tag__name__in=tags,
+                ).values("object_id"),
+            )
+
+        if not getattr(view, "spatial_filter", True):
+            return queryset
+        if bbox := bbox_param(request):
+            queryset = queryset.in_bbox(bbox)
+        if near := point_param(request, "near"):
+            queryset = queryset.within(near, radius_param(request))
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        dates = [
+            ("from", "Only events still active on or after this date.", "date"),
+            ("to", "Only events already started on or before this date.", "date"),
+        ]
+        lists = [
+            (name, f"Comma-separated {name} to match any of.", None)
+            for name in LIST_PARAMS
+        ]
+        spatial = [
+            ("bbox", "Only events located in west,south,east,north.", None),
+            ("near", "Only events located within radius of lon,lat.", None),
+            ("radius", f"Meters around near (default {DEFAULT_RADIUS}).", None),
+        ]
+        return [
+            {
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": description,
+                "schema": {"type": "string", **({"format": fmt} if fmt else {})},
+            }
+            for name, description, fmt in dates + lists + spatial
+        ]
@@ -0,0 +1,162 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class Row(models.Func):
+    """A row constructor, e.g. ``ROW(start_date, id)``.
+
+    Postgres compares rows lexicographically and can answer
+    ``ROW(a, b) > ROW(x, y)`` with a single range scan on an ``(a, b)`` index.
+    """
+
+    function = "ROW"
+    output_field = models.Field()
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on a unique tuple of columns.
+
+    Unlike ``CursorPagination``, which encodes the first ordering column plus
+    an offset, the cursor here holds the full key of the boundary row. Each
+    page is a ``(key) > (cursor)`` range scan on a matching composite index,
+    so page 10,000 costs the same as page 1.
+
+    The ordering comes from ``view.keyset_ordering`` (falling back to
+    ``ordering``); its last column must be unique, and every column must sort
+    in the same direction.
+    """
+
+    ordering: tuple[str, ...] = ("id",)
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.fields = self.get_ordering(view)
+        self.descending = self.fields[0].startswith("-")
+        names = [field.lstrip("-") for field in self.fields]
+
+        key, reverse = self.decode_cursor(request, queryset.model, names)
+        backwards = reverse != self.descending
+        queryset = queryset.order_by(
+            *(f"-{name}" if backwards else name for name in names),
+        )
+        if key is not None:
+            lookup = "_keyset__lt" if backwards else "_keyset__gt"
+            queryset = queryset.alias(
+                _keyset=Row(*(models.F(name) for name in names)),
+            ).filter(**{lookup: Row(*(models.Value(value) for value in key))})
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        del results[self.page_size :]
+        if reverse:
+            results.reverse()
+
+        self.has_next = has_more if not reverse else key is not None
+        self.has_previous = has_more if reverse else key is not None
+        self.first_key = self.get_key(results[0], names) if results else key
+        self.last_key = self.get_key(results[-1], names) if results else key
+        return results
+
+    def get_ordering(self, view):
+        ordering = getattr(view, "keyset_ordering", None) or self.ordering
+        directions = {field.startswith("-") for field in ordering}
+        assert len(directions) == 1, "Keyset columns must share one direction."
+        return tuple(ordering)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_key(self, obj, names):
+        return [getattr(obj, name) for name in names]
+
+    def decode_cursor(self, request, model, names):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            values, reverse = payload["k"], bool(payload.get("r"))
+            if len(values) != len(names):
+                raise ValueError(self.invalid_cursor_message)  # noqa: TRY301
+            key = [
+                model._meta.get_field(name).to_python(value)  # noqa: SLF001
+                for name, value in zip(names, values, strict=True)
+            ]
+        except (
+            binascii.Error,
+            KeyError,
+            TypeError,
+            UnicodeError,
+            ValueError,
+            ValidationError,
+        ) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        return key, reverse
+
+    def encode_cursor(self, key, *, reverse):
+        payload = json.dumps(
+            {"k": key, "r": int(reverse)},
+            default=str,
+            separators=(",", ":"),
+        )
+        encoded = base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.last_key, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(self.first_key, reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class SearchPagination(PageNumberPagination):
+    """Ranked results are ordered by score, so they are paged by number."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
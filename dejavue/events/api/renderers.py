@@ -0,0 +1,29 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline-delimited JSON; streamed responses bypass it entirely."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return (json.dumps(data) + "\n").encode(self.charset)
+
+
+class MVTRenderer(BaseRenderer):
+    """Mapbox vector tiles, already encoded by the database."""
+
+    media_type = "application/vnd.mapbox-vector-tile"
+    format = "mvt"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Error responses carry a dict; a tile client has no use for it.
+        return data if isinstance(data, bytes) else b""
@@ -0,0 +1,274 @@
+from rest_framework import serializers
+from taggit.models import Tag
+
+from dejavue.events.models import Category
+from dejavue.events.models import ConsequenceRollup
+from dejavue.events.models import Era
+from dejavue.events.models import EventCategory
+from dejavue.events.models import EventImpactFootprint
+from dejavue.events.models import GeopoliticalImpact
+from dejavue.events.models import HistoricalEntity
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.models import HistoricalFigure
+from dejavue.events.models import Location
+from dejavue.events.models import Timeline
+from dejavue.events.models import TimelineEvent
+from dejavue.events.ordering import MAX_MOVES as MAX_TIMELINE_MOVES
+
+
+class EraSerializer(serializers.ModelSerializer[Era]):
+    class Meta:
+        model = Era
+        fields = ["id", "name", "slug", "start_year", "end_year"]
+
+
+class EventCategorySerializer(serializers.ModelSerializer[EventCategory]):
+    class Meta:
+        model = EventCategory
+        fields = ["id", "name"]
+
+
+class CategorySerializer(serializers.ModelSerializer[Category]):
+    class Meta:
+        model = Category
+        fields = ["id", "name"]
+
+
+class LocationSerializer(serializers.ModelSerializer[Location]):
+    class Meta:
+        model = Location
+        fields = ["id", "name", "modern_name", "country", "latitude", "longitude"]
+
+
+class HistoricalFigureSerializer(serializers.ModelSerializer[HistoricalFigure]):
+    class Meta:
+        model = HistoricalFigure
+        fields = ["id", "name", "birth_date", "death_date"]
+
+
+class HistoricalEventSerializer(serializers.ModelSerializer[HistoricalEvent]):
+    era = EraSerializer(read_only=True)
+    category = EventCategorySerializer(read_only=True)
+    location = LocationSerializer(read_only=True)
+    categories = CategorySerializer(many=True, read_only=True)
+    key_figures = HistoricalFigureSerializer(many=True, read_only=True)
+    tags = serializers.SlugRelatedField[Tag](
+        many=True,
+        read_only=True,
+        slug_field="name",
+    )
+
+    expandable_fields = ("era", "category", "location", "categories", "key_figures")
+
+    class Meta:
+        model = HistoricalEvent
+        fields = [
+            "id",
+            "url",
+            "name",
+            "title",
+            "date",
+            "start_date",
+            "end_date",
+            "description",
+            "impact_level",
+            "significance_rating",
+            "sources",
+            "era",
+            "category",
+            "location",
+            "categories",
+            "key_figures",
+            "tags",
+            "consequence_count",
+            "consequence_impact_avg",
+            "consequence_impact_max",
+            "created_at",
+            "updated_at",
+        ]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:historicalevent-detail", "lookup_field": "pk"},
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fieldset = self.context.get("fieldset")
+        if fieldset is None:
+            return
+        for name in set(self.fields) - fieldset.fields:
+            self.fields.pop(name)
+        for name in fieldset.collapse:
+            many = isinstance(self.fields[name], serializers.ListSerializer)
+            self.fields[name] = serializers.PrimaryKeyRelatedField(
+                read_only=True,
+                many=many,
+            )
+
+
+class NearbyEventSerializer(serializers.ModelSerializer[HistoricalEvent]):
+    location = LocationSerializer(read_only=True)
+    distance = serializers.FloatField(source="distance.m", read_only=True)
+
+    class Meta:
+        model = HistoricalEvent
+        fields = [
+            "id",
+            "url",
+            "name",
+            "start_date",
+            "end_date",
+            "significance_rating",
+            "location",
+            "distance",
+        ]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:historicalevent-detail", "lookup_field": "pk"},
+        }
+
+
+class ConsequenceRollupSerializer(serializers.ModelSerializer[ConsequenceRollup]):
+    class Meta:
+        model = ConsequenceRollup
+        fields = ["timeframe", "count", "impact_avg", "impact_max"]
+
+
+class EventImpactFootprintSerializer(
+    serializers.ModelSerializer[EventImpactFootprint],
+):
+    class Meta:
+        model = EventImpactFootprint
+        fields = [
+            "area",
+            "affected_population",
+            "gross_population",
+            "impact_count",
+            "stale",
+            "computed_at",
+        ]
+
+
+class EventSearchResultSerializer(serializers.ModelSerializer[HistoricalEvent]):
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.CharField(
+        read_only=True,
+        help_text="Description excerpt as HTML: escaped, matches in <mark>.",
+    )
+
+    class Meta:
+        model = HistoricalEvent
+        fields = [
+            "id",
+            "url",
+            "name",
+            "title",
+            "start_date",
+            "end_date",
+            "rank",
+            "headline",
+        ]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:historicalevent-detail", "lookup_field": "pk"},
+        }
+
+
+class EventNeighbourSerializer(serializers.ModelSerializer[HistoricalEvent]):
+    distance = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = HistoricalEvent
+        fields = [
+            "id",
+            "url",
+            "name",
+            "start_date",
+            "end_date",
+            "significance_rating",
+            "distance",
+        ]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:historicalevent-detail", "lookup_field": "pk"},
+        }
+
+
+class HistoricalEntitySerializer(serializers.ModelSerializer[HistoricalEntity]):
+    location = LocationSerializer(read_only=True)
+
+    class Meta:
+        model = HistoricalEntity
+        fields = [
+            "id",
+            "url",
+            "name",
+            "description",
+            "start_date",
+            "end_date",
+            "location",
+            "pagerank",
+            "degree",
+            "betweenness",
+        ]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:historicalentity-detail", "lookup_field": "pk"},
+        }
+
+
+class ImpactEventSerializer(serializers.ModelSerializer[HistoricalEvent]):
+    class Meta:
+        model = HistoricalEvent
+        fields = ["id", "url", "name", "start_date", "end_date"]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:historicalevent-detail", "lookup_field": "pk"},
+        }
+
+
+class GeopoliticalImpactSerializer(serializers.ModelSerializer[GeopoliticalImpact]):
+    event = ImpactEventSerializer(read_only=True)
+    region = LocationSerializer(read_only=True)
+
+    class Meta:
+        model = GeopoliticalImpact
+        fields = [
+            "id",
+            "impact_type",
+            "impact_radius",
+            "affected_population",
+            "event",
+            "region",
+        ]
+
+
+class TimelineSerializer(serializers.ModelSerializer[Timeline]):
+    class Meta:
+        model = Timeline
+        fields = ["id", "url", "title", "description", "is_public", "created_at"]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:timeline-detail", "lookup_field": "pk"},
+        }
+
+
+class TimelineEventSerializer(serializers.ModelSerializer[TimelineEvent]):
+    event = HistoricalEventSerializer(read_only=True)
+
+    class Meta:
+        model = TimelineEvent
+        fields = ["id", "order", "custom_note", "event"]
+
+
+class TimelineMoveSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    after = serializers.IntegerField(allow_null=True)
+
+
+class TimelineMovesSerializer(serializers.Serializer):
+    moves = serializers.ListField(
+        child=TimelineMoveSerializer(),
+        allow_empty=False,
+        max_length=MAX_TIMELINE_MOVES,
+    )
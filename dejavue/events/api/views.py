@@ -0,0 +1,462 @@
+from functools import cached_property
+
+from django.contrib.gis.db.models.functions import Distance
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
+from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import ValidationError
+from rest_framework.mixins import ListModelMixin
+from rest_framework.mixins import RetrieveModelMixin
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.viewsets import GenericViewSet
+
+from dejavue.events.autocomplete import suggest
+from dejavue.events.causality import MAX_DEPTH as MAX_CHAIN_DEPTH
+from dejavue.events.causality import causal_graph
+from dejavue.events.clustering import MAX_TILES
+from dejavue.events.clustering import MAX_ZOOM
+from dejavue.events.clustering import cached_clusters
+from dejavue.events.clustering import tiles_for_bbox
+from dejavue.events.exporters import iter_events_ndjson
+from dejavue.events.facets import cached_facet_counts
+from dejavue.events.graph import MAX_DEPTH
+from dejavue.events.graph import GraphUnavailableError
+from dejavue.events.graph import connection_graph
+from dejavue.events.impacts import impact_locator
+from dejavue.events.models import EventImpactFootprint
+from dejavue.events.models import GeopoliticalImpact
+from dejavue.events.models import HistoricalEntity
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.models import Timeline
+from dejavue.events.models import TimelineEvent
+from dejavue.events.ordering import apply_moves
+from dejavue.events.timelines import timeline_etag
+from dejavue.events.timelines import timeline_payload
+
+from .fieldsets import Fieldset
+from .filters import HistoricalEventFilter
+from .filters import bbox_param
+from .filters import filter_key
+from .filters import point_param
+from .pagination import KeysetPagination
+from .pagination import SearchPagination
+from .renderers import NDJSONRenderer
+from .serializers import ConsequenceRollupSerializer
+from .serializers import EventImpactFootprintSerializer
+from .serializers import EventNeighbourSerializer
+from .serializers import EventSearchResultSerializer
+from .serializers import GeopoliticalImpactSerializer
+from .serializers import HistoricalEntitySerializer
+from .serializers import HistoricalEventSerializer
+from .serializers import NearbyEventSerializer
+from .serializers import TimelineEventSerializer
+from .serializers import TimelineMovesSerializer
+from .serializers import TimelineSerializer
+
+
+class ServiceUnavailableError(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Temporarily unavailable, try again later."
+    default_code = "service_unavailable"
+
+
+class HistoricalEventViewSet(RetrieveModelMixin, ListModelMixin, GenericViewSet):
+    serializer_class = HistoricalEventSerializer
+    pagination_class = KeysetPagination
+    filter_backends = [HistoricalEventFilter]
+    # ?ordering= choices, each backed by a composite index
+    keyset_orderings = {
+        "start_date": ("start_date", "id"),
+        "impact": ("-consequence_impact_max", "-id"),
+    }
+    queryset = HistoricalEvent.objects.all()
+    lookup_field = "pk"
+    lookup_value_regex = r"\d+"
+    max_nearest = 100
+    spatial_filter = True
+
+    @cached_property
+    def keyset_ordering(self):
+        ordering = self.request.query_params.get("ordering", "start_date")
+        if ordering not in self.keyset_orderings:
+            choices = ", ".join(self.keyset_orderings)
+            raise ValidationError({"ordering": f"Choose one of: {choices}."})
+        return self.keyset_orderings[ordering]
+
+    @cached_property
+    def fieldset(self):
+        return Fieldset.from_request(self.request, HistoricalEventSerializer)
+
+    def get_queryset(self, *args, **kwargs):
+        required = {"id", *(name.lstrip("-") for name in self.keyset_ordering)}
+        return self.fieldset.apply(self.queryset, required=required)
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "fieldset": self.fieldset}
+
+    @action(
+        detail=True,
+        serializer_class=EventNeighbourSerializer,
+        pagination_class=None,
+    )
+    def neighbourhood(self, request, pk=None):
+        """
+        Events connected to this one through ``related_events``, up to
+        ``?depth=`` hops away, following at most ``?fanout=`` links per event
+        in the ``?direction=`` given (out, in or both).
+        """
+        event = get_object_or_404(HistoricalEvent.objects.only("id"), pk=pk)
+        params = request.query_params
+        try:
+            kwargs = {
+                "depth": int(params.get("depth", 2)),
+                "fanout": int(params.get("fanout", 50)),
+                "direction": params.get("direction", "out"),
+            }
+            events = HistoricalEvent.objects.neighbourhood(event.pk, **kwargs)
+        except ValueError as exc:
+            raise ValidationError(str(exc)) from exc
+        serializer = self.get_serializer(events, many=True)
+        return Response(serializer.data)
+
+    @action(
+        detail=True,
+        serializer_class=ConsequenceRollupSerializer,
+        pagination_class=None,
+    )
+    def consequences(self, request, pk=None):
+        """Consequence count and impact of this event per timeframe."""
+        event = get_object_or_404(HistoricalEvent.objects.only("id"), pk=pk)
+        rollups = event.consequence_rollups.order_by("timeframe")
+        return Response(self.get_serializer(rollups, many=True).data)
+
+    @action(
+        detail=True,
+        serializer_class=EventImpactFootprintSerializer,
+        pagination_class=None,
+        url_path="impact-footprint",
+    )
+    def impact_footprint(self, request, pk=None):
+        """
+        Population affected by this event's impacts, overlaps counted once,
+        as last precomputed; ``stale`` is set while a recount is pending.
+        """
+        event = get_object_or_404(HistoricalEvent.objects.only("id"), pk=pk)
+        footprint = (
+            EventImpactFootprint.objects.filter(event=event).defer("footprint").first()
+        ) or EventImpactFootprint(event=event, stale=False)
+        return Response(self.get_serializer(footprint).data)
+
+    @action(detail=True, pagination_class=None, url_path="causal-chains")
+    def causal_chains(self, request, pk=None):
+        """
+        Cause-effect chains leading on from this event, or to it with
+        ``?direction=upstream``, at most ``?depth=`` links long.
+        """
+        event = get_object_or_404(HistoricalEvent.objects.only("id"), pk=pk)
+        direction = request.query_params.get("direction", "downstream")
+        if direction not in {"downstream", "upstream"}:
+            raise ValidationError({"direction": "Use downstream or upstream."})
+        try:
+            depth = int(request.query_params.get("depth", MAX_CHAIN_DEPTH))
+        except ValueError as exc:
+            raise ValidationError({"depth": "A valid integer is required."}) from exc
+        chains = causal_graph.chains(
+            event.pk,
+            upstream=direction == "upstream",
+            depth=max(1, min(depth, MAX_CHAIN_DEPTH)),
+        )
+        return Response(chains)
+
+    @action(detail=True, pagination_class=None, url_path="shared-causes")
+    def shared_causes(self, request, pk=None):
+        """Root causes this event shares with the event given as ``?with=``."""
+        event = get_object_or_404(HistoricalEvent.objects.only("id"), pk=pk)
+        try:
+            other_id = int(request.query_params.get("with", ""))
+        except ValueError as exc:
+            raise ValidationError({"with": "An event id is required."}) from exc
+        other = get_object_or_404(HistoricalEvent.objects.only("id"), pk=other_id)
+        return Response(causal_graph.shared_root_causes(event.pk, other.pk))
+
+    @action(
+        detail=False,
+        serializer_class=NearbyEventSerializer,
+        pagination_class=None,
+    )
+    def nearest(self, request):
+        """
+        The ``?k=`` located events nearest to ``?point=lon,lat``, matching
+        the list filters, with their ``distance`` in meters.
+        """
+        point = point_param(request, "point")
+        if point is None:
+            raise ValidationError({"point": "This query parameter is required."})
+        try:
+            k = max(1, min(int(request.query_params.get("k", 10)), self.max_nearest))
+        except ValueError as exc:
+            raise ValidationError({"k": "A valid integer is required."}) from exc
+        queryset = self.filter_queryset(
+            HistoricalEvent.objects.select_related("location").nearest(point),
+        ).annotate(distance=Distance("location__point", point))[:k]
+        return Response(self.get_serializer(queryset, many=True).data)
+
+    @action(detail=False, pagination_class=None, spatial_filter=False)
+    def clusters(self, request):
+        """
+        Located events matching the list filters, grouped into a grid at
+        ``?zoom=``: one cluster per occupied cell of the map tiles covering
+        ``?bbox=west,south,east,north``, with its count, centroid and most
+        significant events.
+        """
+        bbox = bbox_param(request)
+        if bbox is None:
+            raise ValidationError({"bbox": "This query parameter is required."})
+        try:
+            zoom = int(request.query_params.get("zoom", ""))
+        except ValueError as exc:
+            raise ValidationError({"zoom": "A valid integer is required."}) from exc
+        if not 0 <= zoom <= MAX_ZOOM:
+            raise ValidationError({"zoom": f"Choose a zoom from 0 to {MAX_ZOOM}."})
+        tiles = tiles_for_bbox(bbox.extent, zoom)
+        if len(tiles) > MAX_TILES:
+            raise ValidationError({"bbox": "Too large for this zoom."})
+        clusters = cached_clusters(
+            self.filter_queryset(HistoricalEvent.objects.all()),
+            zoom,
+            tiles,
+            filter_key(request, spatial=False),
+        )
+        return Response({"zoom": zoom, "clusters": clusters})
+
+    @action(detail=False, pagination_class=None)
+    def facets(self, request):
+        """Counts per facet for the events matching the list filters."""
+        queryset = self.filter_queryset(HistoricalEvent.objects.all())
+        return Response(cached_facet_counts(queryset, filter_key(request)))
+
+    @action(
+        detail=False,
+        serializer_class=EventSearchResultSerializer,
+        pagination_class=SearchPagination,
+    )
+    def search(self, request):
+        """Ranked full-text search over name, title, description and sources."""
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "This query parameter is required."})
+        queryset = HistoricalEvent.objects.search(text).only(
+            "id",
+            "name",
+            "title",
+            "start_date",
+            "end_date",
+        )
+        page = self.paginate_queryset(self.filter_queryset(queryset))
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, renderer_classes=[NDJSONRenderer, JSONRenderer])
+    def export(self, request):
+        """Stream the whole catalogue as NDJSON from one database snapshot."""
+        response = StreamingHttpResponse(
+            iter_events_ndjson(),
+            content_type=NDJSONRenderer.media_type,
+        )
+        response["Content-Disposition"] = 'attachment; filename="events.ndjson"'
+        return response
+
+
+class HistoricalEntityViewSet(RetrieveModelMixin, ListModelMixin, GenericViewSet):
+    serializer_class = HistoricalEntitySerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
+    queryset = HistoricalEntity.objects.select_related("location")
+    lookup_field = "pk"
+    lookup_value_regex = r"\d+"
+
+    # The graph actions run against the in-memory connection snapshot and
+    # only go to the database for the names of the entities they return.
+
+    @staticmethod
+    def _graph():
+        try:
+            return connection_graph.get()
+        except GraphUnavailableError as exc:
+            detail = "The connection graph is still being built."
+            raise ServiceUnavailableError(detail) from exc
+
+    @staticmethod
+    def _names(ids):
+        return dict(
+            HistoricalEntity.objects.filter(pk__in=ids).values_list("pk", "name"),
+        )
+
+    @staticmethod
+    def _int_param(request, name, default=None):
+        value = request.query_params.get(name, default)
+        if value is None:
+            raise ValidationError({name: "This query parameter is required."})
+        try:
+            return int(value)
+        except ValueError as exc:
+            raise ValidationError({name: "A valid integer is required."}) from exc
+
+    @action(detail=False, keyset_ordering=("-pagerank", "-id"))
+    def influential(self, request):
+        """Entities by descending PageRank, optionally within ``?category=``."""
+        queryset = self.get_queryset()
+        if "category" in request.query_params:
+            category = self._int_param(request, "category")
+            queryset = queryset.filter(categories=category)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=True, pagination_class=None)
+    def neighbourhood(self, request, pk=None):
+        """Entities connected to this one within ``?depth=`` hops."""
+        pk = int(pk)
+        depth = max(1, min(self._int_param(request, "depth", 2), MAX_DEPTH))
+        found = self._graph().neighbourhood(pk, depth)
+        names = self._names([pk, *(entity_id for entity_id, _ in found)])
+        if pk not in names:
+            raise NotFound
+        return Response(
+            [
+                {"id": entity_id, "name": names.get(entity_id), "distance": hops}
+                for entity_id, hops in found
+            ],
+        )
+
+    @action(detail=True, pagination_class=None)
+    def path(self, request, pk=None):
+        """
+        Cheapest path from this entity to ``?to=``, where a connection costs
+        ``1 / strength``.
+        """
+        source, target = int(pk), self._int_param(request, "to")
+        result = self._graph().shortest_path(source, target)
+        names = self._names(result[0] if result else [source, target])
+        if source not in names or target not in names:
+            raise NotFound
+        if result is None:
+            detail = "No path between these entities."
+            raise NotFound(detail)
+        path, cost = result
+        steps = [{"id": entity_id, "name": names[entity_id]} for entity_id in path]
+        return Response({"cost": cost, "path": steps})
+
+
+class TimelineViewSet(RetrieveModelMixin, ListModelMixin, GenericViewSet):
+    serializer_class = TimelineSerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
+    queryset = Timeline.objects.all()
+    lookup_field = "pk"
+
+    def get_queryset(self, *args, **kwargs):
+        return self.queryset.filter(
+            Q(is_public=True) | Q(created_by=self.request.user),
+        )
+
+    @action(
+        detail=True,
+        serializer_class=TimelineEventSerializer,
+        keyset_ordering=("order", "id"),
+    )
+    def events(self, request, pk=None):
+        timeline = self.get_object()
+        queryset = (
+            TimelineEvent.objects.filter(timeline=timeline)
+            .select_related("event__era", "event__category", "event__location")
+            .prefetch_related("event__categories", "event__key_figures", "event__tags")
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        serializer_class=TimelineMovesSerializer,
+        pagination_class=None,
+    )
+    def moves(self, request, pk=None):
+        """
+        Reorder rows in one transaction. Each of ``moves`` puts row ``id``
+        right after row ``after`` (first when null), in turn; only the moved
+        rows are written. Returns their new ``order``.
+        """
+        timeline = self.get_object()
+        if timeline.created_by_id != request.user.pk:
+            raise PermissionDenied
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        moves = serializer.validated_data["moves"]
+        moves = [(move["id"], move["after"]) for move in moves]
+        try:
+            rows = apply_moves(timeline, moves)
+        except ValueError as exc:
+            raise ValidationError({"moves": str(exc)}) from exc
+        return Response([{"id": row.pk, "order": row.order} for row in rows])
+
+    @action(detail=True, pagination_class=None)
+    def payload(self, request, pk=None):
+        """
+        Everything needed to render the timeline, with events as arrays laid
+        out by ``fields``. Honours ``If-None-Match``: an unchanged timeline
+        answers 304 before anything is serialized.
+        """
+        timeline = self.get_object()
+        etag = timeline_etag(timeline)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(timeline_payload(timeline))
+        response["ETag"] = etag
+        return response
+
+
+class ImpactLookupView(APIView):
+    """GeopoliticalImpact regions covering ``?point=lon,lat``, with their events."""
+
+    def get(self, request):
+        point = point_param(request, "point")
+        if point is None:
+            raise ValidationError({"point": "This query parameter is required."})
+        ids = impact_locator.covering(point)
+        impacts = (
+            GeopoliticalImpact.objects.filter(pk__in=ids)
+            .select_related("event", "region")
+            .defer("geometry", "region__point")
+            .order_by("pk")
+        )
+        serializer = GeopoliticalImpactSerializer(
+            impacts,
+            many=True,
+            context={"request": request},
+        )
+        return Response({"results": serializer.data})
+
+
+class AutocompleteView(APIView):
+    """Type-ahead suggestions across events, figures and locations."""
+
+    max_limit = 20
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            limit = 10
+        limit = max(1, min(limit, self.max_limit))
+        results = suggest(request.query_params.get("q", ""), limit)
+        return Response({"results": results})
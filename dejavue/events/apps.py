@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class EventsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dejavue.events"
+
+    def ready(self):
+        import dejavue.events.signals  # noqa: F401
@@ -0,0 +1,71 @@
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models.functions import Greatest
+
+from .cache import get_generation
+from .models import HistoricalEvent
+from .models import HistoricalFigure
+from .models import Location
+
+AUTOCOMPLETE_NAMESPACE = "events:autocomplete"
+# Prefixes this short match too many rows for the trigram index to narrow
+# down, and they are also the most repeated, so their results are cached.
+CACHED_PREFIX_LENGTH = 3
+CACHE_TIMEOUT = 60 * 60
+
+SOURCES = [
+    ("event", HistoricalEvent, ("name",)),
+    ("figure", HistoricalFigure, ("name",)),
+    ("location", Location, ("name", "modern_name")),
+]
+
+
+def _candidates(kind, model, fields, text, limit):
+    match = Q()
+    for field in fields:
+        match |= Q(**{f"{field}__icontains": text})
+    similarities = [TrigramSimilarity(field, text) for field in fields]
+    similarity = similarities[0] if len(similarities) == 1 else Greatest(*similarities)
+    return (
+        model.objects.filter(match)
+        .annotate(kind=Value(kind), label=F("name"), similarity=similarity)
+        .values("id", "kind", "label", "similarity")
+        .order_by("-similarity")[:limit]
+    )
+
+
+def search(text, limit):
+    """Best ``limit`` matches across events, figures and locations, one query."""
+    first, *rest = (
+        _candidates(kind, model, fields, text, limit) for kind, model, fields in SOURCES
+    )
+    rows = first.union(*rest, all=True).order_by("-similarity", "label")[:limit]
+    return [
+        {"type": row["kind"], "id": row["id"], "label": row["label"]} for row in rows
+    ]
+
+
+def suggest(text, limit=10):
+    """
+    Type-ahead suggestions for ``text``.
+
+    Matches use the ``gin_trgm_ops`` indexes on ``UPPER()`` of each name
+    column, which serve ``__icontains``, and are ranked by trigram
+    similarity. Results for short prefixes are cached until
+    any event, figure or location is saved or deleted.
+    """
+    text = " ".join(text.split())
+    if not text:
+        return []
+    if len(text) > CACHED_PREFIX_LENGTH:
+        return search(text, limit)
+    generation = get_generation(AUTOCOMPLETE_NAMESPACE)
+    key = f"{AUTOCOMPLETE_NAMESPACE}:{generation}:{limit}:{text.casefold()}"
+    results = cache.get(key)
+    if results is None:
+        results = search(text, limit)
+        cache.set(key, results, CACHE_TIMEOUT)
+    return results
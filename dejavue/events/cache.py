@@ -0,0 +1,66 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _generation_key(namespace):
+    return f"{namespace}:generation"
+
+
+def _initial_generation():
+    # Clock based, so a counter that was evicted or cleared restarts past any
+    # generation a process may still hold in memory.
+    return time.time_ns() // 1000
+
+
+def get_generation(namespace):
+    """Current generation of ``namespace``; embed it in cache keys."""
+    return cache.get_or_set(
+        _generation_key(namespace),
+        _initial_generation,
+        timeout=None,
+    )
+
+
+def bump_generation(namespace):
+    """Invalidate every cache entry keyed on ``namespace``'s generation."""
+    key = _generation_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted or never set: start a fresh generation no reader has seen.
+        cache.add(key, _initial_generation(), timeout=None)
+        return cache.incr(key)
+
+
+def get_generations(namespaces):
+    """:func:`get_generation` for many namespaces in two cache round trips."""
+    keys = {_generation_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(keys)
+    missing = {key: _initial_generation() for key in keys if key not in found}
+    if missing:
+        for key, generation in missing.items():
+            cache.add(key, generation, timeout=None)
+        # Another process may have set some of them first.
+        found.update(missing)
+        found.update(cache.get_many(missing))
+    return {keys[key]: generation for key, generation in found.items()}
+
+
+def bump_generations(namespaces):
+    """
+    Invalidate many namespaces in one round trip. Their counters are dropped
+    and restart from the clock, past any generation handed out before.
+    """
+    cache.delete_many([_generation_key(namespace) for namespace in namespaces])
+
+
+def bump_on_commit(*namespaces):
+    """:func:`bump_generation` for each of ``namespaces`` on commit."""
+
+    def bump():
+        for namespace in namespaces:
+            bump_generation(namespace)
+
+    transaction.on_commit(bump)
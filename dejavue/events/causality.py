@@ -0,0 +1,179 @@
+"""Cause-effect chains across events, from CauseEffectRelationship."""
+
+import threading
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.apps import apps
+from django.core.cache import cache
+
+from .cache import get_generation
+
+CAUSALITY_NAMESPACE = "events:causality"
+MAX_DEPTH = 10
+MAX_CHAINS = 100
+CACHE_TIMEOUT = 60 * 60
+
+
+def normalize(name):
+    """Case- and whitespace-insensitive form used to match effects to causes."""
+    return " ".join(name.casefold().split())
+
+
+class Link(NamedTuple):
+    """One CauseEffectRelationship row."""
+
+    id: int
+    event_id: int
+    cause_id: int
+    cause: str
+    effect_id: int
+    effect: str
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "event": self.event_id,
+            "cause": {"id": self.cause_id, "name": self.cause},
+            "effect": {"id": self.effect_id, "name": self.effect},
+        }
+
+
+class CausalGraph:
+    """
+    Every cause-effect link, indexed for walking chains across events.
+
+    A chain continues from one link to another when the effect of the first
+    is, by name, the cause of the second, usually in a later event. Names are
+    compared after :func:`normalize`.
+    """
+
+    def __init__(self, links):
+        self.by_event = defaultdict(list)
+        self.by_cause = defaultdict(list)
+        self.by_effect = defaultdict(list)
+        for link in links:
+            self.by_event[link.event_id].append(link)
+            self.by_cause[normalize(link.cause)].append(link)
+            self.by_effect[normalize(link.effect)].append(link)
+
+    @classmethod
+    def load(cls):
+        """Build the graph from a single query."""
+        model = apps.get_model("events", "CauseEffectRelationship")
+        rows = model.objects.order_by("id").values_list(
+            "id",
+            "historical_event_id",
+            "cause_id",
+            "cause__name",
+            "effect_id",
+            "effect__name",
+        )
+        return cls(Link(*row) for row in rows)
+
+    def successors(self, link):
+        return self.by_cause.get(normalize(link.effect), [])
+
+    def predecessors(self, link):
+        return self.by_effect.get(normalize(link.cause), [])
+
+    def chains(self, event_id, *, upstream=False, depth=MAX_DEPTH, limit=MAX_CHAINS):
+        """
+        Maximal chains of links starting at ``event_id`` and following
+        effects to causes (or, ``upstream``, causes back to effects), at most
+        ``depth`` links long and ``limit`` chains in all. Upstream chains are
+        returned in causal order, ending at ``event_id``. A link is never
+        repeated within a chain, so cycles end it.
+        """
+        step = self.predecessors if upstream else self.successors
+        found: list[list[Link]] = []
+        stack = [[link] for link in reversed(self.by_event.get(event_id, []))]
+        while stack and len(found) < limit:
+            chain = stack.pop()
+            seen = {link.id for link in chain}
+            following = [] if len(chain) >= depth else step(chain[-1])
+            following = [link for link in following if link.id not in seen]
+            if not following:
+                found.append(chain[::-1] if upstream else chain)
+            stack += [[*chain, link] for link in reversed(following)]
+        return found
+
+    def root_causes(self, event_id):
+        """
+        Normalized names of the causes that ultimately lead to ``event_id``:
+        causes reached upstream that are not themselves an effect of
+        anything, mapped to their Cause ids.
+        """
+        roots = defaultdict(set)
+        seen = set()
+        pending = list(self.by_event.get(event_id, []))
+        while pending:
+            link = pending.pop()
+            if link.id in seen:
+                continue
+            seen.add(link.id)
+            predecessors = self.predecessors(link)
+            if predecessors:
+                pending += predecessors
+            else:
+                roots[normalize(link.cause)].add(link.cause_id)
+        return roots
+
+    def shared_root_causes(self, event_id, other_id):
+        """Root causes common to both events, as ``{"name", "cause_ids"}``."""
+        ours, theirs = self.root_causes(event_id), self.root_causes(other_id)
+        return [
+            {"name": name, "cause_ids": sorted(ours[name] | theirs[name])}
+            for name in sorted(ours.keys() & theirs.keys())
+        ]
+
+
+class CausalGraphCache:
+    """
+    The current CausalGraph for this process, plus a shared cache of query
+    results. Both are keyed by the generation of ``CAUSALITY_NAMESPACE``,
+    which events.signals bumps whenever relationships, causes or effects
+    change, so repeated explorations cost a cache read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._graph = (None, None)  # (generation, graph)
+
+    def graph(self, generation=None):
+        if generation is None:
+            generation = get_generation(CAUSALITY_NAMESPACE)
+        if self._graph[0] != generation:
+            with self._lock:
+                if self._graph[0] != generation:
+                    self._graph = (generation, CausalGraph.load())
+        return self._graph[1]
+
+    def _cached(self, key, compute):
+        generation = get_generation(CAUSALITY_NAMESPACE)
+        key = f"{CAUSALITY_NAMESPACE}:{generation}:{key}"
+        result = cache.get(key)
+        if result is None:
+            result = compute(self.graph(generation))
+            cache.set(key, result, CACHE_TIMEOUT)
+        return result
+
+    def chains(self, event_id, *, upstream=False, depth=MAX_DEPTH):
+        """Chains from :meth:`CausalGraph.chains`, as lists of link dicts."""
+        return self._cached(
+            f"chains:{event_id}:{int(upstream)}:{depth}",
+            lambda graph: [
+                [link.as_dict() for link in chain]
+                for chain in graph.chains(event_id, upstream=upstream, depth=depth)
+            ],
+        )
+
+    def shared_root_causes(self, event_id, other_id):
+        first, second = sorted([event_id, other_id])
+        return self._cached(
+            f"roots:{first}:{second}",
+            lambda graph: graph.shared_root_causes(first, second),
+        )
+
+
+causal_graph = CausalGraphCache()
@@ -0,0 +1,230 @@
+"""Grid clustering of located events, per slippy-map tile."""
+
+import hashlib
+import json
+import math
+
+from django.contrib.gis.geos import Polygon
+from django.core.cache import cache
+from django.db.models import Avg
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import FloatField
+from django.db.models import IntegerField
+from django.db.models import Window
+from django.db.models.functions import Cast
+from django.db.models.functions import Cos
+from django.db.models.functions import Floor
+from django.db.models.functions import Greatest
+from django.db.models.functions import Least
+from django.db.models.functions import Ln
+from django.db.models.functions import Radians
+from django.db.models.functions import RowNumber
+from django.db.models.functions import Tan
+
+from .cache import bump_generations
+from .cache import get_generations
+from .geo import SRID
+from .models import HistoricalEvent
+
+CLUSTER_NAMESPACE = "events:clusters"
+CLUSTER_TIMEOUT = 24 * 60 * 60
+MAX_ZOOM = 20
+# Tiles up to this zoom are cached, each under its own generation, which is
+# bumped when an event in it changes. Deeper tiles hold few events and are
+# cheap to cluster on every request.
+CACHED_MAX_ZOOM = 12
+# Only filters on the event's own columns are covered by that invalidation.
+CACHED_FILTERS = frozenset({"from", "to", "era", "category", "impact_level"})
+PRECOMPUTE_MAX_ZOOM = 6
+POPULAR_TILES = 256
+MAX_TILES = 64
+GRID = 8  # cells per tile side
+TOP_EVENTS = 3
+MAX_LATITUDE = 85.0511287798  # edge of the Web Mercator square
+
+
+def tile_for(longitude, latitude, zoom):
+    """``(x, y)`` of the tile at ``zoom`` containing the point."""
+    n = 2**zoom
+    latitude = math.radians(max(-MAX_LATITUDE, min(latitude, MAX_LATITUDE)))
+    x = (longitude + 180) / 360 * n
+    y = (1 - math.asinh(math.tan(latitude)) / math.pi) / 2 * n
+    return min(int(x), n - 1), min(int(y), n - 1)
+
+
+def tile_bounds(zoom, x, y):
+    """``(west, south, east, north)`` of a tile, in degrees."""
+    n = 2**zoom
+
+    def latitude(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return x / n * 360 - 180, latitude(y + 1), (x + 1) / n * 360 - 180, latitude(y)
+
+
+def tiles_for_bbox(extent, zoom):
+    """The ``(x, y)`` tiles at ``zoom`` covering a ``(w, s, e, n)`` extent."""
+    west, south, east, north = extent
+    left, top = tile_for(west, north, zoom)
+    right, bottom = tile_for(east, south, zoom)
+    return [(x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)]
+
+
+def _coordinates():
+    longitude = Cast("location__longitude", FloatField())
+    latitude = Cast("location__latitude", FloatField())
+    return longitude, latitude
+
+
+def cell_expressions(zoom, per_tile=GRID):
+    """
+    Database expressions for the global grid column and row of an event's
+    location at ``zoom``, with ``per_tile`` cells along each side of a tile.
+    Rows follow the Web Mercator projection, like the tiles themselves.
+    """
+    cells = 2**zoom * per_tile
+    longitude, latitude = _coordinates()
+    latitude = Radians(Least(Greatest(latitude, -MAX_LATITUDE), MAX_LATITUDE))
+    column = Floor((longitude + 180) / 360 * cells)
+    # asinh(tan(lat)) = ln(tan(lat) + sec(lat))
+    row = Floor((1 - Ln(Tan(latitude) + 1 / Cos(latitude)) / math.pi) / 2 * cells)
+    return (
+        Cast(Least(column, float(cells - 1)), IntegerField()),
+        Cast(Least(row, float(cells - 1)), IntegerField()),
+    )
+
+
+def cluster_tile(queryset, zoom, x, y):
+    """
+    Clusters for the events of ``queryset`` in tile ``zoom/x/y``: one per
+    non-empty grid cell, with its count, centroid and the ``TOP_EVENTS``
+    most significant events. Two queries.
+    """
+    bbox = Polygon.from_bbox(tile_bounds(zoom, x, y))
+    bbox.srid = SRID
+    column, row = cell_expressions(zoom)
+    longitude, latitude = _coordinates()
+    events = (
+        queryset.in_bbox(bbox)
+        .order_by()
+        .annotate(cell_x=column, cell_y=row)
+        .filter(
+            cell_x__gte=x * GRID,
+            cell_x__lt=(x + 1) * GRID,
+            cell_y__gte=y * GRID,
+            cell_y__lt=(y + 1) * GRID,
+        )
+    )
+    cells = (
+        events.values("cell_x", "cell_y")
+        .annotate(
+            count=Count("*"),
+            longitude=Avg(longitude),
+            latitude=Avg(latitude),
+        )
+        .order_by("cell_y", "cell_x")
+    )
+    top = (
+        events.annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=[F("cell_x"), F("cell_y")],
+                order_by=[F("significance_rating").desc(), F("id")],
+            ),
+        )
+        .filter(rank__lte=TOP_EVENTS)
+        .order_by("cell_y", "cell_x", "rank")
+        .values_list("cell_x", "cell_y", "id", "name", "significance_rating")
+    )
+    top_events: dict[tuple[int, int], list[dict]] = {}
+    for cell_x, cell_y, pk, name, significance in top:
+        top_events.setdefault((cell_x, cell_y), []).append(
+            {"id": pk, "name": name, "significance_rating": significance},
+        )
+    return [
+        {
+            "tile": f"{zoom}/{x}/{y}",
+            "cell": [cell["cell_x"], cell["cell_y"]],
+            "count": cell["count"],
+            "centroid": [cell["longitude"], cell["latitude"]],
+            "top_events": top_events.get((cell["cell_x"], cell["cell_y"]), []),
+        }
+        for cell in cells
+    ]
+
+
+def tile_namespace(zoom, x, y):
+    return f"{CLUSTER_NAMESPACE}:{zoom}/{x}/{y}"
+
+
+def cached_clusters(queryset, zoom, tiles, filter_key):
+    """
+    :func:`cluster_tile` for each of ``tiles``, concatenated. Each tile is
+    cached under ``filter_key`` (the normalized filter that produced
+    ``queryset``) until an event in it changes; tiles deeper than
+    ``CACHED_MAX_ZOOM`` or filtered on related tables are always computed.
+    """
+    if zoom > CACHED_MAX_ZOOM or not filter_key.keys() <= CACHED_FILTERS:
+        return [
+            cluster for tile in tiles for cluster in cluster_tile(queryset, zoom, *tile)
+        ]
+    digest = hashlib.sha256(
+        json.dumps(filter_key, sort_keys=True).encode(),
+    ).hexdigest()
+    namespaces = {tile: tile_namespace(zoom, *tile) for tile in tiles}
+    generations = get_generations(namespaces.values())
+    keys = {
+        tile: f"{namespace}:{generations[namespace]}:{digest}"
+        for tile, namespace in namespaces.items()
+    }
+    found = cache.get_many(keys.values())
+    missing = {
+        keys[tile]: cluster_tile(queryset, zoom, *tile)
+        for tile in tiles
+        if keys[tile] not in found
+    }
+    cache.set_many(missing, CLUSTER_TIMEOUT)
+    found.update(missing)
+    return [cluster for tile in tiles for cluster in found[keys[tile]]]
+
+
+def invalidate_points(points):
+    """Drop the cached tiles, at every cached zoom, containing ``points``."""
+    namespaces = {
+        tile_namespace(zoom, *tile_for(point.x, point.y, zoom))
+        for point in points
+        if point is not None
+        for zoom in range(CACHED_MAX_ZOOM + 1)
+    }
+    if namespaces:
+        bump_generations(namespaces)
+
+
+def popular_tiles(queryset, zoom, limit=POPULAR_TILES):
+    """The ``limit`` tiles at ``zoom`` holding the most events, busiest first."""
+    column, row = cell_expressions(zoom, per_tile=1)
+    return list(
+        queryset.filter(location__point__isnull=False)
+        .order_by()
+        .annotate(tile_x=column, tile_y=row)
+        .values_list("tile_x", "tile_y")
+        .annotate(count=Count("*"))
+        .order_by("-count", "tile_y", "tile_x")
+        .values_list("tile_x", "tile_y")[:limit],
+    )
+
+
+def precompute_clusters(max_zoom=PRECOMPUTE_MAX_ZOOM, limit=POPULAR_TILES):
+    """
+    Fill the unfiltered cache for the busiest tiles of every zoom up to
+    ``max_zoom``; tiles still cached are left alone. Returns the number
+    of tiles visited.
+    """
+    queryset = HistoricalEvent.objects.all()
+    visited = 0
+    for zoom in range(min(max_zoom, CACHED_MAX_ZOOM) + 1):
+        tiles = popular_tiles(queryset, zoom, limit)
+        cached_clusters(queryset, zoom, tiles, {})
+        visited += len(tiles)
+    return visited
@@ -0,0 +1,80 @@
+import threading
+import time
+from bisect import bisect_right
+
+from django.apps import apps
+from django.db import transaction
+
+from .cache import bump_generation
+from .cache import get_generation
+
+ERA_NAMESPACE = "events:eras"
+
+
+class EraIndex:
+    """
+    In-process lookup of eras by year.
+
+    Era boundaries are loaded once and kept sorted by ``start_year``, so a
+    lookup is a bisect rather than a query. Saving or deleting an era bumps
+    a shared generation and clears the index in this process on commit, so a
+    rolled back edit is never served; other processes notice the bump within
+    ``check_interval`` seconds.
+    """
+
+    check_interval = 5.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = None
+        self._checked_at = 0.0
+        # (starts, eras, reach): eras are (start_year, end_year, pk) tuples,
+        # reach[i] is the largest end_year among eras[: i + 1].
+        self._table: tuple[list[int], list[tuple[int, int, int]], list[int]] = (
+            [],
+            [],
+            [],
+        )
+
+    def era_for_year(self, year):
+        """Primary key of the latest-starting era covering ``year``, or None."""
+        starts, eras, reach = self._current()
+        i = bisect_right(starts, year)
+        while i and reach[i - 1] >= year:
+            i -= 1
+            if eras[i][1] >= year:
+                return eras[i][2]
+        return None
+
+    def era_for_date(self, date):
+        return self.era_for_year(date.year)
+
+    def invalidate(self):
+        def reset():
+            bump_generation(ERA_NAMESPACE)
+            self._generation = None
+
+        transaction.on_commit(reset)
+
+    def _current(self):
+        now = time.monotonic()
+        if self._generation is None or now - self._checked_at > self.check_interval:
+            with self._lock:
+                generation = get_generation(ERA_NAMESPACE)
+                if generation != self._generation:
+                    self._table = self._build()
+                    self._generation = generation
+                self._checked_at = now
+        return self._table
+
+    @staticmethod
+    def _build():
+        era_model = apps.get_model("events", "Era")
+        eras = sorted(era_model.objects.values_list("start_year", "end_year", "pk"))
+        reach: list[int] = []
+        for _, end_year, _ in eras:
+            reach.append(max(end_year, reach[-1]) if reach else end_year)
+        return [era[0] for era in eras], eras, reach
+
+
+era_index = EraIndex()
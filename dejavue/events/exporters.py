@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+from django.db import transaction
+
+from .models import HistoricalEvent
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+@contextmanager
+def snapshot(using=DEFAULT_DB_ALIAS):
+    """
+    Run the block inside one REPEATABLE READ, READ ONLY transaction, so every
+    query in it sees the database as of its first statement.
+
+    When a transaction is already open (e.g. in tests) its snapshot is used.
+    """
+    if connections[using].in_atomic_block:
+        yield
+        return
+    with transaction.atomic(using=using):
+        with connections[using].cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        yield
+
+
+def event_record(event):
+    return {
+        "id": event.pk,
+        "name": event.name,
+        "title": event.title,
+        "date": event.date,
+        "start_date": event.start_date,
+        "end_date": event.end_date,
+        "description": event.description,
+        "impact_level": event.impact_level,
+        "significance_rating": event.significance_rating,
+        "sources": event.sources,
+        "era": event.era.slug,
+        "category": event.category.name,
+        "location": event.location.name if event.location else None,
+        "categories": [category.name for category in event.categories.all()],
+        "key_figures": [figure.name for figure in event.key_figures.all()],
+        "tags": [tag.name for tag in event.tags.all()],
+        "created_at": event.created_at,
+        "updated_at": event.updated_at,
+    }
+
+
+def iter_events_ndjson(queryset=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield the event catalogue as NDJSON, one chunk of lines at a time.
+
+    Rows are read through a server-side cursor ``chunk_size`` at a time, and
+    ``iterator()`` runs the prefetches for each chunk as it is fetched, so
+    memory stays flat however large the table is.
+    """
+    if queryset is None:
+        queryset = HistoricalEvent.objects.all()
+    queryset = queryset.with_related().defer("search_vector").order_by("pk")
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    with snapshot(queryset.db):
+        lines = []
+        for event in queryset.iterator(chunk_size=chunk_size):
+            lines.append(encoder.encode(event_record(event)))
+            if len(lines) >= chunk_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Count
+from taggit.models import TaggedItem
+
+from .cache import get_generation
+from .models import HistoricalEvent
+
+FACET_NAMESPACE = "events:facets"
+FACET_TIMEOUT = 10 * 60
+
+
+def _counts(queryset, id_field, name_field):
+    rows = (
+        queryset.values_list(id_field, name_field)
+        .annotate(count=Count("*"))
+        .order_by("-count", name_field)
+    )
+    return [{"id": pk, "name": name, "count": count} for pk, name, count in rows]
+
+
+def facet_counts(queryset):
+    """
+    Counts per era, event category, impact level, category and tag for the
+    events in ``queryset``, using one grouped query per facet.
+    """
+    ids = queryset.order_by().values("pk")
+    events = HistoricalEvent.objects.filter(pk__in=ids)
+    categories = HistoricalEvent.categories.through.objects.filter(
+        historicalevent__in=ids,
+    )
+    tagged = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(HistoricalEvent),
+        object_id__in=ids,
+    )
+    labels = dict(HistoricalEvent.IMPACT_LEVELS)
+    impact_levels = (
+        events.values_list("impact_level")
+        .annotate(count=Count("*"))
+        .order_by("impact_level")
+    )
+    return {
+        "era": _counts(events, "era_id", "era__name"),
+        "category": _counts(events, "category_id", "category__name"),
+        "impact_level": [
+            {"id": level, "name": labels[level], "count": count}
+            for level, count in impact_levels
+        ],
+        "categories": _counts(categories, "category_id", "category__name"),
+        "tags": _counts(tagged, "tag_id", "tag__name"),
+    }
+
+
+def cached_facet_counts(queryset, filter_key):
+    """
+    :func:`facet_counts`, cached under ``filter_key`` (the normalized filter
+    that produced ``queryset``) until an event is written or the entry expires.
+    """
+    digest = hashlib.sha256(
+        json.dumps(filter_key, sort_keys=True).encode(),
+    ).hexdigest()
+    key = f"{FACET_NAMESPACE}:{get_generation(FACET_NAMESPACE)}:{digest}"
+    counts = cache.get(key)
+    if counts is None:
+        counts = facet_counts(queryset)
+        cache.set(key, counts, FACET_TIMEOUT)
+    return counts
@@ -0,0 +1,215 @@
+"""
+Per-event and per-era impact footprints, kept in EventImpactFootprint and
+EraImpactFootprint.
+
+Overlapping impacts would count the people in the overlap more than once,
+so a region's population is taken as spread evenly over its geometry and
+regions are counted in descending ``affected_population``: each one adds
+only the share of its population lying outside the regions counted before
+it, measured on the faces of their overlay. An era combines the footprints
+of its events the same way.
+
+Changes only flag summaries as stale (:func:`mark_stale`); the Celery task
+behind :func:`recompute_stale` brings them up to date in batches, so
+readers get a stored row instead of a union on every request.
+"""
+
+from django.db import connections
+from django.db import transaction
+
+from .models import EraImpactFootprint
+from .models import EventImpactFootprint
+
+BATCH_SIZE = 500
+
+# Upsert the footprint of every owner in %(ids)s from its "unit" rows
+# (id, owner_id, geometry, population, gross). Units are ranked by
+# population. Rather than differencing each unit against the union of those
+# ranked before it, the boundaries of an owner's units are unioned once and
+# polygonized into the faces of their overlay; each face is then claimed by
+# the highest ranked unit covering it. Units without area count unless an
+# earlier unit covers them. computed_at is the statement start on the
+# database clock, the one MARK_SQL stamps changed_at with.
+FOOTPRINT_SQL = """
+WITH unit AS ({units}),
+ranked AS (
+    SELECT unit.*, ST_Area(unit.geometry::geography) AS area,
+        row_number() OVER (
+            PARTITION BY unit.owner_id ORDER BY unit.population DESC, unit.id
+        ) AS rank
+    FROM unit
+),
+linework AS (
+    SELECT owner_id,
+        ST_Union(ST_Boundary(ST_CollectionExtract(geometry, 3))) AS lines
+    FROM ranked
+    WHERE area > 0
+    GROUP BY owner_id
+),
+face AS (
+    SELECT linework.owner_id, dumped.path, dumped.geom AS geometry
+    FROM linework
+    CROSS JOIN LATERAL ST_Dump(ST_Polygonize(ARRAY[linework.lines])) AS dumped
+),
+claimed AS (
+    SELECT DISTINCT ON (face.owner_id, face.path)
+        ranked.id, ranked.owner_id, ST_Area(face.geometry::geography) AS area
+    FROM face
+    JOIN ranked ON ranked.owner_id = face.owner_id
+        AND ranked.area > 0
+        AND ST_Covers(ranked.geometry, ST_PointOnSurface(face.geometry))
+    ORDER BY face.owner_id, face.path, ranked.rank
+),
+share AS (
+    SELECT id, owner_id, sum(area) AS area
+    FROM claimed
+    GROUP BY id, owner_id
+),
+counted AS (
+    SELECT ranked.owner_id, ranked.geometry, ranked.gross,
+        ranked.population * CASE
+            WHEN ranked.area > 0 THEN COALESCE(share.area, 0) / ranked.area
+            ELSE (NOT EXISTS (
+                SELECT 1 FROM ranked AS earlier
+                WHERE earlier.owner_id = ranked.owner_id
+                    AND earlier.rank < ranked.rank
+                    AND ST_Covers(earlier.geometry, ranked.geometry)
+            ))::integer
+        END AS population
+    FROM ranked
+    LEFT JOIN share
+        ON share.id = ranked.id AND share.owner_id = ranked.owner_id
+),
+total AS (
+    SELECT owner_id, ST_Union(geometry) AS footprint,
+        round(sum(population))::bigint AS population,
+        sum(gross)::bigint AS gross, count(*) AS impacts
+    FROM counted
+    GROUP BY owner_id
+)
+INSERT INTO {table} AS summary (
+    {owner}, footprint, area, affected_population, gross_population,
+    impact_count, stale, changed_at, computed_at
+)
+SELECT owner.id, total.footprint,
+    COALESCE(ST_Area(total.footprint::geography), 0),
+    COALESCE(total.population, 0), COALESCE(total.gross, 0),
+    COALESCE(total.impacts, 0), false, statement_timestamp(), statement_timestamp()
+FROM unnest(%(ids)s::bigint[]) AS owner (id)
+LEFT JOIN total ON total.owner_id = owner.id
+ON CONFLICT ({owner}) DO UPDATE SET
+    footprint = EXCLUDED.footprint,
+    area = EXCLUDED.area,
+    affected_population = EXCLUDED.affected_population,
+    gross_population = EXCLUDED.gross_population,
+    impact_count = EXCLUDED.impact_count,
+    -- Still stale when flagged again while this ran.
+    stale = summary.changed_at > EXCLUDED.computed_at,
+    computed_at = EXCLUDED.computed_at
+"""
+EVENT_SQL = FOOTPRINT_SQL.format(
+    table="events_eventimpactfootprint",
+    owner="event_id",
+    units="""
+        SELECT id, event_id AS owner_id, geometry,
+            affected_population AS population, affected_population AS gross
+        FROM events_geopoliticalimpact
+        WHERE event_id = ANY(%(ids)s::bigint[])
+    """,
+)
+ERA_SQL = FOOTPRINT_SQL.format(
+    table="events_eraimpactfootprint",
+    owner="era_id",
+    units="""
+        SELECT event.id, event.era_id AS owner_id,
+            event_footprint.footprint AS geometry,
+            event_footprint.affected_population AS population,
+            event_footprint.gross_population AS gross
+        FROM events_eventimpactfootprint AS event_footprint
+        JOIN events_historicalevent AS event ON event.id = event_footprint.event_id
+        WHERE event.era_id = ANY(%(ids)s::bigint[])
+            AND event_footprint.footprint IS NOT NULL
+    """,
+)
+# Flag the summaries of the owners selected by {owners} (ids of rows that
+# still exist), creating empty ones as needed.
+MARK_SQL = """
+INSERT INTO {table} AS summary (
+    {owner}, area, affected_population, gross_population, impact_count,
+    stale, changed_at
+)
+SELECT owner.id, 0, 0, 0, 0, true, clock_timestamp()
+FROM ({owners}) AS owner (id)
+ON CONFLICT ({owner}) DO UPDATE SET stale = true, changed_at = EXCLUDED.changed_at
+"""
+MARK_EVENTS_SQL = MARK_SQL.format(
+    table="events_eventimpactfootprint",
+    owner="event_id",
+    owners="SELECT id FROM events_historicalevent WHERE id = ANY(%(ids)s::bigint[])",
+)
+MARK_ERAS_SQL = MARK_SQL.format(
+    table="events_eraimpactfootprint",
+    owner="era_id",
+    owners="SELECT id FROM events_era WHERE id = ANY(%(ids)s::bigint[])",
+)
+MARK_EVENT_ERAS_SQL = MARK_SQL.format(
+    table="events_eraimpactfootprint",
+    owner="era_id",
+    owners="""
+        SELECT DISTINCT era_id FROM events_historicalevent
+        WHERE id = ANY(%(ids)s::bigint[])
+    """,
+)
+
+
+def _ids(ids):
+    return sorted({pk for pk in ids if pk is not None})
+
+
+def mark_stale(event_ids=(), era_ids=(), using="default"):
+    """Flag the footprints of these events and eras; deleted ids are skipped."""
+    event_ids, era_ids = _ids(event_ids), _ids(era_ids)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        if event_ids:
+            cursor.execute(MARK_EVENTS_SQL, {"ids": event_ids})
+        if era_ids:
+            cursor.execute(MARK_ERAS_SQL, {"ids": era_ids})
+
+
+def recompute_events(event_ids, using="default"):
+    """Recompute these event footprints and flag their eras."""
+    params = {"ids": _ids(event_ids)}
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(EVENT_SQL, params)
+        cursor.execute(MARK_EVENT_ERAS_SQL, params)
+
+
+def recompute_eras(era_ids, using="default"):
+    params = {"ids": _ids(era_ids)}
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(ERA_SQL, params)
+
+
+def recompute_stale(batch_size=BATCH_SIZE, using="default"):
+    """
+    Recompute every stale event footprint, then every stale era footprint,
+    ``batch_size`` at a time. Returns the number of summaries written.
+    """
+    written = 0
+    for model, owner, recompute in (
+        (EventImpactFootprint, "event_id", recompute_events),
+        (EraImpactFootprint, "era_id", recompute_eras),
+    ):
+        stale = (
+            model.objects.using(using)
+            .filter(stale=True)
+            .order_by(owner)
+            .values_list(owner, flat=True)
+        )
+        # Keyset batches: rows flagged again meanwhile wait for the next run.
+        last = 0
+        while ids := list(stale.filter(**{f"{owner}__gt": last})[:batch_size]):
+            recompute(ids, using=using)
+            written += len(ids)
+            last = ids[-1]
+    return written
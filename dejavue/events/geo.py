@@ -0,0 +1,63 @@
+"""Spatial helpers for Location.point and the event queries built on it."""
+
+import math
+
+from django.contrib.gis.db.models.functions import GeoFunc
+from django.contrib.gis.geos import Point
+from django.contrib.gis.geos import Polygon
+from django.db.models import FloatField
+
+SRID = 4326
+WEB_MERCATOR_SRID = 3857
+# Length of a degree of latitude; a degree of longitude shrinks with cos(lat).
+METERS_PER_DEGREE = 111_320
+MAX_RADIUS = 2_000_000  # meters
+
+
+class KNNDistance(GeoFunc):
+    """
+    ``a <-> b``: the bounding-box distance operator. Ordering by it walks a
+    GiST index nearest first, so ``ORDER BY ... LIMIT k`` reads about k rows.
+    """
+
+    function = ""
+    template = "%(expressions)s"
+    arg_joiner = " <-> "
+    geom_param_pos = (0, 1)
+    output_field = FloatField()
+
+
+def make_point(longitude, latitude):
+    if longitude is None or latitude is None:
+        return None
+    return Point(float(longitude), float(latitude), srid=SRID)
+
+
+def parse_point(value):
+    """``"lon,lat"`` as a Point; raises ValueError."""
+    longitude, latitude = (float(part) for part in value.split(","))
+    if not (-180 <= longitude <= 180 and -90 <= latitude <= 90):  # noqa: PLR2004
+        msg = "Coordinates out of range."
+        raise ValueError(msg)
+    return make_point(longitude, latitude)
+
+
+def parse_bbox(value):
+    """``"west,south,east,north"`` as a Polygon; raises ValueError."""
+    west, south, east, north = (float(part) for part in value.split(","))
+    if not (west < east and south < north):
+        msg = "Expected west,south,east,north."
+        raise ValueError(msg)
+    polygon = Polygon.from_bbox((west, south, east, north))
+    polygon.srid = SRID
+    return polygon
+
+
+def radius_degrees(point, meters):
+    """
+    A radius in degrees that covers ``meters`` around ``point`` in every
+    direction, for an index-assisted ``ST_DWithin`` prefilter. It overshoots
+    away from the equator; an exact distance test does the rest.
+    """
+    latitude = min(abs(point.y) + meters / METERS_PER_DEGREE, 89.0)
+    return meters / (METERS_PER_DEGREE * math.cos(math.radians(latitude)))
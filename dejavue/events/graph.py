@@ -0,0 +1,303 @@
+"""In-memory snapshot of the HistoricalConnection graph."""
+
+import heapq
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+from django.utils import timezone
+
+ARRAYS = ("node_ids", "offsets", "targets", "weights", "edge_ids")
+CURRENT = "CURRENT"
+MAX_DEPTH = 5
+MAX_NODES = 5000
+# Connections committed late can carry an updated_at slightly older than the
+# previous refresh; re-reading a short window picks them up. Merging is
+# idempotent, so rows read twice are harmless.
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+
+class GraphUnavailableError(LookupError):
+    """No snapshot has been published yet; refresh_connection_graph builds one."""
+
+
+def _current_version(directory):
+    try:
+        return (Path(directory) / CURRENT).read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _columns(rows):
+    """Split ``(id, source_id, target_id, strength)`` rows into arrays."""
+    rows = list(rows)
+    edge_ids = np.fromiter((row[0] for row in rows), np.int64, len(rows))
+    sources = np.fromiter((row[1] for row in rows), np.int64, len(rows))
+    targets = np.fromiter((row[2] for row in rows), np.int64, len(rows))
+    weights = np.fromiter((row[3] for row in rows), np.float64, len(rows))
+    return edge_ids, sources, targets, weights
+
+
+@dataclass(frozen=True)
+class GraphSnapshot:
+    """
+    Directed graph of HistoricalConnection in compressed sparse row form.
+
+    Entities are numbered by their position in the sorted ``node_ids``. The
+    connections leaving entity ``i`` are ``targets[offsets[i]:offsets[i + 1]]``
+    (entity positions), with their strength in ``weights`` and connection
+    primary key in ``edge_ids``. ``built_at`` is when the rows were read.
+    """
+
+    node_ids: np.ndarray
+    offsets: np.ndarray
+    targets: np.ndarray
+    weights: np.ndarray
+    edge_ids: np.ndarray
+    built_at: datetime | None = None
+
+    @classmethod
+    def from_edges(cls, edge_ids, sources, targets, weights, built_at=None):
+        node_ids = np.unique(np.concatenate([sources, targets]))
+        rows = np.searchsorted(node_ids, sources)
+        columns = np.searchsorted(node_ids, targets)
+        order = np.lexsort((columns, rows))
+        offsets = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(node_ids)), out=offsets[1:])
+        return cls(
+            node_ids=node_ids,
+            offsets=offsets,
+            targets=columns[order].astype(np.int32),
+            weights=weights[order],
+            edge_ids=edge_ids[order],
+            built_at=built_at,
+        )
+
+    @classmethod
+    def from_rows(cls, rows, built_at=None):
+        edge_ids, sources, targets, weights = _columns(rows)
+        return cls.from_edges(edge_ids, sources, targets, weights, built_at=built_at)
+
+    def __len__(self):
+        return len(self.edge_ids)
+
+    def edges(self):
+        """``(edge_ids, source_ids, target_ids, weights)`` arrays."""
+        sources = np.repeat(self.node_ids, np.diff(self.offsets))
+        return self.edge_ids, sources, self.node_ids[self.targets], self.weights
+
+    def merge(self, rows, built_at=None):
+        """
+        A new snapshot with ``rows`` added, replacing the connections with
+        the same primary keys. Deleted connections are not detected here.
+        """
+        changed = _columns(rows)
+        keep = ~np.isin(self.edge_ids, changed[0])
+        edge_ids, sources, targets, weights = (
+            np.concatenate([old[keep], new])
+            for old, new in zip(self.edges(), changed, strict=True)
+        )
+        return self.from_edges(edge_ids, sources, targets, weights, built_at=built_at)
+
+    def retain(self, edge_ids, built_at=None):
+        """A new snapshot with only the connections whose keys are in ``edge_ids``."""
+        keep = np.isin(self.edge_ids, edge_ids)
+        ids, sources, targets, weights = (column[keep] for column in self.edges())
+        return self.from_edges(ids, sources, targets, weights, built_at=built_at)
+
+    def index(self, entity_id):
+        i = int(np.searchsorted(self.node_ids, entity_id))
+        if i < len(self.node_ids) and self.node_ids[i] == entity_id:
+            return i
+        return None
+
+    def _out(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.targets[start:end].tolist(), self.weights[start:end].tolist()
+
+    def neighbourhood(self, entity_id, depth=2, limit=MAX_NODES):
+        """``(entity_id, hops)`` for entities within ``depth`` hops, nearest first."""
+        root = self.index(entity_id)
+        if root is None:
+            return []
+        seen = {root}
+        frontier, found = [root], []
+        for hops in range(1, depth + 1):
+            reached = []
+            for i in frontier:
+                for j in self._out(i)[0]:
+                    if j not in seen:
+                        seen.add(j)
+                        reached.append(j)
+            found += [(int(self.node_ids[j]), hops) for j in sorted(reached)]
+            if not reached or len(found) >= limit:
+                break
+            frontier = reached
+        return found[:limit]
+
+    def shortest_path(self, source_id, target_id):
+        """
+        ``(entity_ids, cost)`` of the cheapest path from ``source_id`` to
+        ``target_id``, or None. A connection costs ``1 / strength``, so
+        strong connections make short paths; non-positive strengths are
+        not followed.
+        """
+        source, target = self.index(source_id), self.index(target_id)
+        if source is None or target is None:
+            return None
+        costs = {source: 0.0}
+        previous: dict[int, int] = {}
+        queue = [(0.0, source)]
+        while queue:
+            cost, i = heapq.heappop(queue)
+            if i == target:
+                path = [i]
+                while path[-1] != source:
+                    path.append(previous[path[-1]])
+                return [int(self.node_ids[j]) for j in reversed(path)], cost
+            if cost > costs[i]:
+                continue
+            for j, strength in zip(*self._out(i), strict=True):
+                if strength <= 0:
+                    continue
+                candidate = cost + 1 / strength
+                if candidate < costs.get(j, float("inf")):
+                    costs[j], previous[j] = candidate, i
+                    heapq.heappush(queue, (candidate, j))
+        return None
+
+    def save(self, directory):
+        """Write a new version under ``directory`` and make it current."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        version = f"{time.time_ns()}-{os.getpid()}"
+        staging = directory / f".{version}"
+        staging.mkdir()
+        for name in ARRAYS:
+            np.save(staging / f"{name}.npy", getattr(self, name))
+        built_at = self.built_at.isoformat() if self.built_at else None
+        (staging / "meta.json").write_text(json.dumps({"built_at": built_at}))
+        staging.rename(directory / version)
+        previous = _current_version(directory)
+        pointer = directory / f".{CURRENT}-{version}"
+        pointer.write_text(version)
+        pointer.replace(directory / CURRENT)
+        # Readers keep their memory maps of older versions valid after unlink.
+        # The previous version stays for readers that have just read CURRENT
+        # but not loaded it yet.
+        live = {version, previous, _current_version(directory)}
+        for path in directory.iterdir():
+            if path.is_dir() and path.name not in live and path.name[0] != ".":
+                shutil.rmtree(path, ignore_errors=True)
+        return version
+
+    @classmethod
+    def load(cls, directory, version):
+        """Memory-map ``version`` from ``directory`` read-only."""
+        path = Path(directory) / version
+        meta = json.loads((path / "meta.json").read_text())
+        return cls(
+            **{name: np.load(path / f"{name}.npy", mmap_mode="r") for name in ARRAYS},
+            built_at=meta["built_at"] and datetime.fromisoformat(meta["built_at"]),
+        )
+
+
+class GraphStore:
+    """
+    Process-wide access to the current :class:`GraphSnapshot`.
+
+    Snapshots live as ``.npy`` files under ``GRAPH_SNAPSHOT_DIR`` and are
+    memory-mapped, so every worker on a host shares one copy in the page
+    cache. A ``CURRENT`` file names the live version; workers re-read it
+    every ``check_interval`` seconds and switch when it changes. Writers
+    (:meth:`refresh`, run from Celery) publish a new version atomically.
+    """
+
+    check_interval = 5.0
+
+    def __init__(self, directory=None):
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._loaded = (None, None, None)  # (directory, version, snapshot)
+        self._checked_at = 0.0
+
+    @property
+    def directory(self):
+        return Path(self._directory or settings.GRAPH_SNAPSHOT_DIR)
+
+    def get(self):
+        """
+        The current snapshot. Raises :class:`GraphUnavailableError` until
+        :meth:`refresh` has published one; requests never build it.
+        """
+        directory = self.directory
+        now = time.monotonic()
+        loaded_from, version, _ = self._loaded
+        if loaded_from != directory or now - self._checked_at > self.check_interval:
+            with self._lock:
+                current = self._version()
+                if current is None:
+                    msg = f"No connection graph snapshot in {directory}."
+                    raise GraphUnavailableError(msg)
+                if (loaded_from, version) != (directory, current):
+                    try:
+                        snapshot = GraphSnapshot.load(directory, current)
+                    except FileNotFoundError:
+                        # Pruned by two publishes since CURRENT was read.
+                        current = self._version()
+                        snapshot = GraphSnapshot.load(directory, current)
+                    self._loaded = (directory, current, snapshot)
+                self._checked_at = now
+        return self._loaded[2]
+
+    def refresh(self, *, full=False):
+        """
+        Publish a snapshot that includes every connection changed since the
+        current one was built: one query for the changed rows and one for the
+        keys of all connections, which drops the deleted ones. Falls back to a
+        full rebuild, one bulk read, when there is no snapshot yet, when
+        ``full`` is set, or when a connection was missed.
+        """
+        connection_model = apps.get_model("events", "HistoricalConnection")
+        queryset = connection_model.objects.values_list(
+            "id",
+            "source_id",
+            "target_id",
+            "strength",
+        )
+        built_at = timezone.now()
+        current = self._version()
+        snapshot = None
+        if current is not None and not full:
+            previous = GraphSnapshot.load(self.directory, current)
+            if previous.built_at is not None:
+                live = np.fromiter(
+                    connection_model.objects.values_list("id", flat=True).iterator(),
+                    np.int64,
+                )
+                changed = queryset.filter(
+                    updated_at__gte=previous.built_at - REFRESH_OVERLAP,
+                )
+                snapshot = previous.merge(changed).retain(live, built_at=built_at)
+                if len(snapshot) != len(live):
+                    snapshot = None
+        if snapshot is None:
+            snapshot = GraphSnapshot.from_rows(queryset.iterator(), built_at=built_at)
+        version = snapshot.save(self.directory)
+        self._loaded = (self.directory, version, snapshot)
+        return snapshot
+
+    def _version(self):
+        return _current_version(self.directory)
+
+
+connection_graph = GraphStore()
@@ -0,0 +1,94 @@
+"""Which GeopoliticalImpact geometries cover a point."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.apps import apps
+from django.db import transaction
+
+from .cache import bump_generation
+from .cache import get_generation
+
+IMPACT_NAMESPACE = "events:impacts"
+PREPARED_CACHE_SIZE = 256
+
+
+class ImpactLocator:
+    """
+    Point-in-polygon lookups over GeopoliticalImpact.
+
+    Candidates come from a bounding-box test the GiST index on ``geometry``
+    answers alone; the exact test then runs here against prepared GEOS
+    geometries. The ``maxsize`` most recently hit impacts stay prepared in
+    this process, so repeated clicks on the same regions neither transfer
+    nor parse their WKB again. Saving or deleting an impact bumps a shared
+    generation on commit and empties the cache of this process then, and of
+    every other one within ``check_interval`` seconds.
+    """
+
+    check_interval = 5.0
+
+    def __init__(self, maxsize=PREPARED_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._prepared = OrderedDict()
+        self._generation = None
+        self._checked_at = 0.0
+
+    def covering(self, point):
+        """Ids of the impacts whose geometry covers ``point``, ascending."""
+        model = apps.get_model("events", "GeopoliticalImpact")
+        candidates = list(
+            model.objects.filter(geometry__bbcontains=point)
+            .order_by("pk")
+            .values_list("pk", flat=True),
+        )
+        prepared = self._get_many(candidates)
+        missing = [pk for pk in candidates if pk not in prepared]
+        if missing:
+            rows = model.objects.filter(pk__in=missing).values_list("pk", "geometry")
+            loaded = {pk: geometry.prepared for pk, geometry in rows}
+            self._put_many(loaded)
+            prepared.update(loaded)
+        return [
+            pk for pk in candidates if pk in prepared and prepared[pk].covers(point)
+        ]
+
+    def invalidate(self):
+        def reset():
+            bump_generation(IMPACT_NAMESPACE)
+            with self._lock:
+                self._prepared.clear()
+                self._generation = None
+
+        transaction.on_commit(reset)
+
+    def _get_many(self, pks):
+        self._check()
+        with self._lock:
+            found = {}
+            for pk in pks:
+                if pk in self._prepared:
+                    self._prepared.move_to_end(pk)
+                    found[pk] = self._prepared[pk]
+            return found
+
+    def _put_many(self, prepared):
+        with self._lock:
+            self._prepared.update(prepared)
+            while len(self._prepared) > self.maxsize:
+                self._prepared.popitem(last=False)
+
+    def _check(self):
+        now = time.monotonic()
+        if self._generation is None or now - self._checked_at > self.check_interval:
+            generation = get_generation(IMPACT_NAMESPACE)
+            with self._lock:
+                if generation != self._generation:
+                    self._prepared.clear()
+                    self._generation = generation
+                self._checked_at = now
+
+
+impact_locator = ImpactLocator()
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+from django.db.models import Min
+
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.search import SEARCH_VECTOR
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill HistoricalEvent.search_vector in id-range batches, each in its "
+        "own short transaction. New and edited rows are kept up to date by a "
+        "database trigger; this is for rows written before it existed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every row, not only rows without a vector.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = HistoricalEvent.objects.all()
+        if not options["all"]:
+            queryset = queryset.filter(search_vector__isnull=True)
+        bounds = queryset.aggregate(low=Min("id"), high=Max("id"))
+        if bounds["low"] is None:
+            self.stdout.write("Nothing to backfill.")
+            return
+
+        updated = 0
+        for start in range(bounds["low"], bounds["high"] + 1, batch_size):
+            updated += queryset.filter(
+                id__gte=start,
+                id__lt=start + batch_size,
+            ).update(search_vector=SEARCH_VECTOR)
+            self.stdout.write(
+                f"Updated {updated} events (up to id {start + batch_size - 1}).",
+            )
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} events."))
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from dejavue.events.exporters import EXPORT_CHUNK_SIZE
+from dejavue.events.exporters import iter_events_ndjson
+
+
+class Command(BaseCommand):
+    help = "Export every historical event as NDJSON from one consistent snapshot."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Output file, or '-' for stdout.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        chunks = iter_events_ndjson(chunk_size=options["chunk_size"])
+        if options["output"] == "-":
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+        with Path(options["output"]).open("w") as stream:
+            stream.writelines(chunks)
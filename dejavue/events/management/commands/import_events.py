@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from dejavue.events.importers import EventImporter
+from dejavue.events.importers import read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import historical events from a CSV or JSON Lines file. "
+        "Rows are written in batches; when a batch fails validation the "
+        "import stops and earlier batches stay committed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--skip-invalid",
+            action="store_true",
+            help="Report and skip invalid rows instead of stopping.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or Path(path).suffix.lstrip(".").lower()
+        if fmt not in {"csv", "jsonl"}:
+            msg = "Cannot infer the input format; pass --format."
+            raise CommandError(msg)
+
+        importer = EventImporter(
+            batch_size=options["batch_size"],
+            skip_invalid=options["skip_invalid"],
+        )
+        stream = sys.stdin if path == "-" else Path(path).open(newline="")  # noqa: SIM115
+        try:
+            result = importer.run(read_rows(stream, fmt))
+        except ValidationError as exc:
+            raise CommandError("\n".join(exc.messages)) from exc
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for line, message in result.errors:
+            self.stderr.write(f"line {line}: {message}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.created} events ({result.skipped} skipped).",
+            ),
+        )
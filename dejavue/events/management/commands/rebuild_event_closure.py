@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from dejavue.events.related import rebuild_closure
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the EventClosure table from HistoricalEvent.related_events. "
+        "It is kept up to date as edges change; use this after loading edges "
+        "in bulk or to repair drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        with transaction.atomic(using=using):
+            written = rebuild_closure(using=using)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} closure rows."))
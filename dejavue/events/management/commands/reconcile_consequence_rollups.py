@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.rollups import refresh_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute consequence rollups for every event from Consequence, in "
+        "id-ordered batches, each in its own short transaction. Rollups are "
+        "kept up to date as consequences change; this repairs drift and fills "
+        "them for rows written before they existed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        ids = HistoricalEvent.objects.order_by("id").values_list("id", flat=True)
+        last_id, reconciled = 0, 0
+        while batch := list(ids.filter(id__gt=last_id)[:batch_size]):
+            with transaction.atomic():
+                refresh_events(batch)
+            reconciled += len(batch)
+            last_id = batch[-1]
+            self.stdout.write(f"Reconciled {reconciled} events (up to id {last_id}).")
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {reconciled} events."))
@@ -0,0 +1,120 @@
+from django.contrib.gis.measure import D
+from django.contrib.postgres.search import SearchRank
+from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateRange
+
+from .geo import KNNDistance
+from .geo import radius_degrees
+from .related import neighbourhood
+from .search import search_headline
+from .search import search_query
+
+
+def _date_range(start, end):
+    """Closed range ``[start, end]``; a missing bound is unbounded."""
+    return DateRange(start, end, "[]")
+
+
+class HistoricalEventQuerySet(models.QuerySet):
+    """Custom queryset for the HistoricalEvent model."""
+
+    def with_related(self):
+        """
+        Join every foreign key and prefetch every many-to-many relation,
+        so serializing a page of events costs a fixed number of queries.
+        """
+        return self.select_related(
+            "era",
+            "category",
+            "location",
+        ).prefetch_related(
+            "categories",
+            "key_figures",
+            "tags",
+        )
+
+    # The lookups below run against the generated ``period`` daterange and
+    # are answered by its GiST index.
+
+    def overlapping(self, start, end):
+        """Events active at any point between ``start`` and ``end``."""
+        return self.filter(period__overlap=_date_range(start, end))
+
+    def contained_in(self, start, end):
+        """Events that begin and end between ``start`` and ``end``."""
+        return self.filter(period__contained_by=_date_range(start, end))
+
+    def active_at(self, date):
+        """Events active on ``date``."""
+        return self.filter(period__contains=_date_range(date, date))
+
+    def search(self, text):
+        """
+        Events matching ``text`` (web search syntax), best first, annotated
+        with ``rank`` and a highlighted ``headline`` from the description.
+        """
+        query = search_query(text)
+        return (
+            self.filter(search_vector=query)
+            .annotate(
+                rank=SearchRank(models.F("search_vector"), query),
+                headline=search_headline("description", query),
+            )
+            .order_by("-rank", "id")
+        )
+
+    def neighbourhood(self, root, **kwargs):
+        """
+        Events within a few hops of ``root`` along ``related_events``, each
+        with its ``distance``; see :func:`events.related.neighbourhood`.
+        Filters on this queryset do not apply.
+        """
+        return neighbourhood(self, root, **kwargs)
+
+    # Spatial lookups through location.point, answered by its GiST index.
+
+    def in_bbox(self, bbox):
+        """Events located inside the ``bbox`` polygon (bounding-box overlap)."""
+        return self.filter(location__point__bboverlaps=bbox)
+
+    def within(self, point, meters):
+        """
+        Events located within ``meters`` of ``point``: an indexed
+        ``ST_DWithin`` prefilter in degrees, then an exact spherical distance.
+        """
+        return self.filter(
+            location__point__dwithin=(point, radius_degrees(point, meters)),
+            location__point__distance_lte=(point, D(m=meters)),
+        )
+
+    def nearest(self, point):
+        """Located events, nearest to ``point`` first; slice to take k."""
+        return self.filter(location__point__isnull=False).order_by(
+            KNNDistance("location__point", point),
+            "id",
+        )
+
+    # Reachability, answered from the EventClosure table in a single join.
+
+    def downstream_of(self, event, max_depth=None):
+        """
+        Events reachable from ``event`` along ``related_events``, annotated
+        with the shortest ``distance`` to them.
+        """
+        return self._closure("ancestor_links", event, max_depth)
+
+    def upstream_of(self, event, max_depth=None):
+        """
+        Events from which ``event`` is reachable along ``related_events``,
+        annotated with the shortest ``distance`` from them.
+        """
+        return self._closure("descendant_links", event, max_depth)
+
+    def _closure(self, links, event, max_depth):
+        other = "ancestor" if links == "ancestor_links" else "descendant"
+        lookups = {f"{links}__{other}": event}
+        if max_depth is not None:
+            lookups[f"{links}__depth__lte"] = max_depth
+        return self.filter(**lookups).annotate(
+            distance=models.F(f"{links}__depth"),
+        )
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.9 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=models.Index(
+                fields=["start_date", "id"],
+                name="events_event_start_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timelineevent",
+            index=models.Index(
+                fields=["timeline", "order", "id"],
+                name="events_tlevent_order_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.9 on 2026-10-17 11:40
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0002_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalevent",
+            name="period",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Func(
+                    "start_date",
+                    django.db.models.functions.comparison.Coalesce(
+                        "end_date", "start_date"
+                    ),
+                    models.Value("[]"),
+                    function="daterange",
+                    output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+                ),
+                output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["period"],
+                name="events_event_period_gist",
+            ),
+        ),
+    ]
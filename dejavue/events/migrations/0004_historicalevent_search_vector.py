@@ -0,0 +1,54 @@
+# Generated by Django 5.0.9 on 2026-10-17 13:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Mirrors events.search.SEARCH_VECTOR.
+CREATE_TRIGGER = """
+CREATE FUNCTION events_historicalevent_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector(
+            'english', coalesce(NEW.name, '') || ' ' || coalesce(NEW.title, '')
+        ), 'A')
+        || setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(NEW.sources, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER events_historicalevent_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, title, description, sources
+    ON events_historicalevent
+    FOR EACH ROW EXECUTE FUNCTION events_historicalevent_search_vector_update();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER events_historicalevent_search_vector_trigger ON events_historicalevent;
+DROP FUNCTION events_historicalevent_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0003_historicalevent_period"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalevent",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"],
+                name="events_event_search_gin",
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, reverse_sql=DROP_TRIGGER),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.9 on 2026-10-17 14:21
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0004_historicalevent_search_vector"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="events_event_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="location",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="events_location_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="location",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["modern_name"],
+                name="events_location_modern_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historicalfigure",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="events_figure_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
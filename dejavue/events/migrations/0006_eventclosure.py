@@ -0,0 +1,66 @@
+# Generated by Django 5.0.9 on 2026-10-17 15:03
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+def build_closure(apps, schema_editor):
+    from dejavue.events.related import rebuild_closure
+
+    rebuild_closure(using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0005_trigram_name_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="events.historicalevent",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="events.historicalevent",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "ancestor"],
+                        name="events_closure_desc_anc_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ancestor", "descendant"),
+                        name="events_closure_pair_uniq",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(build_closure, migrations.RunPython.noop),
+    ]
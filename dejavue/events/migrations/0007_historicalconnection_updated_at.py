@@ -0,0 +1,24 @@
+# Generated by Django 5.0.9 on 2026-10-17 15:40
+
+import django.utils.timezone
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0006_eventclosure"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalconnection",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                db_index=True,
+                default=django.utils.timezone.now,
+            ),
+            preserve_default=False,
+        ),
+    ]
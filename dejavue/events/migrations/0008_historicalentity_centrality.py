@@ -0,0 +1,40 @@
+# Generated by Django 5.0.9 on 2026-10-17 16:25
+
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0007_historicalconnection_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalentity",
+            name="pagerank",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="historicalentity",
+            name="degree",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="historicalentity",
+            name="betweenness",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="historicalentity",
+            name="scored_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="historicalentity",
+            index=models.Index(
+                fields=["pagerank", "id"],
+                name="events_entity_pagerank_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.0.9 on 2026-10-17 17:10
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0008_historicalentity_centrality"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="historicalevent",
+            name="consequence_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="historicalevent",
+            name="consequence_impact_avg",
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="historicalevent",
+            name="consequence_impact_max",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=models.Index(
+                fields=["consequence_impact_max", "id"],
+                name="events_event_impact_id_idx",
+            ),
+        ),
+        migrations.CreateModel(
+            name="ConsequenceRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("timeframe", models.CharField(max_length=100)),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("impact_avg", models.FloatField(default=0)),
+                ("impact_max", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="consequence_rollups",
+                        to="events.historicalevent",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("event", "timeframe"),
+                        name="events_rollup_event_timeframe_uniq",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.9 on 2026-10-17 17:55
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_consequence_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="location",
+            name="point",
+            field=django.contrib.gis.db.models.fields.PointField(
+                blank=True,
+                editable=False,
+                null=True,
+                srid=4326,
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE events_location
+                SET point = ST_SetSRID(
+                    ST_MakePoint(longitude::float8, latitude::float8),
+                    4326
+                )
+                WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
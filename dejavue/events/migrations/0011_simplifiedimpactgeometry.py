@@ -0,0 +1,50 @@
+# Generated by Django 5.0.9 on 2026-10-17 18:05
+
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0010_location_point"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SimplifiedImpactGeometry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("zoom", models.PositiveSmallIntegerField()),
+                (
+                    "geometry",
+                    django.contrib.gis.db.models.fields.GeometryField(srid=3857),
+                ),
+                (
+                    "impact",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="simplified_geometries",
+                        to="events.geopoliticalimpact",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("zoom", "impact"),
+                        name="events_simplified_zoom_impact_uniq",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.0.9 on 2026-10-17 18:40
+
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+
+def footprint_fields():
+    return [
+        (
+            "footprint",
+            django.contrib.gis.db.models.fields.GeometryField(
+                blank=True,
+                null=True,
+                srid=4326,
+            ),
+        ),
+        ("area", models.FloatField(default=0)),
+        ("affected_population", models.BigIntegerField(default=0)),
+        ("gross_population", models.BigIntegerField(default=0)),
+        ("impact_count", models.PositiveIntegerField(default=0)),
+        ("stale", models.BooleanField(db_index=True, default=True)),
+        ("changed_at", models.DateTimeField(auto_now_add=True)),
+        ("computed_at", models.DateTimeField(blank=True, null=True)),
+    ]
+
+
+MARK_EXISTING = """
+INSERT INTO events_eventimpactfootprint (
+    event_id, area, affected_population, gross_population, impact_count,
+    stale, changed_at
+)
+SELECT DISTINCT event_id, 0, 0, 0, 0, true, now()
+FROM events_geopoliticalimpact
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0011_simplifiedimpactgeometry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventImpactFootprint",
+            fields=[
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="impact_footprint",
+                        serialize=False,
+                        to="events.historicalevent",
+                    ),
+                ),
+                *footprint_fields(),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="EraImpactFootprint",
+            fields=[
+                (
+                    "era",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="impact_footprint",
+                        serialize=False,
+                        to="events.era",
+                    ),
+                ),
+                *footprint_fields(),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        # Queue every event that already has impacts for the first run.
+        migrations.RunSQL(MARK_EXISTING, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.9 on 2026-10-17 19:10
+
+import django.utils.timezone
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0012_impact_footprints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="timeline",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="timelineevent",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+            ),
+            preserve_default=False,
+        ),
+    ]
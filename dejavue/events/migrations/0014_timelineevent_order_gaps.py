@@ -0,0 +1,26 @@
+# Generated by Django 5.0.9 on 2026-10-17 19:40
+
+from django.db import migrations
+
+# Space existing rows 1024 apart, keeping their order.
+SPREAD_ORDER = """
+UPDATE events_timelineevent AS timeline_event
+SET "order" = ranked.position * 1024
+FROM (
+    SELECT id, row_number() OVER (
+        PARTITION BY timeline_id ORDER BY "order", id
+    ) AS position
+    FROM events_timelineevent
+) AS ranked
+WHERE timeline_event.id = ranked.id
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0013_timeline_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunSQL(SPREAD_ORDER, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.0.9 on 2026-10-17 21:10
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0014_timelineevent_order_gaps"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="historicalevent",
+            name="events_event_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="historicalfigure",
+            name="events_figure_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="location",
+            name="events_location_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="location",
+            name="events_location_modern_trgm",
+        ),
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="events_event_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="historicalfigure",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="events_figure_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="location",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="events_location_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="location",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("modern_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="events_location_modern_trgm",
+            ),
+        ),
+    ]
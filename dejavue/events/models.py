@@ -1,14 +1,32 @@
 from django.contrib.gis.db import models
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
 from django.core.validators import MinValueValidator
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Upper
 from django.utils.text import slugify
-
 from taggit.managers import TaggableManager
 
+from .eras import era_index
+from .geo import SRID
+from .geo import WEB_MERCATOR_SRID
+from .geo import make_point
+from .managers import HistoricalEventQuerySet
+
+ROLLUP_FIELDS = {
+    "consequence_count",
+    "consequence_impact_avg",
+    "consequence_impact_max",
+}
+
 
 def validate_date_order(start_date, end_date):
-    if start_date > end_date:
+    if end_date is not None and start_date > end_date:
         msg = "Start date must be before end date."
         raise ValidationError(msg)
 
@@ -17,16 +35,28 @@ class HistoricalEvent(models.Model):
     """represents a specific historical event with its
     details, category, tags, and related events."""
 
+    IMPACT_LEVELS = [(1, "Low"), (2, "Medium"), (3, "High")]
+
     name = models.CharField(max_length=255)
     start_date = models.DateField()
     end_date = models.DateField(
         null=True,
         blank=True,
     )  # For events that span multiple dates
-    description = models.TextField()
-    impact_level = models.IntegerField(
-        choices=[(1, "Low"), (2, "Medium"), (3, "High")],
+    # [start_date, end_date]; events without an end date last a single day
+    period = models.GeneratedField(
+        expression=models.Func(
+            "start_date",
+            Coalesce("end_date", "start_date"),
+            models.Value("[]"),
+            function="daterange",
+            output_field=DateRangeField(),
+        ),
+        output_field=DateRangeField(),
+        db_persist=True,
     )
+    description = models.TextField()
+    impact_level = models.IntegerField(choices=IMPACT_LEVELS)
     location = models.ForeignKey(
         "events.Location",
         on_delete=models.SET_NULL,
@@ -46,6 +76,15 @@ class HistoricalEvent(models.Model):
         validators=[MinValueValidator(1), MaxValueValidator(10)],
     )
     sources = models.TextField(blank=True)  # References and citations
+    # Maintained by a database trigger, see events.search.SEARCH_VECTOR
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    # Rolled up from Consequence by events.rollups
+    consequence_count = models.PositiveIntegerField(default=0, editable=False)
+    consequence_impact_avg = models.FloatField(default=0, editable=False)
+    consequence_impact_max = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -62,16 +101,92 @@ class HistoricalEvent(models.Model):
 
     tags = TaggableManager()
 
+    objects = HistoricalEventQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Keyset pagination on (start_date, id)
+            models.Index(fields=["start_date", "id"], name="events_event_start_id_idx"),
+            # Keyset pagination on (consequence_impact_max, id)
+            models.Index(
+                fields=["consequence_impact_max", "id"],
+                name="events_event_impact_id_idx",
+            ),
+            # Period lookups: overlapping, contained_in and active_at
+            GistIndex(fields=["period"], name="events_event_period_gist"),
+            GinIndex(fields=["search_vector"], name="events_event_search_gin"),
+            # Autocomplete: __icontains compares UPPER(column)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="events_event_name_trgm",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
     def save(self, *args, **kwargs):
+        if self.era_id is None and self.start_date:
+            self.era_id = era_index.era_for_date(self.start_date)
         self.full_clean()  # Run validation before saving
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # Rollups are written by events.rollups; don't overwrite them with
+            # whatever this instance loaded.
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.fields
+                if field.concrete
+                and not (field.primary_key or field.generated)
+                and field.name not in ROLLUP_FIELDS
+            ]
         super().save(*args, **kwargs)
 
     def clean(self):
         validate_date_order(self.start_date, self.end_date)
 
+    def is_downstream_of(self, event):
+        """Whether this event can be reached from ``event``."""
+        return EventClosure.objects.filter(ancestor=event, descendant=self).exists()
+
+
+class EventClosure(models.Model):
+    """
+    Transitive closure of HistoricalEvent.related_events: one row for every
+    pair of events where ``descendant`` can be reached from ``ancestor``,
+    with the length of the shortest path between them. Maintained by
+    events.signals; rebuilt with the ``rebuild_event_closure`` command.
+    """
+
+    ancestor = models.ForeignKey(
+        "events.HistoricalEvent",
+        on_delete=models.CASCADE,
+        related_name="descendant_links",
+    )
+    descendant = models.ForeignKey(
+        "events.HistoricalEvent",
+        on_delete=models.CASCADE,
+        related_name="ancestor_links",
+    )
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"],
+                name="events_closure_pair_uniq",
+            ),
+        ]
+        indexes = [
+            # Upstream lookups; downstream ones use the unique constraint
+            models.Index(
+                fields=["descendant", "ancestor"],
+                name="events_closure_desc_anc_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
 
 class Document(models.Model):
     title = models.CharField(max_length=255)
@@ -196,10 +311,32 @@ class Location(models.Model):
     )
     modern_name = models.CharField(max_length=200, blank=True)
     country = models.CharField(max_length=100, blank=True)
+    # Kept in step with latitude/longitude on save; GiST indexed
+    point = models.PointField(srid=SRID, null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Autocomplete: __icontains compares UPPER(column)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="events_location_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("modern_name"), name="gin_trgm_ops"),
+                name="events_location_modern_trgm",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.point = make_point(self.longitude, self.latitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & {*update_fields}:
+            kwargs["update_fields"] = {*update_fields, "point"}
+        super().save(*args, **kwargs)
+
 
 class Category(models.Model):
     """Categories for historical events (e.g., Military, Cultural, Economic)"""
@@ -239,6 +376,15 @@ class HistoricalFigure(models.Model):
         blank=True,
     )
 
+    class Meta:
+        indexes = [
+            # Autocomplete: __icontains compares UPPER(column)
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="events_figure_name_trgm",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -264,6 +410,31 @@ class Consequence(models.Model):
         return f"Consequence of {self.event}"
 
 
+class ConsequenceRollup(models.Model):
+    """Consequence count and impact of an event per timeframe; see events.rollups"""
+
+    event = models.ForeignKey(
+        "events.HistoricalEvent",
+        on_delete=models.CASCADE,
+        related_name="consequence_rollups",
+    )
+    timeframe = models.CharField(max_length=100)
+    count = models.PositiveIntegerField(default=0)
+    impact_avg = models.FloatField(default=0)
+    impact_max = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "timeframe"],
+                name="events_rollup_event_timeframe_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} {self.timeframe}: {self.count}"
+
+
 class AlternativeScenario(models.Model):
     """What-if scenarios for historical events"""
 
@@ -293,6 +464,7 @@ class Timeline(models.Model):
     description = models.TextField()
     is_public = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     created_by = models.ForeignKey("users.User", on_delete=models.CASCADE)
     events = models.ManyToManyField(
@@ -310,12 +482,20 @@ class TimelineEvent(models.Model):
 
     custom_note = models.TextField(blank=True)
     order = models.IntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     timeline = models.ForeignKey("events.Timeline", on_delete=models.CASCADE)
     event = models.ForeignKey("events.HistoricalEvent", on_delete=models.CASCADE)
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            # Keyset pagination on (order, id) within a timeline
+            models.Index(
+                fields=["timeline", "order", "id"],
+                name="events_tlevent_order_id_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.timeline} - {self.event}"
@@ -370,6 +550,73 @@ class GeopoliticalImpact(models.Model):
         return f"{self.event} - {self.region}"
 
 
+class SimplifiedImpactGeometry(models.Model):
+    """GeopoliticalImpact geometry simplified for a zoom level; see events.tiles"""
+
+    impact = models.ForeignKey(
+        "events.GeopoliticalImpact",
+        on_delete=models.CASCADE,
+        related_name="simplified_geometries",
+    )
+    zoom = models.PositiveSmallIntegerField()
+    geometry = models.GeometryField(srid=WEB_MERCATOR_SRID)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["zoom", "impact"],
+                name="events_simplified_zoom_impact_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.impact_id} @ z{self.zoom}"
+
+
+class ImpactFootprint(models.Model):
+    """
+    Union of GeopoliticalImpact geometries and their affected population,
+    counting overlapping regions once; maintained by events.footprints.
+    """
+
+    footprint = models.GeometryField(null=True, blank=True)
+    area = models.FloatField(default=0)  # in square meters
+    affected_population = models.BigIntegerField(default=0)
+    # The plain sum, overlaps counted as often as they occur.
+    gross_population = models.BigIntegerField(default=0)
+    impact_count = models.PositiveIntegerField(default=0)
+    stale = models.BooleanField(default=True, db_index=True)
+    changed_at = models.DateTimeField(auto_now_add=True)
+    computed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+
+
+class EventImpactFootprint(ImpactFootprint):
+    event = models.OneToOneField(
+        "events.HistoricalEvent",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="impact_footprint",
+    )
+
+    def __str__(self):
+        return f"{self.event_id}: {self.affected_population}"
+
+
+class EraImpactFootprint(ImpactFootprint):
+    era = models.OneToOneField(
+        "events.Era",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="impact_footprint",
+    )
+
+    def __str__(self):
+        return f"{self.era_id}: {self.affected_population}"
+
+
 class HistoricalEntity(models.Model):
     """Entities in historical analysis"""
 
@@ -388,6 +635,19 @@ class HistoricalEntity(models.Model):
 
     tags = TaggableManager()
 
+    # Centrality over HistoricalConnection, recomputed in bulk by
+    # events.centrality; entities without connections score 0.
+    pagerank = models.FloatField(default=0, editable=False)
+    degree = models.PositiveIntegerField(default=0, editable=False)
+    betweenness = models.FloatField(default=0, editable=False)
+    scored_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination on (pagerank, id), most influential first
+            models.Index(fields=["pagerank", "id"], name="events_entity_pagerank_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -409,6 +669,8 @@ class HistoricalConnection(models.Model):
         related_name="outgoing_connections",
         on_delete=models.CASCADE,
     )
+    # Incremental refreshes of events.graph read rows changed since a build
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return f"{self.source} -> {self.target}"
@@ -0,0 +1,122 @@
+"""
+Gap-based ordering of TimelineEvent rows.
+
+Rows are numbered ``ORDER_GAP`` apart, so moving one writes only that row:
+it takes the midpoint of its new neighbours. When two neighbours run out of
+room between them the timeline is renumbered in a single statement, and a
+periodic task does the same for timelines whose gaps have grown thin.
+"""
+
+from django.db import connections
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Timeline
+from .models import TimelineEvent
+
+ORDER_GAP = 1024
+MAX_MOVES = 500
+# Timelines with neighbours closer than this are renumbered in the background.
+MIN_GAP = 8
+
+REBALANCE_SQL = """
+UPDATE events_timelineevent AS timeline_event
+SET "order" = ranked.position * %(gap)s, updated_at = now()
+FROM (
+    SELECT id, row_number() OVER (
+        PARTITION BY timeline_id ORDER BY "order", id
+    ) AS position
+    FROM events_timelineevent
+    WHERE timeline_id = ANY(%(ids)s::bigint[])
+) AS ranked
+WHERE timeline_event.id = ranked.id
+    AND timeline_event."order" <> ranked.position * %(gap)s
+"""
+CROWDED_SQL = """
+SELECT DISTINCT timeline_id
+FROM (
+    SELECT timeline_id, "order" - lag("order") OVER (
+        PARTITION BY timeline_id ORDER BY "order", id
+    ) AS gap
+    FROM events_timelineevent
+) AS gaps
+WHERE gap < %(min_gap)s
+ORDER BY timeline_id
+"""
+
+
+def rebalance(timeline_ids, using="default"):
+    """Renumber the rows of these timelines ``ORDER_GAP`` apart, in order."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(REBALANCE_SQL, {"ids": list(timeline_ids), "gap": ORDER_GAP})
+        return cursor.rowcount
+
+
+def crowded_timelines(min_gap=MIN_GAP, using="default"):
+    """Ids of timelines with two rows less than ``min_gap`` apart."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(CROWDED_SQL, {"min_gap": min_gap})
+        return [timeline_id for (timeline_id,) in cursor.fetchall()]
+
+
+def _slot(row, after):
+    """The order for ``row`` right after ``after`` (first if None), or None."""
+    following = TimelineEvent.objects.filter(timeline_id=row.timeline_id).exclude(
+        pk=row.pk,
+    )
+    if after is not None:
+        following = following.filter(
+            Q(order__gt=after.order) | Q(order=after.order, id__gt=after.pk),
+        )
+    upper = following.order_by("order", "id").values_list("order", flat=True).first()
+    if after is None:
+        lower = ORDER_GAP if upper is None else upper - 2 * ORDER_GAP
+    else:
+        lower = after.order
+    if upper is None:
+        upper = lower + 2 * ORDER_GAP
+    if upper - lower < 2:  # noqa: PLR2004
+        return None
+    return (lower + upper) // 2
+
+
+def apply_moves(timeline, moves):
+    """
+    Apply ``(row_id, after_id)`` moves to ``timeline`` in one transaction,
+    in turn: each row goes right after ``after_id``, or first when it is
+    None. Concurrent reorders of the same timeline wait for each other.
+    Returns the moved rows; raises ValueError for rows of other timelines.
+    """
+    with transaction.atomic():
+        Timeline.objects.select_for_update().only("id").get(pk=timeline.pk)
+        ids = {pk for move in moves for pk in move if pk is not None}
+        rows = {
+            row.pk: row
+            for row in TimelineEvent.objects.filter(
+                timeline=timeline,
+                pk__in=ids,
+            ).only("id", "order", "timeline_id")
+        }
+        if unknown := ids - rows.keys():
+            msg = f"Not rows of this timeline: {sorted(unknown)}"
+            raise ValueError(msg)
+        moved = {}
+        for row_id, after_id in moves:
+            if row_id == after_id:
+                msg = f"Cannot move row {row_id} after itself."
+                raise ValueError(msg)
+            row, after = rows[row_id], rows.get(after_id)
+            order = _slot(row, after)
+            if order is None:
+                rebalance([timeline.pk])
+                positions = TimelineEvent.objects.filter(pk__in=rows).values_list(
+                    "pk",
+                    "order",
+                )
+                for pk, position in positions:
+                    rows[pk].order = position
+                order = _slot(row, after)
+            row.order = order
+            row.save(update_fields=["order", "updated_at"])
+            moved[row.pk] = row
+        return list(moved.values())
@@ -0,0 +1,198 @@
+"""Graph queries over HistoricalEvent.related_events."""
+
+from django.db import connections
+
+MAX_DEPTH = 5
+MAX_FANOUT = 200
+MAX_NODES = 5000
+
+# (source, target) pairs of the related_events through table, per direction.
+EDGES_SQL = {
+    "out": """
+        SELECT from_historicalevent_id, to_historicalevent_id
+        FROM events_historicalevent_related_events
+    """,
+    "in": """
+        SELECT to_historicalevent_id, from_historicalevent_id
+        FROM events_historicalevent_related_events
+    """,
+}
+EDGES_SQL["both"] = f"{EDGES_SQL['out']} UNION ALL {EDGES_SQL['in']}"
+
+NEIGHBOURHOOD_SQL = """
+WITH RECURSIVE edges (source, target) AS (
+    {edges}
+),
+-- UNION rather than UNION ALL: an event reached along several paths of the
+-- same length is kept once per level, so each level holds at most one row
+-- per event and the walk grows with the graph, not with its paths.
+walk (id, depth) AS (
+    SELECT %(root)s::bigint, 0
+    UNION
+    SELECT step.target, walk.depth + 1
+    FROM walk
+    CROSS JOIN LATERAL (
+        SELECT edges.target
+        FROM edges
+        WHERE edges.source = walk.id AND edges.target <> %(root)s::bigint
+        ORDER BY edges.target
+        LIMIT %(fanout)s
+    ) AS step
+    WHERE walk.depth < %(depth)s
+),
+nearest (id, distance) AS (
+    SELECT id, MIN(depth)
+    FROM walk
+    WHERE depth > 0
+    GROUP BY id
+    ORDER BY MIN(depth), id
+    LIMIT %(limit)s
+)
+SELECT
+    event.id,
+    event.name,
+    event.start_date,
+    event.end_date,
+    event.significance_rating,
+    nearest.distance
+FROM events_historicalevent AS event
+JOIN nearest ON nearest.id = event.id
+ORDER BY nearest.distance, event.id
+"""
+
+
+def neighbourhood(queryset, root, *, depth=2, fanout=50, direction="out"):
+    """
+    Events within ``depth`` hops of ``root`` along ``related_events``, in one
+    recursive query, each annotated with its hop ``distance``.
+
+    At most ``fanout`` edges are followed out of any node and at most
+    ``MAX_NODES`` events are returned, nearest first. The walk is breadth
+    first and keeps each event once per level, so however dense the graph,
+    a level holds at most one row per event and reads at most ``fanout``
+    edges out of each. Cycles end at ``depth``. ``direction`` follows edges
+    as stored (``out``), reversed (``in``) or both ways.
+    """
+    if direction not in EDGES_SQL:
+        msg = f"direction must be one of {', '.join(EDGES_SQL)}"
+        raise ValueError(msg)
+    sql = NEIGHBOURHOOD_SQL.format(edges=EDGES_SQL[direction])
+    params = {
+        "root": root,
+        "depth": max(0, min(depth, MAX_DEPTH)),
+        "fanout": max(0, min(fanout, MAX_FANOUT)),
+        "limit": MAX_NODES,
+    }
+    return queryset.raw(sql, params)
+
+
+# Closure maintenance. Edges are read from the related_events through table
+# and written to events_eventclosure; see events.models.EventClosure.
+
+# Paths through a new edge: every ancestor of its source (and the source
+# itself) now reaches every descendant of its target (and the target).
+CLOSURE_ADD_SQL = """
+INSERT INTO events_eventclosure (ancestor_id, descendant_id, depth)
+SELECT up.id, down.id, MIN(up.depth + 1 + down.depth)
+FROM unnest(%(sources)s::bigint[], %(targets)s::bigint[]) AS edge (source, target)
+CROSS JOIN LATERAL (
+    SELECT edge.source, 0
+    UNION ALL
+    SELECT ancestor_id, depth FROM events_eventclosure
+    WHERE descendant_id = edge.source
+) AS up (id, depth)
+CROSS JOIN LATERAL (
+    SELECT edge.target, 0
+    UNION ALL
+    SELECT descendant_id, depth FROM events_eventclosure
+    WHERE ancestor_id = edge.target
+) AS down (id, depth)
+WHERE up.id <> down.id
+GROUP BY up.id, down.id
+ON CONFLICT (ancestor_id, descendant_id)
+DO UPDATE SET depth = LEAST(events_eventclosure.depth, EXCLUDED.depth)
+"""
+
+# Breadth-first rebuild, one statement per level: rows found at a shallower
+# level are inserted first, so ON CONFLICT DO NOTHING keeps shortest paths.
+CLOSURE_SEED_SQL = """
+INSERT INTO events_eventclosure (ancestor_id, descendant_id, depth)
+SELECT from_historicalevent_id, to_historicalevent_id, 1
+FROM events_historicalevent_related_events
+WHERE from_historicalevent_id <> to_historicalevent_id {scope}
+ON CONFLICT (ancestor_id, descendant_id) DO NOTHING
+"""
+CLOSURE_STEP_SQL = """
+INSERT INTO events_eventclosure (ancestor_id, descendant_id, depth)
+SELECT closure.ancestor_id, edge.to_historicalevent_id, closure.depth + 1
+FROM events_eventclosure AS closure
+JOIN events_historicalevent_related_events AS edge
+    ON edge.from_historicalevent_id = closure.descendant_id
+WHERE closure.depth = %(depth)s
+    AND edge.to_historicalevent_id <> closure.ancestor_id {scope}
+ON CONFLICT (ancestor_id, descendant_id) DO NOTHING
+"""
+CLOSURE_SCOPE = {
+    "seed": "AND from_historicalevent_id = ANY(%(ancestors)s)",
+    "step": "AND closure.ancestor_id = ANY(%(ancestors)s)",
+}
+
+
+def add_edges(edges, using="default"):
+    """Record new ``(source, target)`` related_events edges in the closure."""
+    edges = [(source, target) for source, target in edges if source != target]
+    if not edges:
+        return
+    sources, targets = zip(*edges, strict=True)
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            CLOSURE_ADD_SQL,
+            {"sources": list(sources), "targets": list(targets)},
+        )
+
+
+def ancestor_ids(event_id, using="default"):
+    """Ids of every event that reaches ``event_id``, according to the closure."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT ancestor_id FROM events_eventclosure WHERE descendant_id = %s",
+            [event_id],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def rebuild_closure(ancestors=None, using="default"):
+    """
+    Recompute the closure rows starting at ``ancestors``, or the whole table
+    when none are given, from the current related_events edges.
+
+    Removing an edge can only shorten or break paths that start at an
+    ancestor of its source, so after a removal only those rows are rebuilt.
+    Returns the number of rows written.
+    """
+    if ancestors is not None:
+        ancestors = list(ancestors)
+        if not ancestors:
+            return 0
+    scope = CLOSURE_SCOPE if ancestors is not None else {"seed": "", "step": ""}
+    params = {"ancestors": ancestors}
+    with connections[using].cursor() as cursor:
+        if ancestors is None:
+            cursor.execute("DELETE FROM events_eventclosure")
+        else:
+            cursor.execute(
+                "DELETE FROM events_eventclosure WHERE ancestor_id = ANY(%s)",
+                [ancestors],
+            )
+        cursor.execute(CLOSURE_SEED_SQL.format(scope=scope["seed"]), params)
+        written = added = cursor.rowcount
+        depth = 1
+        while added:
+            cursor.execute(
+                CLOSURE_STEP_SQL.format(scope=scope["step"]),
+                {**params, "depth": depth},
+            )
+            added = cursor.rowcount
+            written += added
+            depth += 1
+    return written
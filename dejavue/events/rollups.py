@@ -0,0 +1,83 @@
+"""Consequence rollups on HistoricalEvent and ConsequenceRollup."""
+
+from django.db import connections
+
+# A new consequence folds into the running figures without rereading the
+# others: count + 1, a re-weighted average and GREATEST for the maximum.
+ADD_SQL = (
+    """
+INSERT INTO events_consequencerollup
+    (event_id, timeframe, count, impact_avg, impact_max)
+VALUES (%(event)s, %(timeframe)s, 1, %(impact)s, %(impact)s)
+ON CONFLICT (event_id, timeframe) DO UPDATE SET
+    count = events_consequencerollup.count + 1,
+    impact_avg = (
+        events_consequencerollup.impact_avg * events_consequencerollup.count
+        + EXCLUDED.impact_avg
+    ) / (events_consequencerollup.count + 1),
+    impact_max = GREATEST(events_consequencerollup.impact_max, EXCLUDED.impact_max)
+""",
+    """
+UPDATE events_historicalevent SET
+    consequence_count = consequence_count + 1,
+    consequence_impact_avg = (
+        consequence_impact_avg * consequence_count + %(impact)s
+    ) / (consequence_count + 1),
+    consequence_impact_max = GREATEST(consequence_impact_max, %(impact)s)
+WHERE id = %(event)s
+""",
+)
+
+# Edits and deletes can lower a maximum, so the events they touch are
+# recomputed from their consequences instead.
+REFRESH_SQL = (
+    "DELETE FROM events_consequencerollup WHERE event_id = ANY(%(events)s)",
+    """
+INSERT INTO events_consequencerollup
+    (event_id, timeframe, count, impact_avg, impact_max)
+SELECT event_id, timeframe, COUNT(*), AVG(impact_level), MAX(impact_level)
+FROM events_consequence
+WHERE event_id = ANY(%(events)s)
+GROUP BY event_id, timeframe
+""",
+    """
+UPDATE events_historicalevent AS event SET
+    consequence_count = COALESCE(totals.count, 0),
+    consequence_impact_avg = COALESCE(totals.impact_avg, 0),
+    consequence_impact_max = COALESCE(totals.impact_max, 0)
+FROM unnest(%(events)s::bigint[]) AS target (id)
+LEFT JOIN (
+    SELECT
+        event_id,
+        SUM(count) AS count,
+        SUM(impact_avg * count) / SUM(count) AS impact_avg,
+        MAX(impact_max) AS impact_max
+    FROM events_consequencerollup
+    WHERE event_id = ANY(%(events)s)
+    GROUP BY event_id
+) AS totals ON totals.event_id = target.id
+WHERE event.id = target.id
+""",
+)
+
+
+def add_consequence(consequence, using="default"):
+    """Fold a newly created consequence into its event's rollups."""
+    params = {
+        "event": consequence.event_id,
+        "timeframe": consequence.timeframe,
+        "impact": consequence.impact_level,
+    }
+    with connections[using].cursor() as cursor:
+        for sql in ADD_SQL:
+            cursor.execute(sql, params)
+
+
+def refresh_events(event_ids, using="default"):
+    """Recompute the rollups of ``event_ids`` from their consequences."""
+    event_ids = sorted({pk for pk in event_ids if pk is not None})
+    if not event_ids:
+        return
+    with connections[using].cursor() as cursor:
+        for sql in REFRESH_SQL:
+            cursor.execute(sql, {"events": event_ids})
@@ -0,0 +1,51 @@
+from django.contrib.postgres.search import SearchHeadline
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Value
+from django.db.models.functions import Replace
+
+SEARCH_CONFIG = "english"
+
+# Weighted document for HistoricalEvent.search_vector. The database trigger
+# added in events/migrations/0004 builds the same vector on write; keep the
+# two in sync.
+SEARCH_VECTOR = (
+    SearchVector("name", "title", weight="A", config=SEARCH_CONFIG)
+    + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+    + SearchVector("sources", weight="C", config=SEARCH_CONFIG)
+)
+
+
+# As django.utils.html.escape; "&" first so the entities stay intact.
+HTML_ESCAPES = [
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&#x27;"),
+]
+
+
+def escape_html(expression):
+    for char, entity in HTML_ESCAPES:
+        expression = Replace(expression, Value(char), Value(entity))
+    return expression
+
+
+def search_query(text):
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def search_headline(field, query):
+    """
+    Fragments of ``field`` around the matches of ``query``, as HTML: the
+    text is escaped, then matches are wrapped in ``<mark>``.
+    """
+    return SearchHeadline(
+        escape_html(field),
+        query,
+        config=SEARCH_CONFIG,
+        start_sel="<mark>",
+        stop_sel="</mark>",
+        max_fragments=2,
+    )
@@ -0,0 +1,246 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+from taggit.models import TaggedItem
+
+from .autocomplete import AUTOCOMPLETE_NAMESPACE
+from .cache import bump_on_commit
+from .causality import CAUSALITY_NAMESPACE
+from .clustering import invalidate_points
+from .eras import era_index
+from .facets import FACET_NAMESPACE
+from .footprints import mark_stale
+from .impacts import impact_locator
+from .models import Cause
+from .models import CauseEffectRelationship
+from .models import Consequence
+from .models import Effect
+from .models import Era
+from .models import EventCategory
+from .models import GeopoliticalImpact
+from .models import HistoricalEvent
+from .models import HistoricalFigure
+from .models import Location
+from .related import add_edges
+from .related import ancestor_ids
+from .related import rebuild_closure
+from .rollups import add_consequence
+from .rollups import refresh_events
+from .tasks import simplify_impact_geometries
+from .tiles import TILE_NAMESPACE
+from .timelines import PAYLOAD_NAMESPACE
+
+
+@receiver(post_save, sender=Era)
+@receiver(post_delete, sender=Era)
+def invalidate_era_index(sender, **kwargs):
+    era_index.invalidate()
+
+
+@receiver(post_save, sender=HistoricalEvent)
+@receiver(post_delete, sender=HistoricalEvent)
+def invalidate_event_caches(sender, **kwargs):
+    bump_on_commit(AUTOCOMPLETE_NAMESPACE, FACET_NAMESPACE)
+
+
+@receiver(post_save, sender=Era)
+@receiver(post_delete, sender=Era)
+@receiver(post_save, sender=EventCategory)
+@receiver(post_delete, sender=EventCategory)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_timeline_payloads(sender, **kwargs):
+    bump_on_commit(PAYLOAD_NAMESPACE)
+
+
+@receiver(pre_save, sender=HistoricalEvent)
+def remember_event_placement(sender, instance, raw, using, **kwargs):
+    if not instance._state.adding and not raw:  # noqa: SLF001
+        instance._previous_placement = (  # noqa: SLF001
+            HistoricalEvent.objects.using(using)
+            .filter(pk=instance.pk)
+            .values_list("location_id", "era_id")
+            .first()
+        )
+
+
+def _previous_placement(instance):
+    return getattr(instance, "_previous_placement", None) or (None, None)
+
+
+@receiver(post_save, sender=HistoricalEvent)
+@receiver(post_delete, sender=HistoricalEvent)
+def invalidate_event_clusters(sender, instance, using, **kwargs):
+    location_ids = {instance.location_id, _previous_placement(instance)[0]} - {None}
+    if location_ids:
+        points = list(
+            Location.objects.using(using)
+            .filter(pk__in=location_ids)
+            .values_list("point", flat=True),
+        )
+        transaction.on_commit(lambda: invalidate_points(points), using=using)
+
+
+@receiver(post_save, sender=HistoricalEvent)
+def mark_moved_event_footprints(sender, instance, created, using, **kwargs):
+    era_ids = {instance.era_id, _previous_placement(instance)[1]}
+    if not created and len(era_ids) > 1:
+        transaction.on_commit(
+            lambda: mark_stale(era_ids=era_ids, using=using),
+            using=using,
+        )
+
+
+@receiver(post_delete, sender=HistoricalEvent)
+def mark_deleted_event_footprints(sender, instance, using, **kwargs):
+    era_id = instance.era_id
+    transaction.on_commit(
+        lambda: mark_stale(era_ids=[era_id], using=using),
+        using=using,
+    )
+
+
+@receiver(pre_save, sender=Location)
+def remember_location_point(sender, instance, raw, using, **kwargs):
+    if not instance._state.adding and not raw:  # noqa: SLF001
+        instance._cluster_point = (  # noqa: SLF001
+            Location.objects.using(using)
+            .filter(pk=instance.pk)
+            .values_list("point", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location_clusters(sender, instance, using, **kwargs):
+    points = [instance.point, getattr(instance, "_cluster_point", None)]
+    transaction.on_commit(lambda: invalidate_points(points), using=using)
+
+
+@receiver(post_save, sender=HistoricalFigure)
+@receiver(post_delete, sender=HistoricalFigure)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_autocomplete(sender, **kwargs):
+    bump_on_commit(AUTOCOMPLETE_NAMESPACE)
+
+
+@receiver(m2m_changed, sender=HistoricalEvent.categories.through)
+@receiver(m2m_changed, sender=TaggedItem)
+@receiver(post_save, sender=TaggedItem)
+@receiver(post_delete, sender=TaggedItem)
+def invalidate_facets(sender, **kwargs):
+    bump_on_commit(FACET_NAMESPACE)
+
+
+@receiver(post_save, sender=CauseEffectRelationship)
+@receiver(post_delete, sender=CauseEffectRelationship)
+@receiver(post_save, sender=Cause)
+@receiver(post_delete, sender=Cause)
+@receiver(post_save, sender=Effect)
+@receiver(post_delete, sender=Effect)
+def invalidate_causal_graph(sender, **kwargs):
+    bump_on_commit(CAUSALITY_NAMESPACE)
+
+
+@receiver(m2m_changed, sender=HistoricalEvent.related_events.through)
+def update_event_closure(sender, instance, action, using, **kwargs):
+    if action == "post_add":
+        if kwargs["reverse"]:
+            edges = [(pk, instance.pk) for pk in kwargs["pk_set"]]
+        else:
+            edges = [(instance.pk, pk) for pk in kwargs["pk_set"]]
+        add_edges(edges, using=using)
+    elif action in {"post_remove", "post_clear"}:
+        # Only paths starting at an ancestor of the removed edges' sources
+        # can change; a superset of those is this event and its ancestors.
+        affected = ancestor_ids(instance.pk, using=using) | {instance.pk}
+        rebuild_closure(affected, using=using)
+
+
+@receiver(pre_delete, sender=HistoricalEvent)
+def remember_event_ancestors(sender, instance, using, **kwargs):
+    instance._closure_ancestors = ancestor_ids(instance.pk, using=using)  # noqa: SLF001
+
+
+@receiver(post_delete, sender=HistoricalEvent)
+def rebuild_event_closure(sender, instance, using, **kwargs):
+    # Paths that ran through the deleted event are gone with its edges.
+    rebuild_closure(getattr(instance, "_closure_ancestors", set()), using=using)
+
+
+@receiver(pre_save, sender=Consequence)
+def remember_consequence_event(sender, instance, raw, using, **kwargs):
+    if not instance._state.adding and not raw:  # noqa: SLF001
+        instance._rollup_event_id = (  # noqa: SLF001
+            Consequence.objects.using(using)
+            .filter(pk=instance.pk)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Consequence)
+def update_consequence_rollups(sender, instance, created, using, **kwargs):
+    if created:
+        add_consequence(instance, using=using)
+    else:
+        # The event may have changed, and an edit can lower a maximum.
+        previous = getattr(instance, "_rollup_event_id", None)
+        refresh_events([previous, instance.event_id], using=using)
+
+
+@receiver(post_delete, sender=Consequence)
+def remove_consequence_rollups(sender, instance, using, **kwargs):
+    refresh_events([instance.event_id], using=using)
+
+
+@receiver(post_save, sender=GeopoliticalImpact)
+def simplify_impact_geometry(sender, instance, raw, using, **kwargs):
+    if raw:
+        return
+    pk = instance.pk
+    transaction.on_commit(
+        lambda: simplify_impact_geometries.delay([pk]),
+        using=using,
+    )
+    bump_on_commit(TILE_NAMESPACE)
+
+
+@receiver(post_save, sender=GeopoliticalImpact)
+@receiver(post_delete, sender=GeopoliticalImpact)
+def invalidate_impact_lookups(sender, **kwargs):
+    impact_locator.invalidate()
+
+
+@receiver(pre_save, sender=GeopoliticalImpact)
+def remember_impact_event(sender, instance, raw, using, **kwargs):
+    if not instance._state.adding and not raw:  # noqa: SLF001
+        instance._footprint_event_id = (  # noqa: SLF001
+            GeopoliticalImpact.objects.using(using)
+            .filter(pk=instance.pk)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=GeopoliticalImpact)
+@receiver(post_delete, sender=GeopoliticalImpact)
+def mark_impact_footprints(sender, instance, using, **kwargs):
+    # Deferred to commit, when an event deleted along with its impacts is
+    # gone and gets skipped.
+    event_ids = [instance.event_id, getattr(instance, "_footprint_event_id", None)]
+    transaction.on_commit(
+        lambda: mark_stale(event_ids=event_ids, using=using),
+        using=using,
+    )
+
+
+@receiver(post_delete, sender=GeopoliticalImpact)
+def invalidate_impact_tiles(sender, **kwargs):
+    bump_on_commit(TILE_NAMESPACE)
@@ -0,0 +1,53 @@
+from celery import shared_task
+
+from .cache import bump_generation
+from .centrality import score_entities
+from .clustering import PRECOMPUTE_MAX_ZOOM
+from .clustering import precompute_clusters
+from .footprints import recompute_stale
+from .graph import connection_graph
+from .ordering import crowded_timelines
+from .ordering import rebalance
+from .tiles import TILE_NAMESPACE
+from .tiles import simplify_impacts
+
+
+@shared_task()
+def refresh_connection_graph(*, full=False):
+    """Publish a HistoricalConnection graph snapshot with the latest changes."""
+    return len(connection_graph.refresh(full=full))
+
+
+@shared_task()
+def score_historical_entities():
+    """Recompute PageRank, degree and betweenness for every entity."""
+    return score_entities(connection_graph.refresh())
+
+
+@shared_task()
+def precompute_cluster_tiles(max_zoom=PRECOMPUTE_MAX_ZOOM):
+    """Cache the event clusters of the busiest map tiles at each zoom."""
+    return precompute_clusters(max_zoom)
+
+
+@shared_task()
+def simplify_impact_geometries(impact_ids=None):
+    """Precompute the per-zoom impact geometries used by the vector tiles."""
+    count = simplify_impacts(impact_ids)
+    bump_generation(TILE_NAMESPACE)
+    return count
+
+
+@shared_task()
+def recompute_impact_footprints():
+    """Bring stale event and era impact footprints up to date."""
+    return recompute_stale()
+
+
+@shared_task()
+def rebalance_timelines():
+    """Renumber timelines whose rows have run short of room between them."""
+    timeline_ids = crowded_timelines()
+    if timeline_ids:
+        rebalance(timeline_ids)
+    return len(timeline_ids)
@@ -0,0 +1,203 @@
+import datetime
+from collections.abc import Sequence
+from typing import Any
+
+from django.contrib.gis.geos import Polygon
+from factory import Faker
+from factory import LazyAttribute
+from factory import Sequence as FactorySequence
+from factory import SubFactory
+from factory import post_generation
+from factory.django import DjangoModelFactory
+
+from dejavue.events.models import Category
+from dejavue.events.models import Cause
+from dejavue.events.models import CauseEffectRelationship
+from dejavue.events.models import Consequence
+from dejavue.events.models import Effect
+from dejavue.events.models import Era
+from dejavue.events.models import EventCategory
+from dejavue.events.models import GeopoliticalImpact
+from dejavue.events.models import HistoricalConnection
+from dejavue.events.models import HistoricalEntity
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.models import HistoricalFigure
+from dejavue.events.models import Location
+from dejavue.events.models import Timeline
+from dejavue.events.models import TimelineEvent
+from dejavue.users.tests.factories import UserFactory
+
+
+class EraFactory(DjangoModelFactory[Era]):
+    name = FactorySequence(lambda n: f"Era {n}")
+    start_year = 1
+    end_year = 2100
+    description = Faker("sentence")
+    slug = FactorySequence(lambda n: f"era-{n}")
+
+    class Meta:
+        model = Era
+
+
+class EventCategoryFactory(DjangoModelFactory[EventCategory]):
+    name = Faker("word")
+    description = Faker("sentence")
+
+    class Meta:
+        model = EventCategory
+
+
+class CategoryFactory(DjangoModelFactory[Category]):
+    name = Faker("word")
+    description = Faker("sentence")
+
+    class Meta:
+        model = Category
+
+
+class LocationFactory(DjangoModelFactory[Location]):
+    name = Faker("city")
+    latitude = Faker("latitude")
+    longitude = Faker("longitude")
+    country = Faker("country")
+
+    class Meta:
+        model = Location
+
+
+class HistoricalFigureFactory(DjangoModelFactory[HistoricalFigure]):
+    name = Faker("name")
+    biography = Faker("paragraph")
+    bio = Faker("sentence")
+
+    class Meta:
+        model = HistoricalFigure
+
+
+class HistoricalEventFactory(DjangoModelFactory[HistoricalEvent]):
+    name = Faker("sentence", nb_words=4)
+    title = LazyAttribute(lambda o: o.name)
+    start_date = Faker(
+        "date_between",
+        start_date=datetime.date(1000, 1, 1),
+        end_date=datetime.date(1999, 12, 31),
+    )
+    end_date = LazyAttribute(lambda o: o.start_date + datetime.timedelta(days=30))
+    date = LazyAttribute(lambda o: o.start_date)
+    description = Faker("paragraph")
+    impact_level = 2
+    significance_rating = 5
+    era = SubFactory(EraFactory)
+    category = SubFactory(EventCategoryFactory)
+    location = SubFactory(LocationFactory)
+
+    @post_generation
+    def categories(self, create: bool, extracted: Sequence[Any], **kwargs):  # noqa: FBT001
+        if create and extracted:
+            self.categories.add(*extracted)
+
+    @post_generation
+    def key_figures(self, create: bool, extracted: Sequence[Any], **kwargs):  # noqa: FBT001
+        if create and extracted:
+            self.key_figures.add(*extracted)
+
+    @post_generation
+    def tags(self, create: bool, extracted: Sequence[str], **kwargs):  # noqa: FBT001
+        if create and extracted:
+            self.tags.add(*extracted)
+
+    class Meta:
+        model = HistoricalEvent
+        skip_postgeneration_save = True
+
+
+class HistoricalEntityFactory(DjangoModelFactory[HistoricalEntity]):
+    name = Faker("company")
+    description = Faker("paragraph")
+    start_date = Faker(
+        "date_between",
+        start_date=datetime.date(1000, 1, 1),
+        end_date=datetime.date(1499, 12, 31),
+    )
+    end_date = LazyAttribute(lambda o: o.start_date + datetime.timedelta(days=3650))
+    location = SubFactory(LocationFactory)
+
+    class Meta:
+        model = HistoricalEntity
+
+
+class HistoricalConnectionFactory(DjangoModelFactory[HistoricalConnection]):
+    relationship_type = "alliance"
+    strength = 1.0
+    evidence = Faker("sentence")
+    source = SubFactory(HistoricalEntityFactory)
+    target = SubFactory(HistoricalEntityFactory)
+
+    class Meta:
+        model = HistoricalConnection
+
+
+class ConsequenceFactory(DjangoModelFactory[Consequence]):
+    event = SubFactory(HistoricalEventFactory)
+    description = Faker("sentence")
+    impact_level = 5
+    timeframe = "immediate"
+
+    class Meta:
+        model = Consequence
+
+
+class CauseFactory(DjangoModelFactory[Cause]):
+    name = Faker("sentence", nb_words=3)
+    description = Faker("paragraph")
+
+    class Meta:
+        model = Cause
+
+
+class EffectFactory(DjangoModelFactory[Effect]):
+    name = Faker("sentence", nb_words=3)
+    description = Faker("paragraph")
+
+    class Meta:
+        model = Effect
+
+
+class CauseEffectRelationshipFactory(DjangoModelFactory[CauseEffectRelationship]):
+    description = Faker("sentence")
+    cause = SubFactory(CauseFactory)
+    effect = SubFactory(EffectFactory)
+    historical_event = SubFactory(HistoricalEventFactory)
+
+    class Meta:
+        model = CauseEffectRelationship
+
+
+class GeopoliticalImpactFactory(DjangoModelFactory[GeopoliticalImpact]):
+    impact_type = "territorial"
+    impact_radius = 100.0
+    affected_population = 1_000_000
+    geometry = LazyAttribute(lambda _: Polygon.from_bbox((2, 48, 3, 49)))
+    event = SubFactory(HistoricalEventFactory)
+    region = SubFactory(LocationFactory)
+
+    class Meta:
+        model = GeopoliticalImpact
+
+
+class TimelineFactory(DjangoModelFactory[Timeline]):
+    title = Faker("sentence", nb_words=3)
+    description = Faker("paragraph")
+    created_by = SubFactory(UserFactory)
+
+    class Meta:
+        model = Timeline
+
+
+class TimelineEventFactory(DjangoModelFactory[TimelineEvent]):
+    order = FactorySequence(lambda n: n)
+    timeline = SubFactory(TimelineFactory)
+    event = SubFactory(HistoricalEventFactory)
+
+    class Meta:
+        model = TimelineEvent
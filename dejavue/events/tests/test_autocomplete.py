@@ -0,0 +1,73 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from dejavue.events.autocomplete import SOURCES
+from dejavue.events.autocomplete import _candidates
+from dejavue.events.autocomplete import suggest
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.events.tests.factories import HistoricalFigureFactory
+from dejavue.events.tests.factories import LocationFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_suggest_spans_sources():
+    event = HistoricalEventFactory(name="Siege of Paris")
+    figure = HistoricalFigureFactory(name="Paris of Troy")
+    location = LocationFactory(name="Lutetia", modern_name="Paris")
+
+    results = suggest("paris")
+
+    assert {(r["type"], r["id"]) for r in results} == {
+        ("event", event.pk),
+        ("figure", figure.pk),
+        ("location", location.pk),
+    }
+    # Exact match ranks first.
+    assert results[0] == {"type": "location", "id": location.pk, "label": "Lutetia"}
+
+
+@pytest.mark.parametrize(
+    ("kind", "indexes"),
+    [
+        ("event", ["events_event_name_trgm"]),
+        ("figure", ["events_figure_name_trgm"]),
+        ("location", ["events_location_name_trgm", "events_location_modern_trgm"]),
+    ],
+)
+def test_candidates_use_the_trigram_indexes(kind, indexes):
+    _, model, fields = next(source for source in SOURCES if source[0] == kind)
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    plan = _candidates(kind, model, fields, "paris", 10).explain()
+
+    for index in indexes:
+        assert index in plan
+
+
+def test_short_prefix_cached_until_save(
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    HistoricalFigureFactory(name="Nero")
+    assert [r["label"] for r in suggest("ne")] == ["Nero"]
+
+    with django_assert_num_queries(0):
+        suggest("ne")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        HistoricalFigureFactory(name="Nerva")
+    assert {r["label"] for r in suggest("ne")} == {"Nero", "Nerva"}
+
+
+def test_autocomplete_endpoint(api_client):
+    HistoricalEventFactory(name="Fall of Constantinople")
+
+    response = api_client.get(reverse("api:autocomplete"), {"q": "constant"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.data["results"][0]["label"] == "Fall of Constantinople"
@@ -0,0 +1,124 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.causality import CausalGraph
+from dejavue.events.causality import causal_graph
+from dejavue.events.tests.factories import CauseEffectRelationshipFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _link(event, cause, effect):
+    return CauseEffectRelationshipFactory(
+        historical_event=event,
+        cause__name=cause,
+        effect__name=effect,
+    )
+
+
+@pytest.fixture
+def history():
+    """drought -> famine -> unrest -> revolution, plus taxation and migration."""
+    events = HistoricalEventFactory.create_batch(4)
+    famine = _link(events[0], "Drought", "Famine")
+    unrest = _link(events[1], "famine ", "Unrest")  # matched by normalized name
+    revolution = _link(events[2], "Unrest", "Revolution")
+    taxation = _link(events[2], "Taxation", "Revolution")
+    migration = _link(events[3], "drought", "Migration")
+    return events, [famine, unrest, revolution, taxation, migration]
+
+
+def _ids(chains):
+    return [[link["id"] for link in chain] for chain in chains]
+
+
+def test_graph_is_built_in_one_query(history, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        CausalGraph.load()
+
+
+def test_downstream_and_upstream_chains(history):
+    events, (famine, unrest, revolution, taxation, _) = history
+
+    assert _ids(causal_graph.chains(events[0].pk)) == [
+        [famine.pk, unrest.pk, revolution.pk],
+    ]
+    assert _ids(causal_graph.chains(events[2].pk, upstream=True)) == [
+        [famine.pk, unrest.pk, revolution.pk],
+        [taxation.pk],
+    ]
+    assert _ids(causal_graph.chains(events[0].pk, depth=2)) == [
+        [famine.pk, unrest.pk],
+    ]
+
+
+def test_cycles_end_chains(history):
+    events, (famine, unrest, revolution, _, migration) = history
+    loop = _link(events[1], "Unrest", "Drought")
+
+    chains = CausalGraph.load().chains(events[0].pk)
+
+    # The loop leads back to drought; famine is already on the chain, so
+    # only migration follows.
+    assert [[link.id for link in chain] for chain in chains] == [
+        [famine.pk, unrest.pk, revolution.pk],
+        [famine.pk, unrest.pk, loop.pk, migration.pk],
+    ]
+
+
+def test_shared_root_causes(history):
+    events, (famine, _, _, taxation, migration) = history
+
+    shared = causal_graph.shared_root_causes(events[2].pk, events[3].pk)
+
+    assert shared == [
+        {
+            "name": "drought",
+            "cause_ids": sorted([famine.cause_id, migration.cause_id]),
+        },
+    ]
+    assert CausalGraph.load().root_causes(events[2].pk).keys() == {
+        "drought",
+        "taxation",
+    }
+
+
+def test_results_cached_until_relationships_change(
+    history,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    events, _ = history
+    causal_graph.chains(events[3].pk)
+
+    with django_assert_num_queries(0):
+        causal_graph.chains(events[3].pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _link(events[0], "Migration", "Urbanisation")
+    assert len(causal_graph.chains(events[3].pk)[0]) == 2  # noqa: PLR2004
+
+
+def test_causal_endpoints(history, api_client):
+    events, (famine, unrest, revolution, *_) = history
+
+    response = api_client.get(
+        reverse("api:historicalevent-causal-chains", kwargs={"pk": events[0].pk}),
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert _ids(response.data) == [[famine.pk, unrest.pk, revolution.pk]]
+
+    response = api_client.get(
+        reverse("api:historicalevent-shared-causes", kwargs={"pk": events[2].pk}),
+        {"with": events[3].pk},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert [cause["name"] for cause in response.data] == ["drought"]
+
+    url = reverse("api:historicalevent-shared-causes", kwargs={"pk": events[2].pk})
+    for params in ({}, {"with": "abc"}, {"with": "²"}):
+        response = api_client.get(url, params)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,100 @@
+from http import HTTPStatus
+
+import numpy as np
+import pytest
+from django.urls import reverse
+
+from dejavue.events.centrality import adjacency
+from dejavue.events.centrality import betweenness
+from dejavue.events.centrality import pagerank
+from dejavue.events.centrality import score_entities
+from dejavue.events.graph import GraphSnapshot
+from dejavue.events.graph import GraphStore
+from dejavue.events.models import HistoricalEntity
+from dejavue.events.tasks import score_historical_entities
+from dejavue.events.tests.factories import CategoryFactory
+from dejavue.events.tests.factories import HistoricalConnectionFactory
+from dejavue.events.tests.factories import HistoricalEntityFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _snapshot(edges):
+    """A snapshot over entity ids ``0..n`` from ``(source, target)`` pairs."""
+    return GraphSnapshot.from_rows(
+        (pk, source, target, 1.0) for pk, (source, target) in enumerate(edges)
+    )
+
+
+def test_pagerank_of_a_star_favours_the_hub():
+    snapshot = _snapshot([(1, 0), (2, 0), (3, 0), (0, 1)])
+
+    rank = pagerank(adjacency(snapshot), tol=1e-12)
+
+    assert rank.sum() == pytest.approx(1.0)
+    assert rank.argmax() == 0
+    assert rank[2] == pytest.approx(rank[3])
+
+
+def test_betweenness_counts_paths_through_the_middle():
+    # 0 -> 1 -> 2 -> 3: node 1 sits on 0->2 and 0->3, node 2 on 0->3 and 1->3
+    matrix = adjacency(_snapshot([(0, 1), (1, 2), (2, 3)]))
+
+    np.testing.assert_allclose(betweenness(matrix, samples=4), [0, 2, 2, 0])
+
+
+@pytest.fixture
+def entities_graph(settings, tmp_path):
+    settings.GRAPH_SNAPSHOT_DIR = str(tmp_path)
+    hub, spoke, other, loner = HistoricalEntityFactory.create_batch(4)
+    HistoricalConnectionFactory(source=spoke, target=hub)
+    HistoricalConnectionFactory(source=other, target=hub)
+    HistoricalConnectionFactory(source=hub, target=spoke)
+    return hub, spoke, loner
+
+
+def test_score_entities_stores_scores(entities_graph):
+    hub, spoke, loner = entities_graph
+
+    scored = score_entities(GraphStore().refresh(full=True))
+
+    assert scored == 3  # noqa: PLR2004
+    hub.refresh_from_db()
+    spoke.refresh_from_db()
+    loner.refresh_from_db()
+    assert hub.pagerank > spoke.pagerank > 0
+    assert (hub.degree, spoke.degree) == (3, 2)
+    assert loner.pagerank == 0
+    assert loner.scored_at is not None
+
+
+def test_unchanged_unconnected_entities_are_not_rewritten(entities_graph):
+    *_, loner = entities_graph
+    snapshot = GraphStore().refresh(full=True)
+    score_entities(snapshot)
+    loner.refresh_from_db()
+
+    score_entities(snapshot)
+
+    assert HistoricalEntity.objects.get(pk=loner.pk).scored_at == loner.scored_at
+
+
+def test_score_task(entities_graph):
+    assert score_historical_entities.delay().result == 3  # noqa: PLR2004
+
+
+def test_influential_endpoint(api_client):
+    category = CategoryFactory()
+    low, high, other = HistoricalEntityFactory.create_batch(3)
+    for entity, score in [(low, 0.1), (high, 0.5), (other, 0.9)]:
+        HistoricalEntity.objects.filter(pk=entity.pk).update(pagerank=score)
+    low.categories.add(category)
+    high.categories.add(category)
+
+    response = api_client.get(
+        reverse("api:historicalentity-influential"),
+        {"category": category.pk},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [row["id"] for row in response.data["results"]] == [high.pk, low.pk]
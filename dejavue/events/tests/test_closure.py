@@ -0,0 +1,108 @@
+import pytest
+from django.core.management import call_command
+
+from dejavue.events.models import EventClosure
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _closure():
+    return set(
+        EventClosure.objects.values_list("ancestor_id", "descendant_id", "depth"),
+    )
+
+
+@pytest.fixture
+def events():
+    return HistoricalEventFactory.create_batch(4)
+
+
+def test_adding_edges_extends_paths(events):
+    a, b, c, d = events
+    a.related_events.add(b)
+    c.related_events.add(d)
+    b.related_events.add(c)
+
+    assert _closure() == {
+        (a.pk, b.pk, 1),
+        (a.pk, c.pk, 2),
+        (a.pk, d.pk, 3),
+        (b.pk, c.pk, 1),
+        (b.pk, d.pk, 2),
+        (c.pk, d.pk, 1),
+    }
+
+
+def test_shortcut_keeps_shortest_depth(events):
+    a, b, c, _ = events
+    a.related_events.add(b)
+    b.related_events.add(c)
+    c.related_events.add(a)  # cycle
+    a.related_events.add(c)
+
+    closure = _closure()
+    assert (a.pk, c.pk, 1) in closure
+    assert (c.pk, b.pk, 2) in closure
+    assert not any(ancestor == descendant for ancestor, descendant, _ in closure)
+
+
+def test_reverse_side_updates_closure(events):
+    a, b, c, _ = events
+    b.related_events.add(c)
+    b.historicalevent_set.add(a)
+
+    assert (a.pk, c.pk, 2) in _closure()
+
+
+def test_removing_edges_breaks_paths(events):
+    a, b, c, d = events
+    a.related_events.add(b, d)
+    b.related_events.add(c)
+    d.related_events.add(c)
+    b.related_events.add(d)
+
+    a.related_events.remove(d)
+    assert (a.pk, d.pk, 2) in _closure()
+
+    b.related_events.clear()
+    assert _closure() == {(a.pk, b.pk, 1), (d.pk, c.pk, 1)}
+
+
+def test_deleting_an_event_breaks_paths_through_it(events):
+    a, b, c, _ = events
+    a.related_events.add(b)
+    b.related_events.add(c)
+
+    b.delete()
+
+    assert _closure() == set()
+
+
+def test_rebuild_command_matches_incremental_closure(events):
+    a, b, c, d = events
+    a.related_events.add(b, c)
+    c.related_events.add(d, a)
+    expected = _closure()
+    EventClosure.objects.all().delete()
+
+    call_command("rebuild_event_closure")
+
+    assert _closure() == expected
+
+
+def test_reachability_helpers(events, django_assert_num_queries):
+    a, b, c, d = events
+    a.related_events.add(b)
+    b.related_events.add(c)
+
+    with django_assert_num_queries(1):
+        downstream = {
+            e.pk: e.distance for e in HistoricalEvent.objects.downstream_of(a)
+        }
+    assert downstream == {b.pk: 1, c.pk: 2}
+    assert set(HistoricalEvent.objects.upstream_of(c, max_depth=1)) == {b}
+    assert c.is_downstream_of(a)
+    assert not a.is_downstream_of(c)
+    assert not d.is_downstream_of(a)
@@ -0,0 +1,127 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.clustering import cached_clusters
+from dejavue.events.clustering import cluster_tile
+from dejavue.events.clustering import precompute_clusters
+from dejavue.events.clustering import tile_bounds
+from dejavue.events.clustering import tile_for
+from dejavue.events.clustering import tiles_for_bbox
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.events.tests.factories import LocationFactory
+
+pytestmark = pytest.mark.django_db
+
+PARIS = (2.35, 48.86)
+VERSAILLES = (2.13, 48.80)
+LONDON = (-0.13, 51.51)
+
+
+def _event(lon, lat, **kwargs):
+    location = LocationFactory(longitude=lon, latitude=lat)
+    return HistoricalEventFactory(location=location, **kwargs)
+
+
+def test_tile_math():
+    assert tile_for(*PARIS, 10) == (518, 352)
+    west, south, east, north = tile_bounds(10, 518, 352)
+    assert west <= PARIS[0] < east
+    assert south < PARIS[1] <= north
+    assert tile_for(180, 90, 2) == (3, 0)
+    assert tiles_for_bbox((-10, 40, 10, 60), 4) == [
+        (7, 4),
+        (8, 4),
+        (7, 5),
+        (8, 5),
+        (7, 6),
+        (8, 6),
+    ]
+
+
+def test_cluster_tile():
+    paris = _event(*PARIS, significance_rating=9)
+    versailles = _event(*VERSAILLES, significance_rating=4)
+    _event(*LONDON)
+    HistoricalEventFactory(location=None)
+
+    (cluster,) = cluster_tile(HistoricalEvent.objects.all(), 6, *tile_for(*PARIS, 6))
+
+    assert cluster["count"] == 2  # noqa: PLR2004
+    assert cluster["centroid"] == pytest.approx([2.24, 48.83])
+    assert [event["id"] for event in cluster["top_events"]] == [
+        paris.pk,
+        versailles.pk,
+    ]
+
+
+def test_cluster_tile_splits_cells():
+    _event(*PARIS)
+    _event(*VERSAILLES)
+    clusters = cluster_tile(HistoricalEvent.objects.all(), 9, *tile_for(*PARIS, 9))
+    assert sorted(cluster["count"] for cluster in clusters) == [1, 1]
+
+
+def test_cached_tiles_follow_event_changes(django_capture_on_commit_callbacks):
+    tile = tile_for(*PARIS, 6)
+    with django_capture_on_commit_callbacks(execute=True):
+        _event(*PARIS)
+
+    def count():
+        clusters = cached_clusters(HistoricalEvent.objects.all(), 6, [tile], {})
+        return sum(cluster["count"] for cluster in clusters)
+
+    assert count() == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        moved = _event(*LONDON)
+    assert count() == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        moved.location = LocationFactory(
+            longitude=VERSAILLES[0],
+            latitude=VERSAILLES[1],
+        )
+        moved.save()
+    assert count() == 2  # noqa: PLR2004
+
+    with django_capture_on_commit_callbacks(execute=True):
+        location = moved.location
+        location.longitude, location.latitude = LONDON
+        location.save()
+    assert count() == 1
+
+
+def test_precompute_clusters():
+    _event(*PARIS)
+    assert precompute_clusters(max_zoom=2) == 3  # noqa: PLR2004
+
+
+class TestClustersApi:
+    def test_clusters(self, api_client):
+        _event(*PARIS)  # in another era
+        event = _event(*LONDON)
+        response = api_client.get(
+            reverse("api:historicalevent-clusters"),
+            {"zoom": 4, "bbox": "-1,48,3,52", "era": event.era_id},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.data["zoom"] == 4  # noqa: PLR2004
+        (cluster,) = response.data["clusters"]
+        assert cluster["tile"] == "4/7/5"
+        assert cluster["top_events"][0]["id"] == event.pk
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"zoom": 4},
+            {"zoom": 21, "bbox": "-1,48,3,52"},
+            {"zoom": "x", "bbox": "-1,48,3,52"},
+            {"zoom": 12, "bbox": "-180,-80,180,80"},
+        ],
+    )
+    def test_invalid(self, api_client, params):
+        response = api_client.get(reverse("api:historicalevent-clusters"), params)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
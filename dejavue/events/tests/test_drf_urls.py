@@ -0,0 +1,73 @@
+from django.urls import resolve
+from django.urls import reverse
+
+
+def test_event_detail():
+    assert reverse("api:historicalevent-detail", kwargs={"pk": 1}) == "/api/events/1/"
+    assert resolve("/api/events/1/").view_name == "api:historicalevent-detail"
+
+
+def test_event_list():
+    assert reverse("api:historicalevent-list") == "/api/events/"
+    assert resolve("/api/events/").view_name == "api:historicalevent-list"
+
+
+def test_timeline_events():
+    assert (
+        reverse("api:timeline-events", kwargs={"pk": 1}) == "/api/timelines/1/events/"
+    )
+    assert resolve("/api/timelines/1/events/").view_name == "api:timeline-events"
+
+
+def test_event_export():
+    assert reverse("api:historicalevent-export") == "/api/events/export/"
+    assert resolve("/api/events/export/").view_name == "api:historicalevent-export"
+
+
+def test_event_facets():
+    assert reverse("api:historicalevent-facets") == "/api/events/facets/"
+    assert resolve("/api/events/facets/").view_name == "api:historicalevent-facets"
+
+
+def test_event_neighbourhood():
+    assert (
+        reverse("api:historicalevent-neighbourhood", kwargs={"pk": 1})
+        == "/api/events/1/neighbourhood/"
+    )
+    assert (
+        resolve("/api/events/1/neighbourhood/").view_name
+        == "api:historicalevent-neighbourhood"
+    )
+
+
+def test_event_causal_chains():
+    assert (
+        reverse("api:historicalevent-causal-chains", kwargs={"pk": 1})
+        == "/api/events/1/causal-chains/"
+    )
+    assert (
+        resolve("/api/events/1/causal-chains/").view_name
+        == "api:historicalevent-causal-chains"
+    )
+
+
+def test_event_nearest():
+    assert reverse("api:historicalevent-nearest") == "/api/events/nearest/"
+    assert resolve("/api/events/nearest/").view_name == "api:historicalevent-nearest"
+
+
+def test_event_clusters():
+    assert reverse("api:historicalevent-clusters") == "/api/events/clusters/"
+    assert resolve("/api/events/clusters/").view_name == "api:historicalevent-clusters"
+
+
+def test_timeline_payload():
+    assert (
+        reverse("api:timeline-payload", kwargs={"pk": 1}) == "/api/timelines/1/payload/"
+    )
+    assert resolve("/api/timelines/1/payload/").view_name == "api:timeline-payload"
+
+
+def test_timeline_moves():
+    assert reverse("api:timeline-moves", kwargs={"pk": 1}) == "/api/timelines/1/moves/"
+    assert resolve("/api/timelines/1/moves/").view_name == "api:timeline-moves"
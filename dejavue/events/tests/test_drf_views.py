@@ -0,0 +1,70 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.tests.factories import CategoryFactory
+from dejavue.events.tests.factories import EraFactory
+from dejavue.events.tests.factories import EventCategoryFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.events.tests.factories import HistoricalFigureFactory
+from dejavue.events.tests.factories import LocationFactory
+
+pytestmark = pytest.mark.django_db
+
+# Savepoint + release (ATOMIC_REQUESTS), events with their foreign keys,
+# then one prefetch each for categories, key figures and tags.
+EVENT_LIST_QUERY_BUDGET = 7
+
+
+def _create_events(count: int):
+    return HistoricalEventFactory.create_batch(
+        count,
+        era=EraFactory(),
+        category=EventCategoryFactory(),
+        location=LocationFactory(),
+        categories=CategoryFactory.create_batch(2),
+        key_figures=HistoricalFigureFactory.create_batch(2),
+        tags=["war", "treaty"],
+    )
+
+
+def test_event_list_query_budget(api_client, django_assert_max_num_queries):
+    page_size = 500
+    _create_events(page_size)
+
+    with django_assert_max_num_queries(EVENT_LIST_QUERY_BUDGET):
+        response = api_client.get(
+            reverse("api:historicalevent-list"),
+            {"page_size": page_size},
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.data["results"]) == page_size
+    first = response.data["results"][0]
+    assert len(first["categories"]) == 2  # noqa: PLR2004
+    assert len(first["key_figures"]) == 2  # noqa: PLR2004
+    assert sorted(first["tags"]) == ["treaty", "war"]
+
+
+def test_event_detail_query_budget(api_client, django_assert_max_num_queries):
+    event = _create_events(1)[0]
+
+    with django_assert_max_num_queries(EVENT_LIST_QUERY_BUDGET - 1):
+        response = api_client.get(
+            reverse("api:historicalevent-detail", kwargs={"pk": event.pk}),
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.data["era"]["id"] == event.era_id
+    assert response.data["location"]["id"] == event.location_id
+
+
+@pytest.mark.parametrize(
+    "action",
+    ["neighbourhood", "consequences", "impact-footprint", "causal-chains"],
+)
+def test_event_actions_reject_non_numeric_ids(api_client, action):
+    response = api_client.get(f"/api/events/abc/{action}/")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+
+from dejavue.events.eras import EraIndex
+from dejavue.events.eras import era_index
+from dejavue.events.tests.factories import EraFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def eras(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        return {
+            "medieval": EraFactory(start_year=500, end_year=1500),
+            "renaissance": EraFactory(start_year=1300, end_year=1600),
+            "modern": EraFactory(start_year=1800, end_year=2100),
+        }
+
+
+def test_era_for_year(eras, django_assert_num_queries):
+    index = EraIndex()
+    index.era_for_year(1000)  # load
+
+    with django_assert_num_queries(0):
+        assert index.era_for_year(1000) == eras["medieval"].pk
+        # Overlaps resolve to the era that started last.
+        assert index.era_for_year(1400) == eras["renaissance"].pk
+        assert index.era_for_year(1550) == eras["renaissance"].pk
+        assert index.era_for_year(1700) is None
+        assert index.era_for_year(400) is None
+
+
+def test_saving_an_era_invalidates_index_on_commit(
+    eras,
+    django_capture_on_commit_callbacks,
+):
+    assert era_index.era_for_year(1700) is None
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        early_modern = EraFactory(start_year=1600, end_year=1800)
+    assert era_index.era_for_year(1700) is None
+
+    for callback in callbacks:
+        callback()
+    assert era_index.era_for_year(1700) == early_modern.pk
+
+
+def test_event_era_assigned_from_start_date(eras):
+    event = HistoricalEventFactory(era=None, start_date=datetime.date(1815, 6, 18))
+    assert event.era == eras["modern"]
@@ -0,0 +1,42 @@
+import json
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from dejavue.events.tests.factories import CategoryFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_export_endpoint_streams_ndjson(api_client):
+    events = HistoricalEventFactory.create_batch(
+        3,
+        categories=CategoryFactory.create_batch(1),
+        tags=["war"],
+    )
+
+    response = api_client.get(reverse("api:historicalevent-export"))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = response.getvalue().decode().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["id"] for r in records] == sorted(e.pk for e in events)
+    assert records[0]["tags"] == ["war"]
+    assert len(records[0]["categories"]) == 1
+
+
+def test_export_command_chunks_output():
+    HistoricalEventFactory.create_batch(5)
+    out = StringIO()
+
+    call_command("export_events", "--chunk-size", "2", stdout=out)
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == 5  # noqa: PLR2004
+    assert all(json.loads(line)["era"] for line in lines)
@@ -0,0 +1,75 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.facets import facet_counts
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import CategoryFactory
+from dejavue.events.tests.factories import EraFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def catalogue():
+    era = EraFactory(name="Modern")
+    military, cultural = CategoryFactory(name="Military"), CategoryFactory(name="Arts")
+    HistoricalEventFactory.create_batch(
+        2,
+        era=era,
+        impact_level=3,
+        categories=[military],
+        tags=["war"],
+    )
+    HistoricalEventFactory(
+        era=era,
+        impact_level=1,
+        categories=[military, cultural],
+        tags=["war", "opera"],
+    )
+    return {"era": era, "military": military, "cultural": cultural}
+
+
+def test_facet_counts(catalogue, django_assert_max_num_queries):
+    with django_assert_max_num_queries(6):
+        counts = facet_counts(HistoricalEvent.objects.all())
+
+    assert counts["era"] == [
+        {"id": catalogue["era"].pk, "name": "Modern", "count": 3},
+    ]
+    assert counts["impact_level"] == [
+        {"id": 1, "name": "Low", "count": 1},
+        {"id": 3, "name": "High", "count": 2},
+    ]
+    assert counts["categories"] == [
+        {"id": catalogue["military"].pk, "name": "Military", "count": 3},
+        {"id": catalogue["cultural"].pk, "name": "Arts", "count": 1},
+    ]
+    assert [(tag["name"], tag["count"]) for tag in counts["tags"]] == [
+        ("war", 3),
+        ("opera", 1),
+    ]
+
+
+def test_facets_endpoint_applies_filters(catalogue, api_client):
+    response = api_client.get(reverse("api:historicalevent-facets"), {"tags": "opera"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.data["era"][0]["count"] == 1
+    assert response.data["impact_level"] == [{"id": 1, "name": "Low", "count": 1}]
+
+
+def test_facets_are_cached_by_normalized_filter(
+    catalogue,
+    api_client,
+    django_assert_max_num_queries,
+):
+    url = reverse("api:historicalevent-facets")
+    api_client.get(url, {"tags": "war,opera"})
+
+    with django_assert_max_num_queries(2):  # savepoint + release only
+        response = api_client.get(url, {"tags": "opera,war"})
+
+    assert response.data["era"][0]["count"] == 3  # noqa: PLR2004
@@ -0,0 +1,47 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from dejavue.events.tests.factories import CategoryFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_mobile_fields_skip_large_columns_and_relations(api_client):
+    HistoricalEventFactory.create_batch(3, categories=CategoryFactory.create_batch(2))
+    fields = "id,name,start_date,end_date,significance_rating"
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            reverse("api:historicalevent-list"),
+            {"fields": fields},
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    assert set(response.data["results"][0]) == set(fields.split(","))
+    selects = [q["sql"] for q in queries if q["sql"].startswith("SELECT")]
+    assert len(selects) == 1
+    assert '"description"' not in selects[0]
+    assert '"sources"' not in selects[0]
+
+
+def test_collapsed_relations_render_primary_keys(api_client):
+    categories = CategoryFactory.create_batch(2)
+    event = HistoricalEventFactory(categories=categories)
+
+    response = api_client.get(
+        reverse("api:historicalevent-detail", kwargs={"pk": event.pk}),
+        {"fields": "id,era,categories", "expand": "era"},
+    )
+
+    assert response.data["era"]["id"] == event.era_id
+    assert sorted(response.data["categories"]) == sorted(c.pk for c in categories)
+
+
+def test_unknown_field_is_rejected(api_client):
+    response = api_client.get(reverse("api:historicalevent-list"), {"fields": "nope"})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,144 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.gis.geos import Polygon
+from django.urls import reverse
+
+from dejavue.events.footprints import recompute_stale
+from dejavue.events.models import EraImpactFootprint
+from dejavue.events.models import EventImpactFootprint
+from dejavue.events.tests.factories import GeopoliticalImpactFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _box(west, east):
+    return Polygon.from_bbox((west, 0, east, 1))
+
+
+def _totals(summary):
+    summary.refresh_from_db()
+    return summary.affected_population, summary.gross_population, summary.stale
+
+
+@pytest.fixture
+def events(django_capture_on_commit_callbacks):
+    first = HistoricalEventFactory()
+    second = HistoricalEventFactory(era=first.era)
+    with django_capture_on_commit_callbacks(execute=True):
+        GeopoliticalImpactFactory(
+            event=first,
+            geometry=_box(0, 2),
+            affected_population=1000,
+        )
+        # Half of it overlaps the first impact.
+        GeopoliticalImpactFactory(
+            event=first,
+            geometry=_box(1, 3),
+            affected_population=500,
+        )
+        GeopoliticalImpactFactory(
+            event=second,
+            geometry=_box(2, 4),
+            affected_population=800,
+        )
+    return first, second
+
+
+def test_overlaps_are_counted_once(events):
+    first, second = events
+    assert recompute_stale() == 3  # noqa: PLR2004
+
+    first_footprint = EventImpactFootprint.objects.get(event=first)
+    assert _totals(first_footprint) == (1250, 1500, False)
+    assert first_footprint.impact_count == 2  # noqa: PLR2004
+    assert first_footprint.footprint is not None
+    assert first_footprint.footprint.extent == pytest.approx((0, 0, 3, 1))
+    assert _totals(EventImpactFootprint.objects.get(event=second)) == (
+        800,
+        800,
+        False,
+    )
+    # The era counts the second event only where it leaves the first.
+    era_footprint = EraImpactFootprint.objects.get(era=first.era)
+    assert _totals(era_footprint) == (1650, 2300, False)
+
+
+def test_regions_covered_by_earlier_ones_add_nothing(
+    django_capture_on_commit_callbacks,
+):
+    event = HistoricalEventFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        for (west, east), population in (((0, 2), 1000), ((1, 3), 500), ((0, 3), 300)):
+            GeopoliticalImpactFactory(
+                event=event,
+                geometry=_box(west, east),
+                affected_population=population,
+            )
+
+    recompute_stale()
+
+    assert _totals(EventImpactFootprint.objects.get(event=event)) == (
+        1250,
+        1800,
+        False,
+    )
+
+
+def test_only_changed_events_are_recomputed(
+    events,
+    django_capture_on_commit_callbacks,
+):
+    first, second = events
+    recompute_stale()
+
+    impact = second.geopoliticalimpact_set.get()
+    with django_capture_on_commit_callbacks(execute=True):
+        impact.affected_population = 400
+        impact.save()
+
+    assert EventImpactFootprint.objects.filter(stale=True).get().event == second
+    assert recompute_stale() == 2  # noqa: PLR2004
+    assert _totals(EraImpactFootprint.objects.get(era=first.era)) == (
+        1450,
+        1900,
+        False,
+    )
+
+
+def test_deleted_events_leave_the_era(events, django_capture_on_commit_callbacks):
+    first, second = events
+    recompute_stale()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second.delete()
+
+    assert not EventImpactFootprint.objects.filter(event_id=second.pk).exists()
+    assert recompute_stale() == 1
+    assert _totals(EraImpactFootprint.objects.get(era=first.era)) == (
+        1250,
+        1500,
+        False,
+    )
+
+
+def test_impact_footprint_view(api_client, events):
+    first, _ = events
+    recompute_stale()
+
+    response = api_client.get(
+        reverse("api:historicalevent-impact-footprint", kwargs={"pk": first.pk}),
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.data["affected_population"] == 1250  # noqa: PLR2004
+    assert response.data["impact_count"] == 2  # noqa: PLR2004
+    assert response.data["stale"] is False
+
+    other = HistoricalEventFactory()
+    response = api_client.get(
+        reverse("api:historicalevent-impact-footprint", kwargs={"pk": other.pk}),
+    )
+    assert response.data["affected_population"] == 0
+    assert response.data["stale"] is False
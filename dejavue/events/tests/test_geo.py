@@ -0,0 +1,108 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.geo import make_point
+from dejavue.events.geo import parse_bbox
+from dejavue.events.geo import parse_point
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.events.tests.factories import LocationFactory
+
+pytestmark = pytest.mark.django_db
+
+PARIS = (2.35, 48.86)
+LONDON = (-0.13, 51.51)
+NEW_YORK = (-74.0, 40.71)
+
+
+def _event(name, lon, lat):
+    location = LocationFactory(name=name, longitude=lon, latitude=lat)
+    return HistoricalEventFactory(name=name, location=location)
+
+
+@pytest.fixture
+def events():
+    return {
+        "paris": _event("paris", *PARIS),
+        "london": _event("london", *LONDON),
+        "new_york": _event("new_york", *NEW_YORK),
+    }
+
+
+def test_parse_point_and_bbox():
+    assert parse_point(" 2.35, 48.86 ").coords == PARIS
+    assert parse_bbox("-10,40,10,60").extent == (-10, 40, 10, 60)
+    for value in ("2.35", "a,b", "200,0", "0,-91"):
+        with pytest.raises(ValueError, match=r"."):
+            parse_point(value)
+    with pytest.raises(ValueError, match=r"."):
+        parse_bbox("10,40,-10,60")
+
+
+def test_location_point_follows_coordinates():
+    location = LocationFactory(longitude=PARIS[0], latitude=PARIS[1])
+    assert location.point.coords == pytest.approx(PARIS)
+
+    location.latitude, location.longitude = LONDON[1], LONDON[0]
+    location.save(update_fields=["latitude", "longitude"])
+    location.refresh_from_db()
+    assert location.point.coords == pytest.approx(LONDON)
+
+
+def test_in_bbox(events):
+    europe = parse_bbox("-10,40,10,60")
+    assert set(HistoricalEvent.objects.in_bbox(europe)) == {
+        events["paris"],
+        events["london"],
+    }
+
+
+def test_within(events):
+    paris = make_point(*PARIS)
+    assert set(HistoricalEvent.objects.within(paris, 400_000)) == {
+        events["paris"],
+        events["london"],
+    }
+    assert list(HistoricalEvent.objects.within(paris, 300_000)) == [events["paris"]]
+
+
+def test_nearest(events):
+    HistoricalEventFactory(location=None)
+    nearest = HistoricalEvent.objects.nearest(make_point(*LONDON))
+    assert list(nearest) == [events["london"], events["paris"], events["new_york"]]
+
+
+class TestSpatialApi:
+    def test_list_filters(self, api_client, events):
+        url = reverse("api:historicalevent-list")
+        response = api_client.get(url, {"bbox": "-80,30,0,55"})
+        assert {row["name"] for row in response.data["results"]} == {
+            "london",
+            "new_york",
+        }
+
+        response = api_client.get(url, {"near": "2.35,48.86", "radius": 400_000})
+        assert {row["name"] for row in response.data["results"]} == {
+            "paris",
+            "london",
+        }
+
+        response = api_client.get(url, {"near": "north"})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_nearest(self, api_client, events):
+        response = api_client.get(
+            reverse("api:historicalevent-nearest"),
+            {"point": "2.35,48.86", "k": 2},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert [row["name"] for row in response.data] == ["paris", "london"]
+        assert response.data[0]["distance"] == pytest.approx(0, abs=1)
+        assert response.data[1]["distance"] == pytest.approx(343_000, rel=0.02)
+
+    def test_nearest_requires_point(self, api_client):
+        response = api_client.get(reverse("api:historicalevent-nearest"))
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,172 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.graph import CURRENT
+from dejavue.events.graph import GraphSnapshot
+from dejavue.events.graph import GraphStore
+from dejavue.events.graph import GraphUnavailableError
+from dejavue.events.tests.factories import HistoricalConnectionFactory
+from dejavue.events.tests.factories import HistoricalEntityFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def entities():
+    return HistoricalEntityFactory.create_batch(4)
+
+
+@pytest.fixture
+def connections(entities):
+    a, b, c, d = entities
+    return [
+        HistoricalConnectionFactory(source=a, target=b, strength=1.0),
+        HistoricalConnectionFactory(source=b, target=c, strength=1.0),
+        HistoricalConnectionFactory(source=a, target=c, strength=0.25),
+        HistoricalConnectionFactory(source=c, target=a, strength=1.0),
+    ]
+
+
+@pytest.fixture
+def store(settings, tmp_path):
+    settings.GRAPH_SNAPSHOT_DIR = str(tmp_path)
+    return GraphStore()
+
+
+def test_snapshot_is_compressed_sparse_rows(entities, connections):
+    a, b, c, _ = entities
+    snapshot = GraphSnapshot.from_rows(
+        (x.pk, x.source_id, x.target_id, x.strength) for x in connections
+    )
+
+    assert snapshot.node_ids.tolist() == sorted([a.pk, b.pk, c.pk])
+    assert snapshot.offsets.tolist() == [0, 2, 3, 4]
+    assert len(snapshot) == len(connections)
+
+
+def test_shortest_path_prefers_strong_connections(entities, connections):
+    a, b, c, d = entities
+    snapshot = GraphSnapshot.from_rows(
+        (x.pk, x.source_id, x.target_id, x.strength) for x in connections
+    )
+
+    assert snapshot.shortest_path(a.pk, c.pk) == ([a.pk, b.pk, c.pk], 2.0)
+    assert snapshot.shortest_path(a.pk, d.pk) is None
+    assert snapshot.neighbourhood(b.pk, depth=2) == [(c.pk, 1), (a.pk, 2)]
+
+
+def test_store_waits_for_a_published_snapshot(store, connections):
+    with pytest.raises(GraphUnavailableError):
+        store.get()
+
+
+def test_store_memory_maps_published_snapshot(store, connections):
+    snapshot = store.refresh()
+
+    reloaded = GraphStore(store.directory).get()
+
+    assert reloaded.edge_ids.tolist() == snapshot.edge_ids.tolist()
+    assert reloaded.built_at == snapshot.built_at
+    assert not reloaded.targets.flags.writeable
+
+
+def test_store_keeps_the_previous_version(store, connections):
+    store.refresh()
+    previous = (store.directory / CURRENT).read_text()
+    store.refresh()
+
+    versions = {path.name for path in store.directory.iterdir() if path.is_dir()}
+    assert versions == {previous, (store.directory / CURRENT).read_text()}
+
+
+def test_store_retries_a_version_pruned_while_loading(
+    store,
+    connections,
+    monkeypatch,
+):
+    store.refresh()
+    pruned = (store.directory / CURRENT).read_text()
+    store.refresh()
+    store.refresh()
+    reader = GraphStore(store.directory)
+    current = (store.directory / CURRENT).read_text()
+    monkeypatch.setattr(reader, "_version", iter([pruned, current]).__next__)
+
+    assert len(reader.get()) == len(connections)
+
+
+def test_refresh_merges_changed_connections(store, entities, connections):
+    a, _, c, d = entities
+    store.refresh()
+    connections[2].strength = 4.0
+    connections[2].save()
+    HistoricalConnectionFactory(source=c, target=d)
+
+    snapshot = store.refresh()
+
+    assert len(snapshot) == len(connections) + 1
+    assert snapshot.shortest_path(a.pk, d.pk) == ([a.pk, c.pk, d.pk], 1.25)
+
+
+def test_refresh_rebuilds_after_deletes(store, entities, connections):
+    a, b, c, _ = entities
+    store.refresh()
+    connections[1].delete()
+
+    snapshot = store.refresh()
+
+    assert len(snapshot) == len(connections) - 1
+    assert snapshot.shortest_path(a.pk, c.pk) == ([a.pk, c.pk], 4.0)
+
+
+def test_refresh_drops_deletes_offset_by_inserts(store, entities, connections):
+    a, b, c, d = entities
+    store.refresh()
+    connections[0].delete()
+    added = HistoricalConnectionFactory(source=b, target=d)
+
+    snapshot = store.refresh()
+
+    assert sorted(snapshot.edge_ids.tolist()) == sorted(
+        [x.pk for x in connections[1:]] + [added.pk],
+    )
+    assert snapshot.shortest_path(a.pk, b.pk) is None
+
+
+class TestEntityEndpoints:
+    @pytest.fixture(autouse=True)
+    def _published(self, store, connections):
+        store.refresh()
+
+    def test_unpublished_graph(self, api_client, store):
+        (store.directory / CURRENT).unlink()
+        url = reverse("api:historicalentity-neighbourhood", kwargs={"pk": 1})
+
+        response = api_client.get(url)
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+    def test_neighbourhood(self, api_client, entities, connections):
+        a, b, c, _ = entities
+        url = reverse("api:historicalentity-neighbourhood", kwargs={"pk": a.pk})
+
+        response = api_client.get(url, {"depth": 1})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.data == [
+            {"id": x.pk, "name": x.name, "distance": 1}
+            for x in sorted([b, c], key=lambda x: x.pk)
+        ]
+
+    def test_path(self, api_client, entities, connections):
+        a, b, c, d = entities
+        url = reverse("api:historicalentity-path", kwargs={"pk": a.pk})
+
+        response = api_client.get(url, {"to": c.pk})
+        assert response.status_code == HTTPStatus.OK
+        assert [step["id"] for step in response.data["path"]] == [a.pk, b.pk, c.pk]
+
+        assert api_client.get(url, {"to": d.pk}).status_code == HTTPStatus.NOT_FOUND
+        assert api_client.get(url).status_code == HTTPStatus.BAD_REQUEST
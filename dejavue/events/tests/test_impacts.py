@@ -0,0 +1,81 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.gis.geos import Polygon
+from django.urls import reverse
+
+from dejavue.events.geo import make_point
+from dejavue.events.impacts import ImpactLocator
+from dejavue.events.tests.factories import GeopoliticalImpactFactory
+
+pytestmark = pytest.mark.django_db
+
+TRIANGLE = Polygon(((0, 0), (10, 0), (0, 10), (0, 0)))
+SQUARE = Polygon.from_bbox((5, 5, 15, 15))
+
+
+@pytest.fixture
+def impacts():
+    triangle = GeopoliticalImpactFactory(geometry=TRIANGLE)
+    square = GeopoliticalImpactFactory(geometry=SQUARE)
+    return triangle, square
+
+
+def test_covering(impacts):
+    triangle, square = impacts
+    locator = ImpactLocator()
+
+    assert locator.covering(make_point(2, 2)) == [triangle.pk]
+    assert locator.covering(make_point(6, 2)) == [triangle.pk]
+    # Inside the triangle's bounding box only.
+    assert locator.covering(make_point(8, 8)) == [square.pk]
+    assert locator.covering(make_point(4, 6)) == [triangle.pk, square.pk]
+    assert locator.covering(make_point(20, 20)) == []
+
+
+def test_prepared_geometries_are_reused(impacts, django_assert_num_queries):
+    locator = ImpactLocator()
+    locator.covering(make_point(4, 6))
+
+    with django_assert_num_queries(1):
+        locator.covering(make_point(4, 6))
+
+
+def test_least_recently_used_are_evicted(impacts, django_assert_num_queries):
+    triangle, square = impacts
+    locator = ImpactLocator(maxsize=1)
+    locator.covering(make_point(2, 2))
+    locator.covering(make_point(8, 8))
+
+    with django_assert_num_queries(1):
+        assert locator.covering(make_point(8, 8)) == [square.pk]
+    with django_assert_num_queries(2):
+        assert locator.covering(make_point(2, 2)) == [triangle.pk]
+
+
+def test_changed_geometries_are_reloaded(impacts, django_capture_on_commit_callbacks):
+    triangle, _ = impacts
+    locator = ImpactLocator()
+    assert locator.covering(make_point(2, 2)) == [triangle.pk]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        triangle.geometry = Polygon.from_bbox((0, 0, 1, 1))
+        triangle.save()
+    locator._checked_at = 0.0  # noqa: SLF001  # skip the check interval
+
+    assert locator.covering(make_point(2, 2)) == []
+
+
+def test_lookup_view(api_client, impacts):
+    _, square = impacts
+
+    response = api_client.get(reverse("api:impact-lookup"), {"point": "8,8"})
+
+    assert response.status_code == HTTPStatus.OK
+    (result,) = response.data["results"]
+    assert result["id"] == square.pk
+    assert result["event"]["id"] == square.event_id
+    assert result["region"]["id"] == square.region_id
+
+    response = api_client.get(reverse("api:impact-lookup"))
+    assert response.status_code == HTTPStatus.BAD_REQUEST
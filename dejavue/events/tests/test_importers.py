@@ -0,0 +1,120 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from dejavue.events.autocomplete import suggest
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import CategoryFactory
+from dejavue.events.tests.factories import EraFactory
+from dejavue.events.tests.factories import EventCategoryFactory
+from dejavue.events.tests.factories import HistoricalFigureFactory
+
+pytestmark = pytest.mark.django_db
+
+CSV_HEADER = (
+    "name,start_date,end_date,description,impact_level,significance_rating,"
+    "era,category,categories,key_figures,tags\n"
+)
+
+
+@pytest.fixture
+def references():
+    return {
+        "era": EraFactory(name="Modern", slug="modern"),
+        "category": EventCategoryFactory(name="Battle"),
+        "categories": CategoryFactory.create_batch(2),
+        "figure": HistoricalFigureFactory(name="Wellington"),
+    }
+
+
+def test_import_csv(tmp_path, references):
+    categories = "|".join(c.name for c in references["categories"])
+    path = tmp_path / "events.csv"
+    path.write_text(
+        CSV_HEADER + f"Waterloo,1815-06-18,1815-06-18,d,3,9,modern,battle,{categories},"
+        "Wellington,war|europe\n" + "Trafalgar,1805-10-21,,d,3,8,Modern,Battle,,,war\n",
+    )
+
+    call_command("import_events", str(path))
+
+    waterloo = HistoricalEvent.objects.get(name="Waterloo")
+    assert waterloo.era == references["era"]
+    assert set(waterloo.categories.all()) == set(references["categories"])
+    assert list(waterloo.key_figures.all()) == [references["figure"]]
+    assert set(waterloo.tags.names()) == {"war", "europe"}
+    trafalgar = HistoricalEvent.objects.get(name="Trafalgar")
+    assert trafalgar.end_date is None
+    assert list(trafalgar.tags.names()) == ["war"]
+
+
+def test_import_jsonl_rejects_bad_batch(tmp_path, references):
+    rows = [
+        {
+            "name": "Backwards",
+            "start_date": "1900-01-02",
+            "end_date": "1900-01-01",
+            "description": "d",
+            "impact_level": 1,
+            "significance_rating": 1,
+            "era": "modern",
+            "category": "battle",
+        },
+    ]
+    path = tmp_path / "events.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in rows))
+
+    with pytest.raises(CommandError, match="line 1: Start date must be before"):
+        call_command("import_events", str(path))
+    assert not HistoricalEvent.objects.exists()
+
+
+def test_import_skip_invalid(tmp_path, references):
+    path = tmp_path / "events.csv"
+    path.write_text(
+        CSV_HEADER
+        + "Good,1900-01-01,,d,1,1,modern,battle,,,\n"
+        + "Unknown era,1900-01-01,,d,1,1,nope,battle,,,\n",
+    )
+
+    call_command("import_events", str(path), "--skip-invalid")
+
+    assert list(HistoricalEvent.objects.values_list("name", flat=True)) == ["Good"]
+
+
+def test_import_reports_malformed_json(tmp_path, references):
+    row = {
+        "name": "Good",
+        "start_date": "1900-01-01",
+        "description": "d",
+        "impact_level": 1,
+        "significance_rating": 1,
+        "era": "modern",
+        "category": "battle",
+    }
+    path = tmp_path / "events.jsonl"
+    path.write_text(json.dumps(row) + '\n{"name": "Broken",\n')
+
+    with pytest.raises(CommandError, match="line 2: invalid JSON"):
+        call_command("import_events", str(path))
+    assert not HistoricalEvent.objects.exists()
+
+    call_command("import_events", str(path), "--skip-invalid")
+
+    assert list(HistoricalEvent.objects.values_list("name", flat=True)) == ["Good"]
+
+
+def test_import_invalidates_cached_suggestions(
+    tmp_path,
+    references,
+    django_capture_on_commit_callbacks,
+):
+    assert suggest("wat") == []
+    path = tmp_path / "events.csv"
+    path.write_text(CSV_HEADER + "Waterloo,1815-06-18,,d,3,9,modern,battle,,,war\n")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("import_events", str(path))
+
+    assert [row["label"] for row in suggest("wat")] == ["Waterloo"]
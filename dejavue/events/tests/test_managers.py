@@ -0,0 +1,63 @@
+import datetime
+
+import pytest
+
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def events():
+    return {
+        "war": HistoricalEventFactory(
+            start_date=datetime.date(1914, 7, 28),
+            end_date=datetime.date(1918, 11, 11),
+        ),
+        "armistice": HistoricalEventFactory(
+            start_date=datetime.date(1918, 11, 11),
+            end_date=None,
+        ),
+        "treaty": HistoricalEventFactory(
+            start_date=datetime.date(1919, 6, 28),
+            end_date=None,
+        ),
+    }
+
+
+def _names(queryset, events):
+    pks = set(queryset.values_list("pk", flat=True))
+    return {name for name, event in events.items() if event.pk in pks}
+
+
+def test_overlapping(events):
+    queryset = HistoricalEvent.objects.overlapping(
+        datetime.date(1918, 1, 1),
+        datetime.date(1918, 12, 31),
+    )
+    assert _names(queryset, events) == {"war", "armistice"}
+
+
+def test_overlapping_open_ended(events):
+    queryset = HistoricalEvent.objects.overlapping(datetime.date(1919, 1, 1), None)
+    assert _names(queryset, events) == {"treaty"}
+
+
+def test_contained_in(events):
+    queryset = HistoricalEvent.objects.contained_in(
+        datetime.date(1918, 1, 1),
+        datetime.date(1919, 12, 31),
+    )
+    assert _names(queryset, events) == {"armistice", "treaty"}
+
+
+def test_active_at_treats_missing_end_as_single_day(events):
+    assert _names(
+        HistoricalEvent.objects.active_at(datetime.date(1918, 11, 11)),
+        events,
+    ) == {"war", "armistice"}
+    assert not _names(
+        HistoricalEvent.objects.active_at(datetime.date(1918, 11, 12)),
+        events,
+    )
@@ -0,0 +1,133 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.models import TimelineEvent
+from dejavue.events.ordering import ORDER_GAP
+from dejavue.events.ordering import apply_moves
+from dejavue.events.ordering import crowded_timelines
+from dejavue.events.ordering import rebalance
+from dejavue.events.tasks import rebalance_timelines
+from dejavue.events.tests.factories import TimelineEventFactory
+from dejavue.events.tests.factories import TimelineFactory
+from dejavue.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _timeline(orders, **kwargs):
+    timeline = TimelineFactory(**kwargs)
+    rows = [TimelineEventFactory(timeline=timeline, order=order) for order in orders]
+    return timeline, rows
+
+
+def _sequence(timeline):
+    return list(
+        TimelineEvent.objects.filter(timeline=timeline)
+        .order_by("order", "id")
+        .values_list("pk", flat=True),
+    )
+
+
+def test_move_writes_one_row():
+    timeline, rows = _timeline([ORDER_GAP * i for i in range(1, 6)])
+    before = {
+        row.pk: (row.order, row.updated_at)
+        for row in TimelineEvent.objects.filter(timeline=timeline)
+    }
+
+    (moved,) = apply_moves(timeline, [(rows[-1].pk, None)])
+
+    assert _sequence(timeline) == [rows[-1].pk] + [row.pk for row in rows[:-1]]
+    assert moved.order == 0
+    after = {
+        row.pk: (row.order, row.updated_at)
+        for row in TimelineEvent.objects.filter(timeline=timeline)
+    }
+    assert {pk for pk in before if before[pk] != after[pk]} == {rows[-1].pk}
+
+
+def test_moves_apply_in_turn():
+    timeline, (a, b, c, d) = _timeline([ORDER_GAP * i for i in range(1, 5)])
+
+    apply_moves(timeline, [(a.pk, d.pk), (c.pk, None), (b.pk, a.pk)])
+
+    assert _sequence(timeline) == [c.pk, d.pk, a.pk, b.pk]
+
+
+def test_full_gaps_are_rebalanced():
+    timeline, (a, b, c) = _timeline([1, 2, 3])
+
+    apply_moves(timeline, [(c.pk, a.pk)])
+
+    assert _sequence(timeline) == [a.pk, c.pk, b.pk]
+    orders = sorted(
+        TimelineEvent.objects.filter(timeline=timeline).values_list("order", flat=True),
+    )
+    assert orders[1] - orders[0] >= ORDER_GAP // 2
+
+
+def test_unknown_rows_are_rejected():
+    timeline, (a, _) = _timeline([ORDER_GAP, 2 * ORDER_GAP])
+    _, (other,) = _timeline([ORDER_GAP])
+
+    with pytest.raises(ValueError, match="Not rows of this timeline"):
+        apply_moves(timeline, [(a.pk, other.pk)])
+    with pytest.raises(ValueError, match="after itself"):
+        apply_moves(timeline, [(a.pk, a.pk)])
+
+
+def test_crowded_timelines_are_rebalanced():
+    crowded, rows = _timeline([5, 3, 3])
+    spacious, _ = _timeline([ORDER_GAP, 2 * ORDER_GAP])
+    expected = [rows[1].pk, rows[2].pk, rows[0].pk]
+
+    assert crowded_timelines() == [crowded.pk]
+    assert rebalance_timelines() == 1
+
+    assert _sequence(crowded) == expected
+    assert crowded_timelines() == []
+    assert rebalance([spacious.pk]) == 0
+
+
+class TestMovesApi:
+    def _url(self, timeline):
+        return reverse("api:timeline-moves", kwargs={"pk": timeline.pk})
+
+    def test_moves(self, api_client, user: User):
+        timeline, (a, b) = _timeline([ORDER_GAP, 2 * ORDER_GAP], created_by=user)
+
+        response = api_client.post(
+            self._url(timeline),
+            {"moves": [{"id": b.pk, "after": None}]},
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.data == [{"id": b.pk, "order": 0}]
+        assert _sequence(timeline) == [b.pk, a.pk]
+
+    def test_invalid_moves(self, api_client, user: User):
+        timeline, (a, _) = _timeline([ORDER_GAP, 2 * ORDER_GAP], created_by=user)
+        url = self._url(timeline)
+
+        bodies: list[dict[str, list[dict[str, int]]]] = [
+            {"moves": []},
+            {"moves": [{"id": a.pk, "after": 0}]},
+        ]
+        for body in bodies:
+            response = api_client.post(url, body, format="json")
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_only_the_owner_reorders(self, api_client):
+        timeline, (a, b) = _timeline([ORDER_GAP, 2 * ORDER_GAP], is_public=True)
+
+        response = api_client.post(
+            self._url(timeline),
+            {"moves": [{"id": b.pk, "after": None}]},
+            format="json",
+        )
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        assert _sequence(timeline) == [a.pk, b.pk]
@@ -0,0 +1,77 @@
+import datetime
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.events.tests.factories import TimelineEventFactory
+from dejavue.events.tests.factories import TimelineFactory
+from dejavue.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _ids(response):
+    return [row["id"] for row in response.data["results"]]
+
+
+def test_event_pages_follow_start_date_then_id(api_client):
+    day = datetime.date(1815, 6, 18)
+    # Ties on start_date must be broken by id without skipping rows.
+    events = [
+        *HistoricalEventFactory.create_batch(3, start_date=day),
+        *HistoricalEventFactory.create_batch(2, start_date=day.replace(year=1805)),
+    ]
+    expected = [e.pk for e in sorted(events, key=lambda e: (e.start_date, e.pk))]
+
+    response = api_client.get(reverse("api:historicalevent-list"), {"page_size": 2})
+    seen = _ids(response)
+    assert response.data["previous"] is None
+    while response.data["next"]:
+        response = api_client.get(response.data["next"])
+        seen += _ids(response)
+
+    assert seen == expected
+
+
+def test_event_previous_link_returns_prior_page(api_client):
+    HistoricalEventFactory.create_batch(5)
+    url = reverse("api:historicalevent-list")
+
+    first = api_client.get(url, {"page_size": 2})
+    second = api_client.get(first.data["next"])
+    back = api_client.get(second.data["previous"])
+
+    assert _ids(back) == _ids(first)
+
+
+def test_invalid_cursor_is_not_found(api_client):
+    response = api_client.get(
+        reverse("api:historicalevent-list"),
+        {"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_timeline_events_follow_order(api_client, user: User):
+    timeline = TimelineFactory(created_by=user, is_public=False)
+    rows = [
+        TimelineEventFactory(timeline=timeline, order=order) for order in (3, 1, 2, 1)
+    ]
+    expected = [r.pk for r in sorted(rows, key=lambda r: (r.order, r.pk))]
+
+    url = reverse("api:timeline-events", kwargs={"pk": timeline.pk})
+    response = api_client.get(url, {"page_size": 3})
+    seen = _ids(response)
+    response = api_client.get(response.data["next"])
+    seen += _ids(response)
+
+    assert seen == expected
+    assert response.data["next"] is None
+
+
+def test_private_timelines_are_hidden(api_client):
+    timeline = TimelineFactory(is_public=False)
+    url = reverse("api:timeline-events", kwargs={"pk": timeline.pk})
+    assert api_client.get(url).status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,97 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.related import MAX_DEPTH
+from dejavue.events.related import MAX_FANOUT
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def chain():
+    """a -> b -> c -> d, c -> a (a cycle), a -> e"""
+    a, b, c, d, e = HistoricalEventFactory.create_batch(5)
+    a.related_events.add(b, e)
+    b.related_events.add(c)
+    c.related_events.add(d, a)
+    return a, b, c, d, e
+
+
+def _distances(rows):
+    return {row.pk: row.distance for row in rows}
+
+
+def test_neighbourhood_reports_distance_in_one_query(chain, django_assert_num_queries):
+    a, b, c, d, e = chain
+
+    with django_assert_num_queries(1):
+        rows = list(HistoricalEvent.objects.neighbourhood(a.pk, depth=3))
+
+    assert _distances(rows) == {b.pk: 1, e.pk: 1, c.pk: 2, d.pk: 3}
+
+
+def test_neighbourhood_respects_depth_and_direction(chain):
+    a, b, c, d, e = chain
+
+    assert _distances(HistoricalEvent.objects.neighbourhood(a.pk, depth=1)) == {
+        b.pk: 1,
+        e.pk: 1,
+    }
+    assert _distances(
+        HistoricalEvent.objects.neighbourhood(d.pk, depth=2, direction="in"),
+    ) == {c.pk: 1, b.pk: 2}
+
+
+def test_neighbourhood_caps_fanout(chain):
+    a, *_ = chain
+    rows = list(HistoricalEvent.objects.neighbourhood(a.pk, depth=1, fanout=1))
+    assert len(rows) == 1
+
+
+def test_neighbourhood_endpoint(chain, api_client):
+    a, b, *_ = chain
+
+    response = api_client.get(
+        reverse("api:historicalevent-neighbourhood", kwargs={"pk": a.pk}),
+        {"depth": "1", "direction": "sideways"},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    response = api_client.get(
+        reverse("api:historicalevent-neighbourhood", kwargs={"pk": b.pk}),
+        {"depth": "1"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert [row["distance"] for row in response.data] == [1]
+
+
+def test_neighbourhood_stays_bounded_on_dense_graphs(django_assert_num_queries):
+    # 30 events all related to each other: 29 * 28 * 27 * 26 * 25 paths of
+    # length 5, but only 30 distinct events per level.
+    events = HistoricalEventFactory.create_batch(30)
+    through = HistoricalEvent.related_events.through
+    through.objects.bulk_create(
+        through(from_historicalevent=source, to_historicalevent=target)
+        for source in events
+        for target in events
+        if source != target
+    )
+    root, *others = events
+
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL statement_timeout = '5s'")
+    with django_assert_num_queries(1):
+        rows = list(
+            HistoricalEvent.objects.neighbourhood(
+                root.pk,
+                depth=MAX_DEPTH,
+                fanout=MAX_FANOUT,
+            ),
+        )
+
+    assert _distances(rows) == {event.pk: 1 for event in others}
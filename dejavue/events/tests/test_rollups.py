@@ -0,0 +1,120 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from dejavue.events.models import ConsequenceRollup
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import ConsequenceFactory
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _summary(event):
+    event.refresh_from_db()
+    return (
+        event.consequence_count,
+        event.consequence_impact_avg,
+        event.consequence_impact_max,
+    )
+
+
+def _rollups(event):
+    return {
+        rollup.timeframe: (rollup.count, rollup.impact_avg, rollup.impact_max)
+        for rollup in ConsequenceRollup.objects.filter(event=event)
+    }
+
+
+@pytest.fixture
+def event():
+    return HistoricalEventFactory()
+
+
+def test_new_consequences_fold_into_rollups(event):
+    ConsequenceFactory(event=event, impact_level=2, timeframe="immediate")
+    ConsequenceFactory(event=event, impact_level=6, timeframe="immediate")
+    ConsequenceFactory(event=event, impact_level=7, timeframe="long-term")
+
+    assert _summary(event) == (3, 5.0, 7)
+    assert _rollups(event) == {
+        "immediate": (2, 4.0, 6),
+        "long-term": (1, 7.0, 7),
+    }
+
+
+def test_edits_and_deletes_recompute_rollups(event):
+    other = HistoricalEventFactory()
+    low = ConsequenceFactory(event=event, impact_level=2)
+    high = ConsequenceFactory(event=event, impact_level=8)
+
+    high.delete()
+    assert _summary(event) == (1, 2.0, 2)
+
+    low.event = other
+    low.timeframe = "short-term"
+    low.save()
+    assert _summary(event) == (0, 0.0, 0)
+    assert _rollups(event) == {}
+    assert _rollups(other) == {"short-term": (1, 2.0, 2)}
+
+
+def test_saving_a_stale_event_keeps_rollups(event):
+    ConsequenceFactory(event=event, impact_level=4)
+
+    event.name = "Renamed"
+    event.save()
+
+    assert _summary(event) == (1, 4.0, 4)
+    assert event.name == "Renamed"
+
+
+def test_reconcile_command_repairs_drift(event):
+    ConsequenceFactory(event=event, impact_level=4)
+    HistoricalEvent.objects.filter(pk=event.pk).update(consequence_count=99)
+    ConsequenceRollup.objects.all().delete()
+
+    call_command("reconcile_consequence_rollups", batch_size=1)
+
+    assert _summary(event) == (1, 4.0, 4)
+    assert _rollups(event) == {"immediate": (1, 4.0, 4)}
+
+
+class TestEndpoints:
+    def test_list_ordered_by_impact(self, api_client):
+        quiet, loud, medium = HistoricalEventFactory.create_batch(3)
+        ConsequenceFactory(event=loud, impact_level=9)
+        ConsequenceFactory(event=medium, impact_level=5)
+
+        response = api_client.get(
+            reverse("api:historicalevent-list"),
+            {"ordering": "impact", "page_size": 2},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert [row["id"] for row in response.data["results"]] == [loud.pk, medium.pk]
+        assert response.data["results"][0]["consequence_impact_max"] == 9  # noqa: PLR2004
+
+        response = api_client.get(response.data["next"])
+        assert [row["id"] for row in response.data["results"]] == [quiet.pk]
+
+    def test_unknown_ordering(self, api_client):
+        response = api_client.get(
+            reverse("api:historicalevent-list"),
+            {"ordering": "name"},
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_consequences(self, api_client, event):
+        ConsequenceFactory(event=event, impact_level=3, timeframe="short-term")
+
+        response = api_client.get(
+            reverse("api:historicalevent-consequences", kwargs={"pk": event.pk}),
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.data == [
+            {"timeframe": "short-term", "count": 1, "impact_avg": 3.0, "impact_max": 3},
+        ]
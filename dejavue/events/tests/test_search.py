@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from dejavue.events.models import HistoricalEvent
+from dejavue.events.tests.factories import HistoricalEventFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_trigger_maintains_search_vector():
+    event = HistoricalEventFactory(name="Siege of Vienna")
+    assert HistoricalEvent.objects.search("vienna").get() == event
+
+    event.name = "Relief of Vienna"
+    event.description = "The Ottoman army withdrew."
+    event.save()
+    assert HistoricalEvent.objects.search("ottoman").get() == event
+
+
+def test_name_ranks_above_sources():
+    in_sources = HistoricalEventFactory(name="Treaty", sources="Westphalia archive")
+    in_name = HistoricalEventFactory(name="Peace of Westphalia")
+
+    results = list(HistoricalEvent.objects.search("westphalia"))
+
+    assert results == [in_name, in_sources]
+
+
+def test_search_endpoint_highlights(api_client):
+    HistoricalEventFactory(name="Battle", description="Fought near Waterloo.")
+
+    response = api_client.get(reverse("api:historicalevent-search"), {"q": "waterloo"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.data["count"] == 1
+    assert "<mark>Waterloo</mark>" in response.data["results"][0]["headline"]
+
+
+def test_headline_escapes_the_description():
+    HistoricalEventFactory(
+        name="Battle",
+        description='Fought near <a href="x">Waterloo</a> & Ligny.',
+    )
+
+    (event,) = HistoricalEvent.objects.search("waterloo")
+
+    assert "<a" not in event.headline
+    assert "&lt;a href=&quot;x&quot;&gt;" in event.headline
+    assert "<mark>Waterloo</mark>" in event.headline
+    assert "&amp; Ligny" in event.headline
+
+
+def test_backfill_command():
+    event = HistoricalEventFactory(name="Congress of Vienna")
+    HistoricalEvent.objects.filter(pk=event.pk).update(search_vector=None)
+
+    call_command("backfill_search_vectors", "--batch-size", "1")
+
+    assert HistoricalEvent.objects.search("congress").get() == event
@@ -0,0 +1,89 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.gis.geos import Polygon
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dejavue.events.models import SimplifiedImpactGeometry
+from dejavue.events.tests.factories import GeopoliticalImpactFactory
+from dejavue.events.tiles import SIMPLIFIED_ZOOMS
+from dejavue.events.tiles import cached_tile
+from dejavue.events.tiles import render_tile
+from dejavue.events.tiles import simplified_zoom
+from dejavue.events.tiles import simplify_impacts
+
+pytestmark = pytest.mark.django_db
+
+# Tiles containing (2.5, 48.5), around Paris, and one on the other side.
+PARIS_TILES = [(0, 0, 0), (5, 16, 11), (10, 519, 353), (15, 16611, 11322)]
+ELSEWHERE = (5, 0, 22)
+
+
+def test_simplified_zoom():
+    assert simplified_zoom(0) == 0
+    assert simplified_zoom(5) == 4  # noqa: PLR2004
+    assert simplified_zoom(12) == 12  # noqa: PLR2004
+    assert simplified_zoom(13) is None
+
+
+def test_simplify_impacts():
+    impact = GeopoliticalImpactFactory()
+    other = GeopoliticalImpactFactory()
+    SimplifiedImpactGeometry.objects.all().delete()
+
+    simplify_impacts([impact.pk])
+
+    rows = SimplifiedImpactGeometry.objects.filter(impact=impact)
+    assert sorted(rows.values_list("zoom", flat=True)) == list(SIMPLIFIED_ZOOMS)
+    assert {row.geometry.srid for row in rows} == {3857}
+    assert not SimplifiedImpactGeometry.objects.filter(impact=other).exists()
+
+
+def test_render_tile(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        GeopoliticalImpactFactory()
+
+    for z, x, y in PARIS_TILES:
+        assert render_tile(z, x, y), (z, x, y)
+    assert render_tile(*ELSEWHERE) == b""
+
+
+def test_cached_tile_follows_impacts(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        impact = GeopoliticalImpactFactory()
+    assert cached_tile(*PARIS_TILES[1])
+    assert cached_tile(*ELSEWHERE) == b""
+
+    with django_capture_on_commit_callbacks(execute=True):
+        impact.geometry = Polygon.from_bbox((-179, -60, -178, -59))
+        impact.save()
+    assert cached_tile(*PARIS_TILES[1]) == b""
+    assert cached_tile(*ELSEWHERE)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        impact.delete()
+    assert cached_tile(*ELSEWHERE) == b""
+
+
+class TestTileView:
+    def test_tile(self, api_client, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            GeopoliticalImpactFactory()
+        z, x, y = PARIS_TILES[1]
+        url = reverse("impact-tile", kwargs={"z": z, "x": x, "y": y})
+
+        response = api_client.get(url, HTTP_ACCEPT="application/x-protobuf")
+
+        assert url == f"/tiles/{z}/{x}/{y}.mvt"
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/vnd.mapbox-vector-tile"
+        assert response.content
+
+    def test_out_of_range(self, api_client):
+        url = reverse("impact-tile", kwargs={"z": 2, "x": 4, "y": 0})
+        assert api_client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+    def test_requires_authentication(self):
+        url = reverse("impact-tile", kwargs={"z": 0, "x": 0, "y": 0})
+        assert APIClient().get(url).status_code == HTTPStatus.FORBIDDEN
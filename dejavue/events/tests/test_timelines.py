@@ -0,0 +1,103 @@
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.tests.factories import TimelineEventFactory
+from dejavue.events.tests.factories import TimelineFactory
+from dejavue.events.timelines import PAYLOAD_FIELDS
+from dejavue.events.timelines import timeline_etag
+from dejavue.events.timelines import timeline_payload
+from dejavue.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def timeline(user: User):
+    timeline = TimelineFactory(created_by=user, is_public=False)
+    for order in (2, 1, 3):
+        TimelineEventFactory(timeline=timeline, order=order)
+    return timeline
+
+
+def _url(timeline):
+    return reverse("api:timeline-payload", kwargs={"pk": timeline.pk})
+
+
+def test_payload_and_etag_take_one_query_each(timeline, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        payload = timeline_payload(timeline)
+    with django_assert_num_queries(1):
+        timeline_etag(timeline)
+    assert len(payload["events"]) == 3  # noqa: PLR2004
+
+
+def test_payload(api_client, timeline):
+    response = api_client.get(_url(timeline))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.data["fields"] == [name for name, _ in PAYLOAD_FIELDS]
+    rows = timeline.timelineevent_set.select_related("event__era").order_by("order")
+    fields = response.data["fields"]
+    assert [row[fields.index("id")] for row in response.data["events"]] == [
+        row.event_id for row in rows
+    ]
+    first = dict(zip(fields, response.data["events"][0], strict=True))
+    assert first["order"] == 1
+    assert first["era"] == rows[0].event.era.name
+    assert response["ETag"]
+
+
+def test_unchanged_timeline_is_not_modified(api_client, timeline):
+    etag = api_client.get(_url(timeline))["ETag"]
+
+    response = api_client.get(_url(timeline), HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda timeline: timeline.save(),
+        lambda timeline: timeline.timelineevent_set.first().save(),
+        lambda timeline: timeline.timelineevent_set.last().event.save(),
+        lambda timeline: timeline.timelineevent_set.first().delete(),
+        lambda timeline: TimelineEventFactory(timeline=timeline),
+    ],
+)
+def test_changes_invalidate_the_etag(api_client, timeline, change):
+    etag = api_client.get(_url(timeline))["ETag"]
+
+    change(timeline)
+
+    response = api_client.get(_url(timeline), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response["ETag"] != etag
+
+
+@pytest.mark.parametrize("related", ["era", "category", "location"])
+def test_related_renames_invalidate_the_etag(
+    api_client,
+    timeline,
+    related,
+    django_capture_on_commit_callbacks,
+):
+    etag = api_client.get(_url(timeline))["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row = getattr(timeline.timelineevent_set.first().event, related)
+        row.name = "Renamed"
+        row.save()
+
+    response = api_client.get(_url(timeline), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response["ETag"] != etag
+
+
+def test_private_timelines_are_hidden(api_client):
+    timeline = TimelineFactory(is_public=False)
+    assert api_client.get(_url(timeline)).status_code == HTTPStatus.NOT_FOUND
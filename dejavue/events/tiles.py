@@ -0,0 +1,137 @@
+"""Mapbox vector tiles of GeopoliticalImpact geometries."""
+
+from django.core.cache import cache
+from django.db import connections
+from django.db import transaction
+
+from .cache import get_generation
+
+TILE_NAMESPACE = "events:impact-tiles"
+TILE_TIMEOUT = 24 * 60 * 60
+MAX_ZOOM = 22
+# Zoom levels with a precomputed simplification; a tile uses the deepest one
+# at or above its own zoom. Past the last level geometries are used as
+# stored, since a tile then only covers a small area.
+SIMPLIFIED_ZOOMS = (0, 2, 4, 6, 8, 10, 12)
+EXTENT = 4096
+BUFFER = 64
+LAYER = "impacts"
+# Width of the Web Mercator square in meters.
+WORLD_SIZE = 40_075_016.68557849
+# Simplify to about one screen pixel of a 256 pixel tile.
+TILE_PIXELS = 256
+
+SIMPLIFY_SQL = """
+INSERT INTO events_simplifiedimpactgeometry (impact_id, zoom, geometry)
+SELECT impact.id, level.zoom, ST_SimplifyPreserveTopology(
+    ST_Transform(
+        ST_Intersection(
+            impact.geometry,
+            ST_MakeEnvelope(-180, -85.0511287798, 180, 85.0511287798, 4326)
+        ),
+        3857
+    ),
+    level.tolerance
+)
+FROM events_geopoliticalimpact AS impact
+CROSS JOIN unnest(%(zooms)s::integer[], %(tolerances)s::double precision[])
+    AS level (zoom, tolerance)
+WHERE %(ids)s::bigint[] IS NULL OR impact.id = ANY(%(ids)s::bigint[])
+ON CONFLICT (zoom, impact_id) DO UPDATE SET geometry = EXCLUDED.geometry
+"""
+SIMPLIFIED_TILE_SQL = """
+WITH features AS (
+    SELECT impact.id, impact.event_id, impact.impact_type,
+        impact.affected_population,
+        ST_AsMVTGeom(
+            simplified.geometry,
+            ST_TileEnvelope(%(z)s, %(x)s, %(y)s),
+            %(extent)s,
+            %(buffer)s
+        ) AS geom
+    FROM events_simplifiedimpactgeometry AS simplified
+    JOIN events_geopoliticalimpact AS impact ON impact.id = simplified.impact_id
+    WHERE simplified.zoom = %(level)s
+        AND simplified.geometry && ST_TileEnvelope(%(z)s, %(x)s, %(y)s)
+)
+SELECT ST_AsMVT(features, %(layer)s, %(extent)s, 'geom')
+FROM features
+WHERE geom IS NOT NULL
+"""
+DETAILED_TILE_SQL = """
+WITH features AS (
+    SELECT impact.id, impact.event_id, impact.impact_type,
+        impact.affected_population,
+        ST_AsMVTGeom(
+            ST_Transform(impact.geometry, 3857),
+            ST_TileEnvelope(%(z)s, %(x)s, %(y)s),
+            %(extent)s,
+            %(buffer)s
+        ) AS geom
+    FROM events_geopoliticalimpact AS impact
+    WHERE impact.geometry && ST_Transform(ST_TileEnvelope(%(z)s, %(x)s, %(y)s), 4326)
+)
+SELECT ST_AsMVT(features, %(layer)s, %(extent)s, 'geom')
+FROM features
+WHERE geom IS NOT NULL
+"""
+
+
+def tolerance(zoom):
+    """Simplification tolerance at ``zoom``, in Web Mercator meters."""
+    return WORLD_SIZE / (2**zoom * TILE_PIXELS)
+
+
+def simplified_zoom(zoom):
+    """The precomputed level used for tiles at ``zoom``, or None."""
+    if zoom > SIMPLIFIED_ZOOMS[-1]:
+        return None
+    return max(level for level in SIMPLIFIED_ZOOMS if level <= zoom)
+
+
+def simplify_impacts(impact_ids=None, using="default"):
+    """
+    Store the geometry of the given impacts (default: all) simplified for
+    every level in ``SIMPLIFIED_ZOOMS``, in one statement. Geometries are
+    clipped to the Web Mercator square first.
+    """
+    params = {
+        "ids": None if impact_ids is None else list(impact_ids),
+        "zooms": list(SIMPLIFIED_ZOOMS),
+        "tolerances": [tolerance(zoom) for zoom in SIMPLIFIED_ZOOMS],
+    }
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(SIMPLIFY_SQL, params)
+        return cursor.rowcount
+
+
+def render_tile(z, x, y, using="default"):
+    """Tile ``z/x/y`` of every impact, as MVT bytes, from one query."""
+    level = simplified_zoom(z)
+    params = {
+        "z": z,
+        "x": x,
+        "y": y,
+        "level": level,
+        "extent": EXTENT,
+        "buffer": BUFFER,
+        "layer": LAYER,
+    }
+    sql = DETAILED_TILE_SQL if level is None else SIMPLIFIED_TILE_SQL
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        return bytes(cursor.fetchone()[0] or b"")
+
+
+def cached_tile(z, x, y):
+    """
+    :func:`render_tile`, cached under the generation of ``TILE_NAMESPACE``,
+    which events.signals and the simplification task bump whenever impacts
+    change.
+    """
+    key = f"{TILE_NAMESPACE}:{get_generation(TILE_NAMESPACE)}:{z}/{x}/{y}"
+    tile = cache.get(key)
+    if tile is None:
+        tile = render_tile(z, x, y)
+        cache.set(key, tile, TILE_TIMEOUT)
+    return tile
@@ -0,0 +1,72 @@
+"""Compact rendering payload for events.Timeline."""
+
+import hashlib
+
+from django.db.models import Count
+from django.db.models import Max
+
+from .cache import get_generation
+from .models import TimelineEvent
+
+# Bumped by events.signals when an era, category or location changes: the
+# payload shows their names and coordinates, which carry no updated_at.
+PAYLOAD_NAMESPACE = "events:timeline-payloads"
+
+# (name in the payload, lookup from TimelineEvent), in tuple order.
+PAYLOAD_FIELDS = (
+    ("order", "order"),
+    ("note", "custom_note"),
+    ("id", "event_id"),
+    ("name", "event__name"),
+    ("start_date", "event__start_date"),
+    ("end_date", "event__end_date"),
+    ("significance_rating", "event__significance_rating"),
+    ("era", "event__era__name"),
+    ("category", "event__category__name"),
+    ("location", "event__location__name"),
+    ("latitude", "event__location__latitude"),
+    ("longitude", "event__location__longitude"),
+)
+
+
+def timeline_etag(timeline):
+    """
+    Strong ETag for the payload of ``timeline``, from one aggregate query:
+    the latest ``updated_at`` of the timeline, its through rows and their
+    events, plus the row count so removals change it too, and the
+    generation of ``PAYLOAD_NAMESPACE`` for the related eras, categories and
+    locations.
+    """
+    state = TimelineEvent.objects.filter(timeline=timeline).aggregate(
+        rows=Max("updated_at"),
+        events=Max("event__updated_at"),
+        count=Count("id"),
+    )
+    version = ":".join(
+        [
+            str(timeline.pk),
+            timeline.updated_at.isoformat(),
+            *(str(state[name]) for name in ("rows", "events", "count")),
+            str(get_generation(PAYLOAD_NAMESPACE)),
+        ],
+    )
+    return f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"'
+
+
+def timeline_payload(timeline):
+    """
+    ``timeline`` and its events in ``order``, each event a tuple laid out as
+    ``fields``, read with one joined query and no model instances.
+    """
+    rows = (
+        TimelineEvent.objects.filter(timeline=timeline)
+        .order_by("order", "id")
+        .values_list(*(lookup for _, lookup in PAYLOAD_FIELDS))
+    )
+    return {
+        "id": timeline.pk,
+        "title": timeline.title,
+        "description": timeline.description,
+        "fields": [name for name, _ in PAYLOAD_FIELDS],
+        "events": list(rows),
+    }
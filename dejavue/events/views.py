@@ -1,3 +1,34 @@
-from django.shortcuts import render
+from django.http import Http404
+from rest_framework.negotiation import BaseContentNegotiation
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from .api.renderers import MVTRenderer
+from .tiles import MAX_ZOOM
+from .tiles import cached_tile
+
+
+class TileNegotiation(BaseContentNegotiation):
+    """Tiles come in one format, whatever the client accepts."""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class ImpactTileView(APIView):
+    """
+    ``/tiles/<z>/<x>/<y>.mvt``: GeopoliticalImpact geometries as a Mapbox
+    vector tile, in an ``impacts`` layer. Geometries are simplified for the
+    zoom level ahead of time and tiles are cached until impacts change.
+    """
+
+    renderer_classes = [MVTRenderer]
+    content_negotiation_class = TileNegotiation
+
+    def get(self, request, z, x, y):
+        if z > MAX_ZOOM or x >= 2**z or y >= 2**z:
+            raise Http404
+        return Response(cached_tile(z, x, y))
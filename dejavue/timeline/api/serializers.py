@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from dejavue.timeline.models import WhatIfScenario
+
+
+class WhatIfScenarioSerializer(serializers.ModelSerializer[WhatIfScenario]):
+    class Meta:
+        model = WhatIfScenario
+        fields = [
+            "id",
+            "url",
+            "name",
+            "description",
+            "original_timeline",
+            "version",
+        ]
+
+        extra_kwargs = {
+            "url": {"view_name": "api:whatifscenario-detail", "lookup_field": "pk"},
+        }
@@ -0,0 +1,55 @@
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.mixins import ListModelMixin
+from rest_framework.mixins import RetrieveModelMixin
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from dejavue.events.api.pagination import KeysetPagination
+from dejavue.events.api.renderers import NDJSONRenderer
+from dejavue.timeline.diff import CHANGES
+from dejavue.timeline.diff import iter_diff_ndjson
+from dejavue.timeline.models import WhatIfScenario
+from dejavue.timeline.scenarios import resolved_events
+
+from .serializers import WhatIfScenarioSerializer
+
+
+class WhatIfScenarioViewSet(RetrieveModelMixin, ListModelMixin, GenericViewSet):
+    serializer_class = WhatIfScenarioSerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ("id",)
+    queryset = WhatIfScenario.objects.all()
+    lookup_field = "pk"
+
+    @action(detail=True, pagination_class=None)
+    def events(self, request, pk=None):
+        """
+        The events of the scenario: the original timeline's with its deltas
+        applied, in date order. ``overridden`` marks events with new dates.
+        """
+        return Response(resolved_events(self.get_object()))
+
+    @action(detail=True, renderer_classes=[NDJSONRenderer, JSONRenderer])
+    def diff(self, request, pk=None):
+        """
+        Stream the events added, removed, shared or moved in time (``changed``)
+        relative to the original timeline as NDJSON, in date order.
+        ``?change=added,removed`` keeps only those kinds.
+        """
+        scenario = self.get_object()
+        changes = {
+            value.strip()
+            for raw in request.query_params.getlist("change")
+            for value in raw.split(",")
+            if value.strip()
+        }
+        if unknown := changes - set(CHANGES):
+            msg = f"Unknown changes: {', '.join(sorted(unknown))}."
+            raise ValidationError({"change": msg})
+        return StreamingHttpResponse(
+            iter_diff_ndjson(scenario, sorted(changes) or CHANGES),
+            content_type=NDJSONRenderer.media_type,
+        )
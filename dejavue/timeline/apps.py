@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TimelineConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dejavue.timeline"
+
+    def ready(self):
+        import dejavue.timeline.signals  # noqa: F401
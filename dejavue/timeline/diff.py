@@ -0,0 +1,98 @@
+"""
+Differences between a WhatIfScenario and its original timeline.
+
+Both event lists stay in the database: the diff is one set-based query
+over the timeline and the scenario resolved from its deltas (anti-joins for
+the added and removed events, a join for the shared ones) read through a
+server-side cursor, so memory stays flat and the cost is a couple of index
+scans however long the timelines are.
+"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+
+from dejavue.events.exporters import snapshot
+
+from .scenarios import SCENARIO_EVENTS_SQL
+from .scenarios import scenario_params
+
+DIFF_CHUNK_SIZE = 2000
+CHANGES = ("shared", "added", "removed", "changed")
+
+# {variant} selects the scenario's events. Timeline events the scenario
+# keeps are "changed" when an override delta gives them new dates.
+DIFF_TEMPLATE = """
+WITH original AS (
+    SELECT event.id, event.name, event.start_date, event.end_date
+    FROM timeline_timeline_events AS member
+    JOIN events_historicalevent AS event ON event.id = member.historicalevent_id
+    WHERE member.timeline_id = %(timeline)s
+),
+variant AS ({variant}),
+diff AS (
+    SELECT CASE WHEN variant.overridden THEN 'changed' ELSE 'shared' END AS change,
+        original.id, original.id AS original_id, original.name,
+        variant.start_date, variant.end_date,
+        original.start_date AS original_start_date,
+        original.end_date AS original_end_date
+    FROM original
+    JOIN variant ON variant.id = original.id
+    UNION ALL
+    SELECT 'added', variant.id, NULL, variant.name,
+        variant.start_date, variant.end_date, NULL, NULL
+    FROM variant
+    WHERE NOT EXISTS (SELECT 1 FROM original WHERE original.id = variant.id)
+    UNION ALL
+    SELECT 'removed', NULL, original.id, original.name,
+        NULL, NULL, original.start_date, original.end_date
+    FROM original
+    WHERE NOT EXISTS (SELECT 1 FROM variant WHERE variant.id = original.id)
+)
+SELECT change, id, original_id, name, start_date, end_date,
+    original_start_date, original_end_date
+FROM diff
+WHERE change = ANY(%(changes)s::text[])
+ORDER BY COALESCE(start_date, original_start_date), COALESCE(id, original_id)
+"""
+DIFF_SQL = DIFF_TEMPLATE.format(variant=SCENARIO_EVENTS_SQL)
+DIFF_FIELDS = (
+    "change",
+    "id",
+    "original_id",
+    "name",
+    "start_date",
+    "end_date",
+    "original_start_date",
+    "original_end_date",
+)
+
+
+def iter_diff(scenario, changes=CHANGES, chunk_size=DIFF_CHUNK_SIZE, using="default"):
+    """
+    Yield the diff of ``scenario`` against its original timeline, one dict
+    per event in date order, restricted to the kinds in ``changes``.
+
+    ``id`` is the event in the scenario and ``original_id`` the one in the
+    timeline: the same event for shared and changed rows, None for added
+    and removed ones.
+    """
+    params = {**scenario_params(scenario), "changes": list(changes)}
+    connection = connections[using]
+    with snapshot(using), connection.chunked_cursor() as cursor:
+        cursor.execute(DIFF_SQL, params)
+        while rows := cursor.fetchmany(chunk_size):
+            for row in rows:
+                yield dict(zip(DIFF_FIELDS, row, strict=True))
+
+
+def iter_diff_ndjson(scenario, changes=CHANGES, chunk_size=DIFF_CHUNK_SIZE):
+    """:func:`iter_diff` as NDJSON, one chunk of lines at a time."""
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    lines = []
+    for record in iter_diff(scenario, changes, chunk_size):
+        lines.append(encoder.encode(record))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
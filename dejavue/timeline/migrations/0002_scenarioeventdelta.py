@@ -0,0 +1,128 @@
+# Generated by Django 5.0.9 on 2026-10-17 20:25
+
+import django.db.models.deletion
+from django.db import migrations
+from django.db import models
+
+# modified_events held a full copy of the scenario's events. Keep only what
+# differs from the original timeline; scenarios never filled in had no edits.
+ADD_DELTAS = """
+INSERT INTO timeline_scenarioeventdelta (scenario_id, event_id, kind)
+SELECT modified.whatifscenario_id, modified.historicalevent_id, 'ADD'
+FROM timeline_whatifscenario_modified_events AS modified
+JOIN timeline_whatifscenario AS scenario
+    ON scenario.id = modified.whatifscenario_id
+WHERE NOT EXISTS (
+    SELECT 1 FROM timeline_timeline_events AS member
+    WHERE member.timeline_id = scenario.original_timeline_id
+        AND member.historicalevent_id = modified.historicalevent_id
+)
+"""
+REMOVE_DELTAS = """
+INSERT INTO timeline_scenarioeventdelta (scenario_id, event_id, kind)
+SELECT scenario.id, member.historicalevent_id, 'REMOVE'
+FROM timeline_whatifscenario AS scenario
+JOIN timeline_timeline_events AS member
+    ON member.timeline_id = scenario.original_timeline_id
+WHERE EXISTS (
+    SELECT 1 FROM timeline_whatifscenario_modified_events AS modified
+    WHERE modified.whatifscenario_id = scenario.id
+)
+    AND NOT EXISTS (
+        SELECT 1 FROM timeline_whatifscenario_modified_events AS modified
+        WHERE modified.whatifscenario_id = scenario.id
+            AND modified.historicalevent_id = member.historicalevent_id
+    )
+"""
+# Date overrides have no equivalent in modified_events and are dropped.
+COPY_EVENTS = """
+INSERT INTO timeline_whatifscenario_modified_events
+    (whatifscenario_id, historicalevent_id)
+SELECT scenario.id, member.historicalevent_id
+FROM timeline_whatifscenario AS scenario
+JOIN timeline_timeline_events AS member
+    ON member.timeline_id = scenario.original_timeline_id
+WHERE NOT EXISTS (
+    SELECT 1 FROM timeline_scenarioeventdelta AS delta
+    WHERE delta.scenario_id = scenario.id
+        AND delta.event_id = member.historicalevent_id
+        AND delta.kind = 'REMOVE'
+)
+UNION
+SELECT scenario_id, event_id
+FROM timeline_scenarioeventdelta
+WHERE kind = 'ADD'
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timeline", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="whatifscenario",
+            name="version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name="ScenarioEventDelta",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("ADD", "Added"),
+                            ("REMOVE", "Removed"),
+                            ("OVERRIDE", "Overridden"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                ("start_date", models.DateField(blank=True, null=True)),
+                ("end_date", models.DateField(blank=True, null=True)),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scenario_deltas",
+                        to="events.historicalevent",
+                    ),
+                ),
+                (
+                    "scenario",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deltas",
+                        to="timeline.whatifscenario",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("scenario", "event"),
+                        name="timeline_delta_scenario_event_uniq",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            [ADD_DELTAS, REMOVE_DELTAS],
+            COPY_EVENTS,
+        ),
+        migrations.RemoveField(
+            model_name="whatifscenario",
+            name="modified_events",
+        ),
+    ]
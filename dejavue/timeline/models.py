@@ -20,20 +20,21 @@ class WhatIfScenario(models.Model):
     """
     allows users to create alternative scenarios
     based on modifying events in a timeline.
+
+    Only the edits are stored, as ScenarioEventDelta rows on top of
+    ``original_timeline``; see timeline.scenarios for the resolved events.
     """
 
     name = models.CharField(max_length=255)
     description = models.TextField()
+    # Bumped by timeline.signals whenever a delta changes; keys the cache of
+    # the resolved events.
+    version = models.PositiveIntegerField(default=0, editable=False)
 
     original_timeline = models.ForeignKey(
         "timeline.Timeline",
         on_delete=models.CASCADE,
     )
-    modified_events = models.ManyToManyField(
-        "events.HistoricalEvent",
-        related_name="scenarios",
-        blank=True,
-    )
 
     class Meta:
         permissions = [
@@ -44,3 +45,42 @@ class WhatIfScenario(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class ScenarioEventDelta(models.Model):
+    """
+    One edit of a WhatIfScenario: an event added to or removed from its
+    original timeline, or one of the timeline's events with new dates.
+    """
+
+    KINDS = [
+        ("ADD", "Added"),
+        ("REMOVE", "Removed"),
+        ("OVERRIDE", "Overridden"),
+    ]
+
+    scenario = models.ForeignKey(
+        "timeline.WhatIfScenario",
+        on_delete=models.CASCADE,
+        related_name="deltas",
+    )
+    event = models.ForeignKey(
+        "events.HistoricalEvent",
+        on_delete=models.CASCADE,
+        related_name="scenario_deltas",
+    )
+    kind = models.CharField(max_length=8, choices=KINDS)
+    # Replace the event's own dates in the scenario; null keeps them.
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scenario", "event"],
+                name="timeline_delta_scenario_event_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.scenario} - {self.get_kind_display()} {self.event}"
@@ -0,0 +1,80 @@
+"""
+Events of a WhatIfScenario, resolved from its deltas.
+
+A scenario stores only its ScenarioEventDelta rows, so its storage grows
+with the edit rather than with the timeline. The effective events are the
+original timeline's minus the removed ones plus the added ones, with date
+overrides applied, all read in one query.
+"""
+
+from django.core.cache import cache
+from django.db import connections
+
+from dejavue.events.cache import get_generation
+
+SCENARIO_NAMESPACE = "timeline:scenarios"
+SCENARIO_TIMEOUT = 24 * 60 * 60
+
+# The effective events of scenario %(scenario)s over timeline %(timeline)s,
+# unordered, as (id, name, start_date, end_date, overridden).
+SCENARIO_EVENTS_SQL = """
+WITH delta AS (
+    SELECT event_id, kind, start_date, end_date
+    FROM timeline_scenarioeventdelta
+    WHERE scenario_id = %(scenario)s
+)
+SELECT event.id, event.name,
+    COALESCE(delta.start_date, event.start_date) AS start_date,
+    COALESCE(delta.end_date, event.end_date) AS end_date,
+    delta.event_id IS NOT NULL AS overridden
+FROM events_historicalevent AS event
+LEFT JOIN delta ON delta.event_id = event.id AND delta.kind = 'OVERRIDE'
+WHERE event.id IN (
+    SELECT member.historicalevent_id
+    FROM timeline_timeline_events AS member
+    WHERE member.timeline_id = %(timeline)s
+        AND NOT EXISTS (
+            SELECT 1 FROM delta
+            WHERE delta.event_id = member.historicalevent_id
+                AND delta.kind = 'REMOVE'
+        )
+    UNION ALL
+    SELECT event_id FROM delta WHERE kind = 'ADD'
+)
+"""
+RESOLVE_SQL = SCENARIO_EVENTS_SQL + "ORDER BY start_date, id"
+RESOLVED_FIELDS = ("id", "name", "start_date", "end_date", "overridden")
+
+
+def timeline_namespace(timeline_id):
+    """
+    Bumped by timeline.signals when the timeline's membership changes, or
+    one of its events or of the events its scenarios add.
+    """
+    return f"{SCENARIO_NAMESPACE}:timeline:{timeline_id}"
+
+
+def scenario_params(scenario):
+    return {"scenario": scenario.pk, "timeline": scenario.original_timeline_id}
+
+
+def resolve(scenario, using="default"):
+    """The effective events of ``scenario`` in date order, as dicts."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(RESOLVE_SQL, scenario_params(scenario))
+        return [dict(zip(RESOLVED_FIELDS, row, strict=True)) for row in cursor]
+
+
+def resolved_events(scenario):
+    """
+    :func:`resolve`, cached per scenario ``version`` and the generation of
+    its original timeline, which timeline.signals bump when the timeline or
+    any event the scenario can include changes.
+    """
+    generation = get_generation(timeline_namespace(scenario.original_timeline_id))
+    key = f"{SCENARIO_NAMESPACE}:{scenario.pk}:{scenario.version}:{generation}"
+    events = cache.get(key)
+    if events is None:
+        events = resolve(scenario)
+        cache.set(key, events, SCENARIO_TIMEOUT)
+    return events
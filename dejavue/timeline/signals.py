@@ -0,0 +1,65 @@
+from django.db.models import F
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from dejavue.events.cache import bump_on_commit
+from dejavue.events.models import HistoricalEvent
+
+from .models import ScenarioEventDelta
+from .models import Timeline
+from .models import WhatIfScenario
+from .scenarios import timeline_namespace
+
+
+@receiver(post_save, sender=ScenarioEventDelta)
+@receiver(post_delete, sender=ScenarioEventDelta)
+def bump_scenario_version(sender, instance, using, **kwargs):
+    # In the same transaction as the edit, so readers never pair the new
+    # version with the old deltas.
+    WhatIfScenario.objects.using(using).filter(pk=instance.scenario_id).update(
+        version=F("version") + 1,
+    )
+
+
+def _event_timelines(event, using):
+    """Timelines holding ``event`` and those of scenarios with a delta for it."""
+    members = (
+        Timeline.events.through.objects.using(using)
+        .filter(historicalevent=event)
+        .values_list("timeline_id", flat=True)
+    )
+    scenarios = (
+        WhatIfScenario.objects.using(using)
+        .filter(deltas__event=event)
+        .values_list("original_timeline_id", flat=True)
+    )
+    return set(members.union(scenarios))
+
+
+def _invalidate_timelines(timeline_ids):
+    if timeline_ids:
+        bump_on_commit(*(timeline_namespace(pk) for pk in timeline_ids))
+
+
+@receiver(m2m_changed, sender=Timeline.events.through)
+def invalidate_timeline_scenarios(sender, instance, action, using, **kwargs):
+    if not kwargs["reverse"]:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            bump_on_commit(timeline_namespace(instance.pk))
+    elif action in {"post_add", "post_remove"}:
+        _invalidate_timelines(kwargs["pk_set"])
+    elif action == "pre_clear":
+        # The event's timelines are unknown once cleared.
+        _invalidate_timelines(_event_timelines(instance, using))
+
+
+@receiver(post_save, sender=HistoricalEvent)
+@receiver(pre_delete, sender=HistoricalEvent)
+def invalidate_scenario_events(sender, instance, using, **kwargs):
+    # Before a delete, while the event's memberships and deltas still exist.
+    # New events belong to no timeline or scenario yet.
+    if not kwargs.get("created"):
+        _invalidate_timelines(_event_timelines(instance, using))
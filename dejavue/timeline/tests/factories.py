@@ -0,0 +1,44 @@
+from collections.abc import Sequence
+from typing import Any
+
+from factory import Faker
+from factory import SubFactory
+from factory import post_generation
+from factory.django import DjangoModelFactory
+
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.timeline.models import ScenarioEventDelta
+from dejavue.timeline.models import Timeline
+from dejavue.timeline.models import WhatIfScenario
+
+
+class TimelineFactory(DjangoModelFactory[Timeline]):
+    name = Faker("sentence", nb_words=3)
+    description = Faker("paragraph")
+
+    @post_generation
+    def events(self, create: bool, extracted: Sequence[Any], **kwargs):  # noqa: FBT001
+        if create and extracted:
+            self.events.add(*extracted)
+
+    class Meta:
+        model = Timeline
+        skip_postgeneration_save = True
+
+
+class WhatIfScenarioFactory(DjangoModelFactory[WhatIfScenario]):
+    name = Faker("sentence", nb_words=3)
+    description = Faker("paragraph")
+    original_timeline = SubFactory(TimelineFactory)
+
+    class Meta:
+        model = WhatIfScenario
+
+
+class ScenarioEventDeltaFactory(DjangoModelFactory[ScenarioEventDelta]):
+    scenario = SubFactory(WhatIfScenarioFactory)
+    event = SubFactory(HistoricalEventFactory)
+    kind = "ADD"
+
+    class Meta:
+        model = ScenarioEventDelta
@@ -0,0 +1,121 @@
+import datetime
+import json
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.timeline.diff import iter_diff
+from dejavue.timeline.tests.factories import ScenarioEventDeltaFactory
+from dejavue.timeline.tests.factories import TimelineFactory
+from dejavue.timeline.tests.factories import WhatIfScenarioFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _event(name, year):
+    start = datetime.date(year, 1, 1)
+    return HistoricalEventFactory(name=name, start_date=start, end_date=start)
+
+
+def _scenario(timeline, added=(), removed=(), overridden=()):
+    scenario = WhatIfScenarioFactory(original_timeline=timeline)
+    for event in added:
+        ScenarioEventDeltaFactory(scenario=scenario, event=event, kind="ADD")
+    for event in removed:
+        ScenarioEventDeltaFactory(scenario=scenario, event=event, kind="REMOVE")
+    for event, start in overridden:
+        ScenarioEventDeltaFactory(
+            scenario=scenario,
+            event=event,
+            kind="OVERRIDE",
+            start_date=start,
+            end_date=start,
+        )
+    return scenario
+
+
+@pytest.fixture
+def scenario():
+    kept = _event("Kept", 1800)
+    removed = _event("Removed", 1810)
+    moved = _event("Moved", 1820)
+    added = _event("Added", 1830)
+    moved_later = _event("Moved", 1840)
+    delayed = _event("Delayed", 1845)
+    timeline = TimelineFactory(events=[kept, removed, moved, delayed])
+    return _scenario(
+        timeline,
+        added=[added, moved_later],
+        removed=[removed, moved],
+        overridden=[(delayed, datetime.date(1850, 1, 1))],
+    )
+
+
+def _summary(records):
+    return [
+        (r["change"], r["name"], r["start_date"], r["original_start_date"])
+        for r in records
+    ]
+
+
+def test_diff(scenario):
+    records = list(iter_diff(scenario, chunk_size=2))
+
+    assert _summary(records) == [
+        ("shared", "Kept", datetime.date(1800, 1, 1), datetime.date(1800, 1, 1)),
+        ("removed", "Removed", None, datetime.date(1810, 1, 1)),
+        ("removed", "Moved", None, datetime.date(1820, 1, 1)),
+        ("added", "Added", datetime.date(1830, 1, 1), None),
+        ("added", "Moved", datetime.date(1840, 1, 1), None),
+        ("changed", "Delayed", datetime.date(1850, 1, 1), datetime.date(1845, 1, 1)),
+    ]
+    delayed = records[-1]
+    assert delayed["id"] == delayed["original_id"]
+
+
+def test_diff_keeps_requested_changes(scenario):
+    records = list(iter_diff(scenario, changes=["added", "changed"]))
+
+    assert [r["change"] for r in records] == ["added", "added", "changed"]
+
+
+def test_events_sharing_a_name_stay_distinct():
+    first, later = _event("Battle", 1700), _event("Battle", 1750)
+    scenario = _scenario(
+        TimelineFactory(events=[first]),
+        added=[later],
+        removed=[first],
+    )
+
+    records = list(iter_diff(scenario))
+
+    assert [(r["change"], r["id"], r["original_id"]) for r in records] == [
+        ("removed", None, first.pk),
+        ("added", later.pk, None),
+    ]
+
+
+class TestDiffApi:
+    def test_streams_ndjson(self, api_client, scenario):
+        url = reverse("api:whatifscenario-diff", kwargs={"pk": scenario.pk})
+
+        response = api_client.get(url, {"change": "shared,changed"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = response.getvalue().decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [(r["change"], r["start_date"]) for r in records] == [
+            ("shared", "1800-01-01"),
+            ("changed", "1850-01-01"),
+        ]
+
+    def test_unknown_change(self, api_client, scenario):
+        url = reverse("api:whatifscenario-diff", kwargs={"pk": scenario.pk})
+
+        response = api_client.get(url, {"change": "renamed"})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
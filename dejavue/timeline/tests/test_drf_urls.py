@@ -0,0 +1,22 @@
+from django.urls import resolve
+from django.urls import reverse
+
+
+def test_scenario_detail():
+    assert reverse("api:whatifscenario-detail", kwargs={"pk": 1}) == "/api/scenarios/1/"
+    assert resolve("/api/scenarios/1/").view_name == "api:whatifscenario-detail"
+
+
+def test_scenario_diff():
+    assert (
+        reverse("api:whatifscenario-diff", kwargs={"pk": 1}) == "/api/scenarios/1/diff/"
+    )
+    assert resolve("/api/scenarios/1/diff/").view_name == "api:whatifscenario-diff"
+
+
+def test_scenario_events():
+    assert (
+        reverse("api:whatifscenario-events", kwargs={"pk": 1})
+        == "/api/scenarios/1/events/"
+    )
+    assert resolve("/api/scenarios/1/events/").view_name == "api:whatifscenario-events"
@@ -0,0 +1,143 @@
+import datetime
+from http import HTTPStatus
+
+import pytest
+from django.urls import reverse
+
+from dejavue.events.tests.factories import HistoricalEventFactory
+from dejavue.timeline.models import ScenarioEventDelta
+from dejavue.timeline.scenarios import resolve
+from dejavue.timeline.scenarios import resolved_events
+from dejavue.timeline.tests.factories import ScenarioEventDeltaFactory
+from dejavue.timeline.tests.factories import TimelineFactory
+from dejavue.timeline.tests.factories import WhatIfScenarioFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _event(year):
+    start = datetime.date(year, 1, 1)
+    return HistoricalEventFactory(start_date=start, end_date=start)
+
+
+@pytest.fixture
+def events():
+    return [_event(year) for year in (1900, 1910, 1920)]
+
+
+@pytest.fixture
+def scenario(events):
+    return WhatIfScenarioFactory(original_timeline=TimelineFactory(events=events))
+
+
+def _ids(resolved):
+    return [event["id"] for event in resolved]
+
+
+def test_new_scenario_stores_nothing(scenario, events):
+    assert not ScenarioEventDelta.objects.exists()
+    assert _ids(resolve(scenario)) == [event.pk for event in events]
+
+
+def test_resolve_applies_deltas(scenario, events, django_assert_num_queries):
+    first, second, third = events
+    added = _event(1905)
+    ScenarioEventDeltaFactory(scenario=scenario, event=added, kind="ADD")
+    ScenarioEventDeltaFactory(scenario=scenario, event=second, kind="REMOVE")
+    ScenarioEventDeltaFactory(
+        scenario=scenario,
+        event=first,
+        kind="OVERRIDE",
+        start_date=datetime.date(1930, 1, 1),
+    )
+
+    with django_assert_num_queries(1):
+        resolved = resolve(scenario)
+
+    assert _ids(resolved) == [added.pk, third.pk, first.pk]
+    assert resolved[-1]["start_date"] == datetime.date(1930, 1, 1)
+    assert resolved[-1]["end_date"] == first.end_date
+    assert [event["overridden"] for event in resolved] == [False, False, True]
+
+
+def test_deltas_bump_the_version(scenario, events):
+    delta = ScenarioEventDeltaFactory(scenario=scenario, event=events[0], kind="REMOVE")
+    delta.delete()
+
+    scenario.refresh_from_db()
+    assert scenario.version == 2  # noqa: PLR2004
+
+
+def test_resolved_events_are_cached_per_version(
+    scenario,
+    events,
+    django_assert_num_queries,
+):
+    resolved_events(scenario)
+    with django_assert_num_queries(0):
+        assert _ids(resolved_events(scenario)) == [event.pk for event in events]
+
+    ScenarioEventDeltaFactory(scenario=scenario, event=events[0], kind="REMOVE")
+    scenario.refresh_from_db()
+
+    assert _ids(resolved_events(scenario)) == [event.pk for event in events[1:]]
+
+
+def test_timeline_changes_invalidate(
+    scenario,
+    events,
+    django_capture_on_commit_callbacks,
+):
+    resolved_events(scenario)
+    later = _event(1950)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        scenario.original_timeline.events.add(later)
+
+    assert _ids(resolved_events(scenario)) == [event.pk for event in [*events, later]]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        events[0].start_date = datetime.date(1960, 1, 1)
+        events[0].save()
+
+    assert _ids(resolved_events(scenario))[-1] == events[0].pk
+
+
+def test_only_involved_events_invalidate(
+    scenario,
+    events,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    added = _event(1905)
+    ScenarioEventDeltaFactory(scenario=scenario, event=added, kind="ADD")
+    scenario.refresh_from_db()
+    resolved_events(scenario)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _event(1930).save()
+    with django_assert_num_queries(0):
+        resolved_events(scenario)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        added.start_date = added.end_date = datetime.date(1915, 1, 1)
+        added.save()
+    assert _ids(resolved_events(scenario))[2] == added.pk
+
+    with django_capture_on_commit_callbacks(execute=True):
+        events[0].delete()
+    assert _ids(resolved_events(scenario)) == [events[1].pk, added.pk, events[2].pk]
+
+
+def test_events_endpoint(api_client, scenario, events):
+    ScenarioEventDeltaFactory(scenario=scenario, event=events[1], kind="REMOVE")
+
+    response = api_client.get(
+        reverse("api:whatifscenario-events", kwargs={"pk": scenario.pk}),
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [event["id"] for event in response.json()] == [
+        events[0].pk,
+        events[2].pk,
+    ]